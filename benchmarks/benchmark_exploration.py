@@ -0,0 +1,296 @@
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from blockchain_exploration import VERSION
+from blockchain_exploration.amounts import format_amount, format_amounts
+from blockchain_exploration.exploration import (
+    get_base_path,
+    get_explorer_url_for_account,
+    get_explorer_url_for_nft_contract,
+    get_explorer_url_for_token,
+    get_explorer_url_for_token_wallet,
+    get_explorer_url_for_transaction,
+    get_network_by_token_type,
+    get_token_type_by_network,
+    get_validated_url,
+    validated_url,
+)
+from blockchain_exploration.parsing import parse_explorer_url
+from blockchain_exploration.rendering import MARKDOWN, render_explorer_links
+from blockchain_exploration.types import Network
+from blockchain_exploration.vectorized import build_token_urls, np
+
+# Offline micro-benchmarks for building explorer URLs. Run from the repository root:
+#   python -m benchmarks.benchmark_exploration --output results.json
+#   python -m benchmarks.benchmark_exploration --compare results.json --threshold 0.15
+# Comparing fails (exit status 1) when any case's throughput dropped by more than the threshold.
+
+# Explorers other than the default for each network, including test networks
+ALTERNATE_BASE_PATHS = {
+    Network.BITCOIN_CASH: ["https://blockchair.com/bitcoin-cash"],
+    Network.ETHEREUM: ["https://opensea.io", "https://sepolia.etherscan.io"],
+    Network.MATIC: ["https://opensea.io", "https://amoy.polygonscan.com"],
+    Network.TEZOS: ["https://better-call.dev/mainnet", "https://ghostnet.tzkt.io"],
+    Network.SUI: ["https://suiscan.xyz/testnet"],
+    Network.TON: ["https://testnet.tonscan.org"],
+}
+
+# (account, contract, token ID, transaction hash)
+SAMPLE_IDENTIFIERS = {
+    Network.BITCOIN_CASH: (
+        "simpleledger:qrgydxn0xnta6k4lkc4xmrltz4ghvlz7tq33dez6nv",
+        "62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63",
+        "1",
+        "62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63",
+    ),
+    Network.ETHEREUM: (
+        "0xf8e6480aaed82328e837172d4fb450826ec547cf",
+        "0xC4df6018F90f91baD7e24f89279305715B3A276F",
+        "1288",
+        "0x6f13920eba73100469511a0df990c811ee89fd15fb5b3c95ec40f4d991fc90d4",
+    ),
+    Network.MATIC: (
+        "0x3AFac8309C2a93406c326dbb9Ab2578F3ed165d9",
+        "0x3011810abfec25777a01d5fbef08b2ad12860460",
+        "3191",
+        "0xd3d4de1612017d7e8c69c70879ab4ba3b2f4e2c638f05b5d13b2c417e46f5be2",
+    ),
+    Network.TEZOS: (
+        "tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg",
+        "KT1PEGqt5rMmHpyaMXc8RFTFkkAUDrzSFRWk",
+        "1",
+        "ookXoN2hrQ8aPU9yGsE7N5Q65mLXtTCjtYR4nmWUYq73od7mSrx",
+    ),
+    Network.SUI: (
+        "0x02a212de6a9dfa3a69e22387acfbafbb1a9e591bd9d636e7895dcfc8de05f331",
+        "0x57191e5e5c41166b90a4b7811ad3ec7963708aa537a8438c1761a5d33e2155fd",
+        "0x5d3a7c2b3b8cd5d0f3ea2b3c8fb6c2a4d8e2b4f7a9c1e3d5b7a9c1e3d5b7a9c1",
+        "9KLQbPaCE9eZq4NRBN4aqC1QVXu9eJAk8yYYFVgX7dkZ",
+    ),
+    Network.TON: (
+        "EQCxE6mUtQJKFnGfaROTKOt1lZbDiiX1kCixRv7Nw2Id_sDs",
+        "EQDYUzNXOkaKpLBqLjEo0RGyzMbkbRXaa6e6mRqtgxtqhVs1",
+        "1",
+        "f36e8a6a5d2a2c0b6e8f1c3b2a4d6e8f0a1b2c3d4e5f60718293a4b5c6d7e8f9",
+    ),
+}
+DEFAULT_IDENTIFIERS = ("account", "contract", "1", "transaction")
+
+
+def get_networks() -> List[str]:
+    return [value for name, value in vars(Network).items() if not name.startswith("_")]
+
+
+def iter_cases() -> Iterator[Tuple[str, Callable[[], object]]]:
+    for network in get_networks():
+        account, contract, token_id, transaction_hash = SAMPLE_IDENTIFIERS.get(
+            network, DEFAULT_IDENTIFIERS
+        )
+        # Everything the lambdas use from the loop is bound as a default, as they're only called once it has moved on
+        yield f"get_base_path[{network}]", lambda network=network: get_base_path(
+            network
+        )
+        yield f"get_token_type_by_network[{network}]", (
+            lambda network=network: get_token_type_by_network(network)
+        )
+        for base_path in [None] + ALTERNATE_BASE_PATHS.get(network, []):
+            label = f"{network}|{base_path or 'default'}"
+            yield f"get_explorer_url_for_account[{label}]", (
+                lambda network=network, account=account, base_path=base_path: (
+                    get_explorer_url_for_account(network, account, base_path=base_path)
+                )
+            )
+            yield f"get_explorer_url_for_token_wallet[{label}]", (
+                lambda network=network, account=account, base_path=base_path: (
+                    get_explorer_url_for_token_wallet(
+                        network, account, base_path=base_path
+                    )
+                )
+            )
+            yield f"get_explorer_url_for_nft_contract[{label}]", (
+                lambda network=network, contract=contract, base_path=base_path: (
+                    get_explorer_url_for_nft_contract(
+                        network, contract, base_path=base_path
+                    )
+                )
+            )
+            yield f"get_explorer_url_for_token[{label}]", (
+                lambda network=network, contract=contract, token_id=token_id, base_path=base_path: (
+                    get_explorer_url_for_token(
+                        network, contract, token_id, base_path=base_path
+                    )
+                )
+            )
+            yield f"get_explorer_url_for_transaction[{label}]", (
+                lambda network=network, transaction_hash=transaction_hash, base_path=base_path: (
+                    get_explorer_url_for_transaction(
+                        network, transaction_hash, base_path=base_path
+                    )
+                )
+            )
+    for token_type in (
+        "slp",
+        "erc721-eth",
+        "erc721-matic",
+        "tezos",
+        "sui",
+        "ton",
+        "scor",
+    ):
+        yield f"get_network_by_token_type[{token_type}]", (
+            lambda token_type=token_type: get_network_by_token_type(token_type)
+        )
+    url = "https://etherscan.io/address/0xf8e6480aaed82328e837172d4fb450826ec547cf"
+    yield "get_validated_url", lambda: get_validated_url(url)
+    hashes = [f"0x{index:064x}" for index in range(1000)]
+    for format in ("html", MARKDOWN):
+        yield f"render_explorer_links[{format}|1000]", (
+            lambda format=format: render_explorer_links(
+                Network.ETHEREUM, "transaction", hashes, format=format, label="ether"
+            )
+        )
+    if np is not None:
+        # Whole columns against the same rows built one at a time
+        networks = np.array([Network.ETHEREUM, Network.MATIC, Network.TEZOS] * 334)[
+            :1000
+        ]
+        contracts = np.array([f"0x{index:040x}" for index in range(1000)])
+        token_ids = np.arange(1000).astype(str)
+        rows = list(zip(networks.tolist(), contracts.tolist(), token_ids.tolist()))
+        yield "build_token_urls[1000]", lambda: build_token_urls(
+            networks, contracts, token_ids
+        )
+        yield "get_explorer_url_for_token[1000]", lambda: [
+            get_explorer_url_for_token(*row) for row in rows
+        ]
+    # Wei amounts from a transaction history, as a whole and one at a time
+    amounts = [index * 123_456_789_012_345 for index in range(1000)]
+    yield "format_amounts[1000]", lambda: format_amounts(
+        amounts, Network.ETHEREUM, precision=6
+    )
+    yield "format_amount[1000]", lambda: [
+        format_amount(amount, Network.ETHEREUM, precision=6) for amount in amounts
+    ]
+    yield "parse_explorer_url[account]", lambda: parse_explorer_url(url)
+    token_url = "https://polygonscan.com/token/0x3011810abfec25777a01d5fbef08b2ad12860460/?a=3191"
+    yield "parse_explorer_url[token]", lambda: parse_explorer_url(token_url)
+    # The cost of the decorator itself, compared with calling `unvalidated` directly
+    unvalidated = lambda: url
+    validated = validated_url(unvalidated)
+    yield "validated_url[unwrapped]", unvalidated
+    yield "validated_url[wrapped]", validated
+
+
+def measure(function: Callable[[], object], repeat: int, min_time: float) -> Dict:
+    timer = timeit.Timer(function)
+    # Calibrate the number of calls so each timing run takes about `min_time` seconds
+    number = 10
+    while True:
+        elapsed = timer.timeit(number=number)
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * min_time / elapsed))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    # Memory allocated while making one call, including whatever is freed again before it returns
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Memory blocks still held after a batch of calls, eg the URLs themselves
+    results = [None] * 100
+    blocks_before = sys.getallocatedblocks()
+    for index in range(100):
+        results[index] = function()
+    allocated_blocks = (sys.getallocatedblocks() - blocks_before) / 100
+    return {
+        "ops_per_sec": number / best,
+        "ns_per_op": best / number * 1e9,
+        "peak_bytes_per_call": peak - before,
+        "allocated_blocks_per_call": allocated_blocks,
+    }
+
+
+def run(repeat: int = 5, min_time: float = 0.2, match: Optional[str] = None) -> Dict:
+    results = {}
+    for name, function in iter_cases():
+        if match and match not in name:
+            continue
+        try:
+            function()
+        except NotImplementedError as error:
+            # eg OpenSea doesn't link to transactions
+            results[name] = {"unsupported": str(error)}
+            continue
+        results[name] = measure(function, repeat=repeat, min_time=min_time)
+    return {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if not previous or "ops_per_sec" not in previous or "ops_per_sec" not in result:
+            continue
+        change = result["ops_per_sec"] / previous["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions.append(
+                f"{name}: {previous['ops_per_sec']:,.0f} -> {result['ops_per_sec']:,.0f} ops/sec ({change:+.1%})"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.benchmark_exploration",
+        description="Benchmark building explorer URLs, without any network access",
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare with the results in this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="The largest acceptable fractional drop in ops/sec when comparing",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Roughly how many seconds each timing run should take",
+    )
+    parser.add_argument("--match", help="Only run cases whose name contains this")
+    args = parser.parse_args(argv)
+    current = run(repeat=args.repeat, min_time=args.min_time, match=args.match)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(current, output, indent=2, sort_keys=True)
+    else:
+        json.dump(current, sys.stdout, indent=2, sort_keys=True)
+        print()
+    if args.compare:
+        with open(args.compare) as input:
+            baseline = json.load(input)
+        regressions = compare(baseline, current, threshold=args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
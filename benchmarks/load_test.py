@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from typing import List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# Load test for the link service, reporting requests per second and latency percentiles. By default it starts a
+# server on a free local port in a separate process, so the client and server don't share an interpreter:
+#   python -m benchmarks.load_test --connections 32 --duration 5
+#   python -m benchmarks.load_test --url http://127.0.0.1:8080 --batch 100
+# Each connection is kept alive and sends one request at a time: redirects, or with --batch, batches of that many URLs.
+
+CONTRACT = "0x3011810abfec25777a01d5fbef08b2ad12860460"
+
+
+def get_free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(port: int, concurrency: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "blockchain_exploration.serve",
+            "--port",
+            str(port),
+            "--concurrency",
+            str(concurrency),
+        ],
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("The link service didn't start")
+
+
+def build_request(host: str, batch: int, index: int) -> bytes:
+    if not batch:
+        return (
+            f"GET /go/matic/token/{CONTRACT}/{index} HTTP/1.1\r\nHost: {host}\r\n\r\n"
+        ).encode()
+    body = json.dumps(
+        [
+            {
+                "network": "matic",
+                "kind": "token",
+                "identifier": CONTRACT,
+                "token_id": str(index * batch + offset),
+            }
+            for offset in range(batch)
+        ]
+    ).encode()
+    return (
+        f"POST /links HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+async def run_connection(
+    host: str, port: int, batch: int, deadline: float, latencies: List[float]
+) -> int:
+    # Returns the number of failed requests
+    reader, writer = await asyncio.open_connection(host, port)
+    failures = 0
+    index = 0
+    try:
+        while time.perf_counter() < deadline:
+            # Varies the token ID, so that nothing along the way can serve a cached response
+            request = build_request(host, batch, index)
+            index += 1
+            started = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            status = int(head.split(b" ", 2)[1])
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if status >= 400:
+                failures += 1
+    finally:
+        writer.close()
+    return failures
+
+
+async def run(
+    host: str, port: int, connections: int, duration: float, batch: int
+) -> Tuple[List[float], int, float]:
+    latencies: List[float] = []
+    started = time.perf_counter()
+    failures = await asyncio.gather(
+        *(
+            run_connection(host, port, batch, started + duration, latencies)
+            for _ in range(connections)
+        )
+    )
+    return latencies, sum(failures), time.perf_counter() - started
+
+
+def get_percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * percentile / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test")
+    parser.add_argument(
+        "--url", help="Of a running link service, rather than starting one"
+    )
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds")
+    parser.add_argument(
+        "--batch", type=int, default=0, help="URLs per batch request; 0 for redirects"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=64, help="Of the server this starts"
+    )
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+    process = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", get_free_port()
+        process = start_server(port, args.concurrency)
+    try:
+        latencies, failures, elapsed = asyncio.run(
+            run(host, port, args.connections, args.duration, args.batch)
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    latencies.sort()
+    results = {
+        "requests": len(latencies),
+        "failures": failures,
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "urls_per_sec": round(len(latencies) * max(args.batch, 1) / elapsed, 1),
+        "p50_ms": round(get_percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(get_percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+        "connections": args.connections,
+        "batch": args.batch,
+    }
+    for name, value in results.items():
+        print(f"{name:>18}  {value}")
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+import operator
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+from .chains import EVM_CHAINS
+from .currencies import NETWORK_CURRENCIES, CryptoCurrency
+
+# Renders raw on-chain amounts, in the currency's smallest unit, for display:
+#   format_amount(1_234_567_800_000_000_000_000, Network.ETHEREUM)  -> "1,234.5678 ETH"
+#   format_amount(1_500_000, Network.TEZOS, precision=2, label=DISPLAY_TEXT)  -> "1.5 ꜩ"
+# Only integer arithmetic is used, so amounts are exact however large. Formats are compiled once per currency and
+# options, so formatting an amount is a division and some slicing.
+
+# What follows the number
+SYMBOL = "symbol"
+DISPLAY_TEXT = "display_text"
+
+Amount = Union[int, str]
+
+
+def _to_integer(amount: Amount) -> int:
+    # Only exact amounts are accepted: integers, including NumPy's, or strings of digits, eg wei from JSON. Floats can't
+    # hold most amounts exactly, and booleans are a mistake.
+    if amount.__class__ is str:
+        digits = amount[1:] if amount.startswith("-") else amount
+        if not (digits.isascii() and digits.isdigit()):
+            raise ValueError(f"Amounts must be whole numbers of units: {amount!r}")
+        return int(amount)
+    if isinstance(amount, bool):
+        raise TypeError(f"Amounts must be integers or strings of digits: {amount!r}")
+    try:
+        return operator.index(amount)
+    except TypeError:
+        raise TypeError(
+            f"Amounts must be integers or strings of digits: {amount!r}"
+        ) from None
+
+
+def get_currency(network: str, code: Optional[str] = None) -> CryptoCurrency:
+    # The network's native currency, unless another is named
+    currencies = NETWORK_CURRENCIES.get(network)
+    if currencies is None:
+        chain = EVM_CHAINS.get_by_network(network)
+        if chain is None:
+            raise NotImplementedError(f"No currencies known for {network}")
+        # Registered at runtime
+        currencies = {
+            chain.currency.code: {**chain.currency._asdict(), "native_token": True}
+        }
+    if code is None:
+        for currency in currencies.values():
+            if currency["native_token"]:
+                return currency
+        raise NotImplementedError(f"No native currency known for {network}")
+    try:
+        return currencies[code]
+    except KeyError:
+        raise NotImplementedError(f"No currency {code} known for {network}")
+
+
+class AmountFormat(NamedTuple):
+    # Amounts are rounded to `scale` raw units, ie 10 ** (decimals - precision), and the digits of the result are split
+    # at `precision`
+    scale: int
+    precision: int
+    trim_zeros: bool = True
+    thousands_separator: Optional[str] = ","
+    decimal_separator: str = "."
+    suffix: str = ""
+
+    def format(self, amount: Amount) -> str:
+        if amount.__class__ is not int:
+            amount = _to_integer(amount)
+        # Slicing the digits is several times faster than `format(units, ",")`, whose grouping is slow
+        if amount < 0:
+            units = (self.scale // 2 - amount) // self.scale
+            # Amounts that round to zero aren't negative
+            sign = "-" if units else ""
+        else:
+            units = (amount + self.scale // 2) // self.scale
+            sign = ""
+        digits = str(units)
+        precision = self.precision
+        if precision:
+            if len(digits) <= precision:
+                digits = digits.zfill(precision + 1)
+            whole = digits[:-precision]
+            fraction = digits[-precision:]
+            if self.trim_zeros:
+                fraction = fraction.rstrip("0")
+        else:
+            whole = digits
+            fraction = ""
+        if len(whole) > 3 and self.thousands_separator is not None:
+            whole = _group_digits(whole, self.thousands_separator)
+        if fraction:
+            return sign + whole + self.decimal_separator + fraction + self.suffix
+        return sign + whole + self.suffix
+
+    def format_all(self, amounts: Iterable[Amount]) -> List[str]:
+        # The same as `format()` for each amount, but a step at a time over the whole list, which is faster than
+        # formatting one amount after another
+        amounts = [
+            amount if amount.__class__ is int else _to_integer(amount)
+            for amount in amounts
+        ]
+        if amounts and min(amounts) < 0:
+            return [self.format(amount) for amount in amounts]
+        scale = self.scale
+        half = scale // 2
+        precision = self.precision
+        if precision:
+            digits = [
+                str((amount + half) // scale).zfill(precision + 1) for amount in amounts
+            ]
+            wholes = [number[:-precision] for number in digits]
+            fractions = [number[-precision:] for number in digits]
+            if self.trim_zeros:
+                fractions = [fraction.rstrip("0") for fraction in fractions]
+        else:
+            wholes = [str((amount + half) // scale) for amount in amounts]
+            fractions = [""] * len(wholes)
+        separator = self.thousands_separator
+        if separator is not None:
+            wholes = [
+                whole if len(whole) <= 3 else _group_digits(whole, separator)
+                for whole in wholes
+            ]
+        point = self.decimal_separator
+        suffix = self.suffix
+        return [
+            whole + point + fraction + suffix if fraction else whole + suffix
+            for whole, fraction in zip(wholes, fractions)
+        ]
+
+
+def _group_digits(digits: str, separator: str) -> str:
+    head = len(digits) % 3 or 3
+    return separator.join(
+        [digits[:head], *(digits[i : i + 3] for i in range(head, len(digits), 3))]
+    )
+
+
+@lru_cache(maxsize=256)
+def compile_amount_format(
+    network: str,
+    code: Optional[str] = None,
+    precision: Optional[int] = None,
+    trim_zeros: bool = True,
+    thousands_separator: Optional[str] = ",",
+    decimal_separator: str = ".",
+    label: Optional[str] = SYMBOL,
+) -> AmountFormat:
+    # `precision` is the most digits to show after the point, by default all the currency has. Rounding is half away
+    # from zero.
+    currency = get_currency(network, code)
+    decimals = currency["decimals"]
+    if precision is None or precision > decimals:
+        precision = decimals
+    elif precision < 0:
+        raise ValueError(f"Amounts can't be shown to {precision} decimal places")
+    if label not in (None, SYMBOL, DISPLAY_TEXT):
+        raise ValueError(f"Unknown amount label: {label}")
+    return AmountFormat(
+        scale=10 ** (decimals - precision),
+        precision=precision,
+        trim_zeros=trim_zeros,
+        thousands_separator=thousands_separator,
+        decimal_separator=decimal_separator,
+        suffix=f" {currency[label]}" if label else "",
+    )
+
+
+def format_amount(
+    amount: Amount,
+    network: str,
+    code: Optional[str] = None,
+    precision: Optional[int] = None,
+    trim_zeros: bool = True,
+    thousands_separator: Optional[str] = ",",
+    decimal_separator: str = ".",
+    label: Optional[str] = SYMBOL,
+) -> str:
+    return compile_amount_format(
+        network,
+        code,
+        precision,
+        trim_zeros,
+        thousands_separator,
+        decimal_separator,
+        label,
+    ).format(amount)
+
+
+def format_amounts(
+    amounts: Iterable[Amount],
+    network: str,
+    code: Optional[str] = None,
+    precision: Optional[int] = None,
+    trim_zeros: bool = True,
+    thousands_separator: Optional[str] = ",",
+    decimal_separator: str = ".",
+    label: Optional[str] = SYMBOL,
+) -> List[str]:
+    # Batch variant, eg for a whole transaction history, in input order
+    return compile_amount_format(
+        network,
+        code,
+        precision,
+        trim_zeros,
+        thousands_separator,
+        decimal_separator,
+        label,
+    ).format_all(amounts)
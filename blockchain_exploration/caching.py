@@ -0,0 +1,126 @@
+import threading
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+from .config import get_default_config, set_default_config
+from .templates import CompiledTemplate
+
+# An opt-in, bounded cache of built URLs, for traffic that keeps asking for the same few contracts and wallets:
+#   cache = enable_url_cache(maxsize=100_000)
+#   ...
+#   cache.stats().hit_rate
+# Entries are keyed by the compiled template, which embeds the resolved base path and the config's options, and the
+# identifiers. So a URL is never served for a base path, option or template registration other than the one it was
+# built for: after the config changes, stale entries simply stop matching and are evicted as the cache fills up.
+# Only URLs are cached; exceptions, eg for invalid identifiers or unsupported networks, are raised every time.
+
+DEFAULT_MAXSIZE = 65536
+
+
+class UrlCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class UrlCache:
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError(f"The URL cache must hold at least one URL: {maxsize}")
+        self.maxsize = maxsize
+        # `lru_cache` is thread safe, evicts the least recently used entry, and doesn't cache exceptions. It's typed, so
+        # that eg the token IDs 1 and True don't share an entry.
+        self._cached_build = lru_cache(maxsize=maxsize, typed=True)(self._build)
+        self._templates: Dict[CompiledTemplate, "CachedTemplate"] = {}
+        # Entries are keyed by a number per template, which is cheaper to hash than the template itself
+        self._templates_by_number: List[CompiledTemplate] = []
+        self._lock = threading.Lock()
+        # Misses whose build raised, and so added no entry
+        self._failures = 0
+
+    def wrap(self, template: CompiledTemplate) -> "CachedTemplate":
+        cached = self._templates.get(template)
+        if cached is None:
+            with self._lock:
+                cached = self._templates.get(template)
+                if cached is None:
+                    cached = CachedTemplate(
+                        self, template, len(self._templates_by_number)
+                    )
+                    self._templates_by_number.append(template)
+                    self._templates[template] = cached
+        return cached
+
+    def _build(self, number: int, identifier, token_id) -> Optional[str]:
+        return self._templates_by_number[number].build(identifier, token_id)
+
+    def build(self, number: int, identifier, token_id=None) -> Optional[str]:
+        try:
+            return self._cached_build(number, identifier, token_id)
+        except TypeError:
+            # Unhashable identifiers can't be cached, but `build()` might still make sense of them. They fail before
+            # the lookup is counted.
+            if identifier.__hash__ is not None and token_id.__hash__ is not None:
+                self._count_failure()
+                raise
+            return self._templates_by_number[number].build(identifier, token_id)
+        except Exception:
+            self._count_failure()
+            raise
+
+    def _count_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+
+    def stats(self) -> UrlCacheStats:
+        info = self._cached_build.cache_info()
+        return UrlCacheStats(
+            hits=info.hits,
+            misses=info.misses,
+            # Every miss that didn't fail adds an entry, so any that are gone were evicted
+            evictions=info.misses - self._failures - info.currsize,
+            size=info.currsize,
+            maxsize=self.maxsize,
+        )
+
+    def clear(self) -> None:
+        # Also resets the statistics. Templates keep their numbers, as `CachedTemplate`s may still be in use.
+        with self._lock:
+            self._cached_build.cache_clear()
+            self._failures = 0
+
+
+class CachedTemplate:
+    # Stands in for a `CompiledTemplate`, looking URLs up in the cache before building them
+    __slots__ = ("template", "_cache", "_number")
+
+    def __init__(self, cache: UrlCache, template: CompiledTemplate, number: int):
+        self.template = template
+        self._cache = cache
+        self._number = number
+
+    def __getattr__(self, name: str):
+        return getattr(self.template, name)
+
+    def build(self, identifier: Optional[str], token_id=None) -> Optional[str]:
+        return self._cache.build(self._number, identifier, token_id)
+
+
+def enable_url_cache(
+    url_cache: Optional[UrlCache] = None, maxsize: int = DEFAULT_MAXSIZE
+) -> UrlCache:
+    # Caches every URL built with the default config
+    url_cache = url_cache or UrlCache(maxsize)
+    set_default_config(get_default_config()._replace(url_cache=url_cache))
+    return url_cache
+
+
+def disable_url_cache() -> None:
+    set_default_config(get_default_config()._replace(url_cache=None))
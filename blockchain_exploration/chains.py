@@ -0,0 +1,115 @@
+import json
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# EVM chains share their explorers' URL layouts, so supporting another one, mainnet or testnet, is a matter of data
+# rather than code. The bundled chains are read from data/evm_chains.json when this module is imported.
+EVM_CHAINS_PATH = os.path.join(os.path.dirname(__file__), "data", "evm_chains.json")
+
+
+class EvmCurrency(NamedTuple):
+    code: str
+    symbol: str
+    display_text: str
+    # Of the smallest unit, eg wei
+    decimals: int = 18
+
+
+class EvmChain(NamedTuple):
+    chain_id: int  # https://eips.ethereum.org/EIPS/eip-155
+    network: str
+    base_path: str
+    token_type: str
+    currency: EvmCurrency
+    # That can override the explorer, in order of precedence
+    environment_variables: Tuple[str, ...] = ()
+    testnet: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "EvmChain":
+        return cls(
+            chain_id=int(data["chain_id"]),
+            network=data["network"],
+            base_path=data["base_path"].rstrip("/"),
+            token_type=data["token_type"],
+            currency=EvmCurrency(**data["currency"]),
+            environment_variables=tuple(data.get("environment_variables", ())),
+            testnet=bool(data.get("testnet", False)),
+        )
+
+
+def load_evm_chains(path: str = EVM_CHAINS_PATH) -> List[EvmChain]:
+    with open(path, encoding="utf-8") as input:
+        return [EvmChain.from_dict(data) for data in json.load(input)]
+
+
+class EvmChainRegistry:
+    # Chains indexed by chain ID, network and token type, so each lookup is a single dictionary access
+    def __init__(self, chains: Iterable[EvmChain] = ()):
+        self._by_chain_id: Dict[int, EvmChain] = {}
+        self._by_network: Dict[str, EvmChain] = {}
+        self._by_token_type: Dict[str, EvmChain] = {}
+        self._lock = threading.Lock()
+        for chain in chains:
+            self.register(chain)
+
+    def register(self, chain: EvmChain) -> None:
+        # Re-registering a chain replaces it, but a chain ID, network or token type can't be claimed by two chains
+        with self._lock:
+            for index, key in [
+                (self._by_chain_id, chain.chain_id),
+                (self._by_network, chain.network),
+                (self._by_token_type, chain.token_type),
+            ]:
+                existing = index.get(key)
+                if existing is not None and existing.network != chain.network:
+                    raise ValueError(
+                        f"{key} is already registered for the {existing.network} chain"
+                    )
+            previous = self._by_network.get(chain.network)
+            if previous is not None:
+                self._by_chain_id.pop(previous.chain_id, None)
+                self._by_token_type.pop(previous.token_type, None)
+            self._by_chain_id[chain.chain_id] = chain
+            self._by_network[chain.network] = chain
+            self._by_token_type[chain.token_type] = chain
+
+    def __contains__(self, network: object) -> bool:
+        return network in self._by_network
+
+    def __iter__(self) -> Iterator[EvmChain]:
+        return iter(list(self._by_network.values()))
+
+    def __len__(self) -> int:
+        return len(self._by_network)
+
+    def get_by_chain_id(self, chain_id: int) -> Optional[EvmChain]:
+        return self._by_chain_id.get(chain_id)
+
+    def get_by_network(self, network: str) -> Optional[EvmChain]:
+        return self._by_network.get(network)
+
+    def get_by_token_type(self, token_type: str) -> Optional[EvmChain]:
+        return self._by_token_type.get(token_type)
+
+
+EVM_CHAINS = EvmChainRegistry(load_evm_chains())
+
+
+def get_evm_chain_by_id(chain_id: int) -> EvmChain:
+    chain = EVM_CHAINS.get_by_chain_id(chain_id)
+    if chain is None:
+        raise NotImplementedError(f"No EVM chain known with ID {chain_id}")
+    return chain
+
+
+def get_evm_chain_by_network(network: str) -> EvmChain:
+    chain = EVM_CHAINS.get_by_network(network)
+    if chain is None:
+        raise NotImplementedError(f"{network} is not a known EVM chain")
+    return chain
+
+
+def get_network_by_chain_id(chain_id: int) -> str:
+    return get_evm_chain_by_id(chain_id).network
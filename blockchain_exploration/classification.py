@@ -0,0 +1,298 @@
+import base64
+import hashlib
+from functools import lru_cache
+from string import hexdigits, whitespace
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .chains import EVM_CHAINS
+from .evm import to_checksum_address
+from .templates import FLAVOUR_MATCHERS, LINK_TEMPLATES, LinkTemplate
+from .types import ExplorerFlavour, LinkKind, Network
+
+# Guesses which networks, and which kinds of link, an identifier could be for, from its prefix, length and alphabet:
+#   classify_identifier("tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg")
+#   -> (Candidate(network="tezos", kind="account"), Candidate(network="tezos", kind="token-wallet"))
+# Some shapes are shared, eg 0x and 40 hex digits is an address on every EVM chain, so there may be several candidates.
+# With `strict=True`, checksums are verified too (EIP-55 mixed case, CashAddr, Tezos base58check and TON's CRC16), so
+# that a mistyped identifier has no candidates, rather than turning into a dead link.
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+CASHADDR_ALPHABET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+BASE64URL_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+# Stands for every EVM chain in the registry, looked up when classifying, so chains registered later are included
+EVM = "evm"
+
+
+class Candidate(NamedTuple):
+    network: str
+    kind: str
+
+
+class IdentifierRule(NamedTuple):
+    prefix: str
+    # Lengths of the whole identifier, including the prefix
+    lengths: Tuple[int, ...]
+    # Characters allowed after the prefix
+    alphabet: frozenset
+    network: str  # Or EVM
+    kinds: Tuple[str, ...]
+    # Verifies the whole identifier's checksum, for strict classification
+    check: Optional[Callable[[str], bool]] = None
+
+
+def _decode_base58(encoded: str) -> bytes:
+    number = 0
+    for character in encoded:
+        number = number * 58 + BASE58_ALPHABET.index(character)
+    leading_zeros = len(encoded) - len(encoded.lstrip("1"))
+    return b"\x00" * leading_zeros + number.to_bytes(
+        (number.bit_length() + 7) // 8, "big"
+    )
+
+
+def is_valid_base58check(encoded: str) -> bool:
+    # Tezos addresses and operation hashes: the payload followed by the first 4 bytes of its double SHA-256
+    decoded = _decode_base58(encoded)
+    payload, checksum = decoded[:-4], decoded[-4:]
+    return hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] == checksum
+
+
+def _is_valid_sui_digest(encoded: str) -> bool:
+    return len(_decode_base58(encoded)) == 32
+
+
+# https://github.com/bitcoincashorg/bitcoincash.org/blob/master/spec/cashaddr.md
+_CASHADDR_GENERATORS = (
+    0x98F2BC8E61,
+    0x79B76D99E2,
+    0xF33E5FB3C4,
+    0xAE2EABE2A8,
+    0x1E4F43E470,
+)
+
+
+def is_valid_cashaddr(address: str) -> bool:
+    prefix, _, payload = address.lower().partition(":")
+    checksum = 1
+    for value in [
+        *(ord(character) & 0x1F for character in prefix),
+        0,
+        *(CASHADDR_ALPHABET.index(character) for character in payload),
+    ]:
+        top = checksum >> 35
+        checksum = ((checksum & 0x07FFFFFFFF) << 5) ^ value
+        for bit, generator in enumerate(_CASHADDR_GENERATORS):
+            if top >> bit & 1:
+                checksum ^= generator
+    return checksum == 1
+
+
+def _crc16_xmodem(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = (crc << 1 ^ 0x1021 if crc & 0x8000 else crc << 1) & 0xFFFF
+    return crc
+
+
+def is_valid_ton_address(address: str) -> bool:
+    # User-friendly form: flags, workchain, 32 byte account ID and a CRC16 of them, in URL-safe base64
+    decoded = base64.urlsafe_b64decode(address)
+    return _crc16_xmodem(decoded[:34]) == int.from_bytes(decoded[34:], "big")
+
+
+def _is_valid_evm_address(address: str) -> bool:
+    # Addresses in a single case carry no checksum; mixed case ones must be EIP-55 checksummed
+    hex_address = address[2:]
+    if hex_address.islower() or hex_address.isupper() or hex_address.isdigit():
+        return True
+    return to_checksum_address(address) == address
+
+
+HEX = frozenset(hexdigits)
+BASE58 = frozenset(BASE58_ALPHABET)
+
+IDENTIFIER_RULES: List[IdentifierRule] = [
+    IdentifierRule(
+        "0x",
+        (42,),
+        HEX,
+        EVM,
+        (LinkKind.ACCOUNT, LinkKind.NFT_CONTRACT),
+        _is_valid_evm_address,
+    ),
+    # EVM transaction hashes, and Sui addresses and objects, which look alike
+    IdentifierRule("0x", (66,), HEX, EVM, (LinkKind.TRANSACTION,)),
+    IdentifierRule(
+        "0x", (66,), HEX, Network.SUI, (LinkKind.ACCOUNT, LinkKind.NFT_CONTRACT)
+    ),
+    # Transaction hashes, which on Bitcoin Cash also identify SLP tokens by their genesis transaction
+    IdentifierRule(
+        "",
+        (64,),
+        HEX,
+        Network.BITCOIN_CASH,
+        (LinkKind.TRANSACTION, LinkKind.NFT_CONTRACT),
+    ),
+    IdentifierRule("", (64,), HEX, Network.TON, (LinkKind.TRANSACTION,)),
+    # Sui transaction digests, 32 bytes in base58
+    IdentifierRule(
+        "", (43, 44), BASE58, Network.SUI, (LinkKind.TRANSACTION,), _is_valid_sui_digest
+    ),
+    *(
+        IdentifierRule(
+            prefix,
+            (len(prefix) + 42,),
+            frozenset(CASHADDR_ALPHABET),
+            Network.BITCOIN_CASH,
+            (LinkKind.ACCOUNT, LinkKind.TOKEN_WALLET),
+            is_valid_cashaddr,
+        )
+        for prefix in ("simpleledger:", "bitcoincash:")
+    ),
+    *(
+        IdentifierRule(
+            prefix,
+            (36,),
+            BASE58,
+            Network.TEZOS,
+            (LinkKind.ACCOUNT, LinkKind.TOKEN_WALLET),
+            is_valid_base58check,
+        )
+        for prefix in ("tz1", "tz2", "tz3")
+    ),
+    IdentifierRule(
+        "KT1",
+        (36,),
+        BASE58,
+        Network.TEZOS,
+        (LinkKind.NFT_CONTRACT, LinkKind.ACCOUNT),
+        is_valid_base58check,
+    ),
+    IdentifierRule(
+        "o", (51,), BASE58, Network.TEZOS, (LinkKind.TRANSACTION,), is_valid_base58check
+    ),
+    # Bounceable and non-bounceable forms of the same TON address
+    *(
+        IdentifierRule(
+            prefix,
+            (48,),
+            frozenset(BASE64URL_ALPHABET),
+            Network.TON,
+            (LinkKind.ACCOUNT, LinkKind.TOKEN_WALLET, LinkKind.NFT_CONTRACT),
+            is_valid_ton_address,
+        )
+        for prefix in ("EQ", "UQ")
+    ),
+]
+
+
+class _TrieNode:
+    __slots__ = ("children", "rules")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.rules: List[IdentifierRule] = []
+
+
+def _build_trie(rules: Iterable[IdentifierRule]) -> _TrieNode:
+    root = _TrieNode()
+    for rule in rules:
+        node = root
+        for character in rule.prefix:
+            node = node.children.setdefault(character, _TrieNode())
+        node.rules.append(rule)
+    return root
+
+
+_trie = _build_trie(IDENTIFIER_RULES)
+
+
+def register_identifier_rule(rule: IdentifierRule) -> None:
+    # Adds a rule at runtime, eg for a network registered with `register_link_templates()`
+    IDENTIFIER_RULES.append(rule)
+    global _trie
+    _trie = _build_trie(IDENTIFIER_RULES)
+
+
+def _is_supported(network: str, kind: str) -> bool:
+    # Whether any explorer of the network can link to this kind of thing
+    return any(
+        isinstance(LINK_TEMPLATES.get((network, kind, flavour)), LinkTemplate)
+        for flavour in (
+            ExplorerFlavour.DEFAULT,
+            *(flavour for flavour, _ in FLAVOUR_MATCHERS.get(network, ())),
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _get_candidates(
+    rule: IdentifierRule, chain_count: int, template_count: int
+) -> Tuple[Candidate, ...]:
+    # The counts are only part of the key, so that registering chains or templates refreshes the candidates
+    networks = (
+        [chain.network for chain in EVM_CHAINS]
+        if rule.network == EVM
+        else [rule.network]
+    )
+    return tuple(
+        Candidate(network, kind)
+        for network in networks
+        for kind in rule.kinds
+        if _is_supported(network, kind)
+    )
+
+
+def classify_identifier(identifier: str, strict: bool = False) -> Tuple[Candidate, ...]:
+    # The (network, kind) pairs the identifier could be for, most likely first, or () if it isn't recognised
+    identifier = identifier.strip(whitespace)
+    length = len(identifier)
+    candidates: List[Candidate] = []
+    node: Optional[_TrieNode] = _trie
+    # Walks down the trie along the identifier, trying the rules of every prefix it passes, longest first
+    matched: List[IdentifierRule] = []
+    for character in identifier:
+        matched = node.rules + matched
+        node = node.children.get(character)
+        if node is None:
+            break
+    else:
+        matched = node.rules + matched
+    for rule in matched:
+        if (
+            length in rule.lengths
+            and rule.alphabet.issuperset(identifier[len(rule.prefix) :])
+            and not (strict and rule.check is not None and not rule.check(identifier))
+        ):
+            candidates.extend(
+                _get_candidates(rule, len(EVM_CHAINS), len(LINK_TEMPLATES))
+            )
+    return tuple(candidates)
+
+
+def classify_identifiers(
+    identifiers: Iterable[str], strict: bool = False
+) -> List[Tuple[Candidate, ...]]:
+    # Repeats within the batch are only classified once
+    results: Dict[str, Tuple[Candidate, ...]] = {}
+    classified = []
+    for identifier in identifiers:
+        result = results.get(identifier)
+        if result is None:
+            result = results[identifier] = classify_identifier(identifier, strict)
+        classified.append(result)
+    return classified
+
+
+def get_networks_for_identifier(
+    identifier: str, strict: bool = False
+) -> Tuple[str, ...]:
+    # Distinct networks, in order of likelihood
+    return tuple(
+        dict.fromkeys(
+            candidate.network for candidate in classify_identifier(identifier, strict)
+        )
+    )
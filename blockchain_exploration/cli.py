@@ -0,0 +1,229 @@
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    IO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .exploration import get_explorer_url
+
+# Adds explorer links to CSV or JSON Lines rows streamed through stdin, eg
+#   network,kind,identifier,token_id
+#   matic,token,0x3011810abfec25777a01d5fbef08b2ad12860460,3191
+# Each output row gets a `url` field, left empty if no URL could be built. The reasons are written to the error stream
+# as JSON lines, so exports stay aligned with their input.
+
+CSV = "csv"
+JSONL = "jsonl"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# (URL, error) for each row
+RowResult = Tuple[Optional[str], Optional[Dict[str, str]]]
+
+
+class InvalidRow(NamedTuple):
+    # Stands in for a line of JSON Lines input that isn't a JSON object, so it's reported like any other failed row
+    message: str
+
+
+def _get_field(row: Dict[str, str], name: str) -> str:
+    # csv.DictReader fills in the fields missing from short rows with None
+    value = row[name]
+    if value is None:
+        raise KeyError(name)
+    return value
+
+
+def _get_token_id(row: Dict[str, str]) -> Optional[str]:
+    # CSV rows have an empty field rather than no token ID, but a JSON 0 is still a token ID
+    token_id = row.get("token_id")
+    return None if token_id == "" else token_id
+
+
+def build_row_url(row: Union[Dict[str, str], InvalidRow]) -> RowResult:
+    if isinstance(row, InvalidRow):
+        return None, {"error": "ValueError", "message": row.message}
+    try:
+        if None in row:
+            # csv.DictReader's key for the fields of rows longer than the header
+            raise ValueError(
+                f"The row has {len(row[None])} more fields than the header"
+            )
+        url = get_explorer_url(
+            network=_get_field(row, "network"),
+            kind=_get_field(row, "kind"),
+            identifier=_get_field(row, "identifier"),
+            token_id=_get_token_id(row),
+        )
+    except KeyError as error:
+        return None, {"error": "KeyError", "message": f"Missing field {error}"}
+    except (NotImplementedError, ValueError) as error:
+        return None, {"error": type(error).__name__, "message": str(error)}
+    except (AttributeError, TypeError):
+        # Eg a JSON field that isn't a string
+        return None, {"error": "ValueError", "message": f"Invalid row: {row!r}"}
+    return url, None
+
+
+def build_row_urls(rows: List[Dict[str, str]]) -> List[RowResult]:
+    return [build_row_url(row) for row in rows]
+
+
+def _iter_chunks(items: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_chunk_results(
+    function: Callable[[List[T]], List[R]],
+    items: Iterable[T],
+    workers: int = 1,
+    chunk_size: int = 1000,
+) -> Iterator[Tuple[T, R]]:
+    # Applies `function` to chunks of `items`, yielding each item with its result in input order. With several workers,
+    # at most two chunks per worker are in flight, so memory use doesn't depend on the size of the input. `function`
+    # must be picklable, ie defined at the top level of a module.
+    if chunk_size < 1:
+        # Checked here rather than in the generator, so it fails on the call rather than on the first item
+        raise ValueError(f"The chunk size must be at least 1, not {chunk_size}")
+    return _iter_chunk_results(function, _iter_chunks(items, chunk_size), workers)
+
+
+def _iter_chunk_results(
+    function: Callable[[List[T]], List[R]], chunks: Iterator[List[T]], workers: int
+) -> Iterator[Tuple[T, R]]:
+    if workers <= 1:
+        for chunk in chunks:
+            yield from zip(chunk, function(chunk))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(function, chunk)))
+            if len(pending) >= workers * 2:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result())
+        while pending:
+            chunk, future = pending.popleft()
+            yield from zip(chunk, future.result())
+
+
+def iter_row_urls(
+    rows: Iterable[Dict[str, str]], workers: int = 1, chunk_size: int = 1000
+) -> Iterator[Tuple[Dict[str, str], RowResult]]:
+    return iter_chunk_results(build_row_urls, rows, workers, chunk_size)
+
+
+def _read_jsonl(input: IO[str]) -> Iterator[Union[Dict[str, str], InvalidRow]]:
+    for line in input:
+        if line.strip():
+            try:
+                row = json.loads(line)
+            except ValueError as error:
+                yield InvalidRow(f"Invalid JSON: {error}")
+                continue
+            yield row if isinstance(row, dict) else InvalidRow("Expected a JSON object")
+
+
+def run(
+    input: IO[str],
+    output: IO[str],
+    errors: IO[str],
+    format: str = CSV,
+    workers: int = 1,
+    chunk_size: int = 1000,
+) -> int:
+    # Returns the number of rows for which no URL could be built
+    if format == CSV:
+        reader = csv.DictReader(input)
+        rows = reader
+        writer = None
+    else:
+        rows = _read_jsonl(input)
+    failures = 0
+    for row_number, (row, (url, error)) in enumerate(
+        iter_row_urls(rows, workers=workers, chunk_size=chunk_size), start=1
+    ):
+        if error:
+            failures += 1
+            errors.write(json.dumps({"row": row_number, **error}) + "\n")
+        if format == CSV:
+            if writer is None:
+                # Fields beyond the header are dropped, leaving the row's error to explain
+                writer = csv.DictWriter(
+                    output,
+                    fieldnames=[*reader.fieldnames, "url"],
+                    lineterminator="\n",
+                    extrasaction="ignore",
+                )
+                writer.writeheader()
+            writer.writerow({**row, "url": url or ""})
+        else:
+            fields = {} if isinstance(row, InvalidRow) else row
+            output.write(json.dumps({**fields, "url": url}) + "\n")
+    if format == CSV and writer is None and reader.fieldnames:
+        csv.writer(output, lineterminator="\n").writerow([*reader.fieldnames, "url"])
+    return failures
+
+
+def positive_int(text: str) -> int:
+    # An argparse type for options such as chunk sizes, which make no sense below 1
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {value}")
+    return value
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m blockchain_exploration",
+        description="Add blockchain explorer links to rows of (network, kind, identifier, token_id) read from stdin",
+    )
+    parser.add_argument("--format", choices=[CSV, JSONL], default=CSV)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Spread chunks of rows across this many processes, keeping their order",
+    )
+    parser.add_argument("--chunk-size", type=positive_int, default=1000)
+    parser.add_argument(
+        "--errors",
+        type=argparse.FileType("w"),
+        default=sys.stderr,
+        help="Where to write JSON lines describing rows without a URL (stderr by default)",
+    )
+    args = parser.parse_args(argv)
+    failures = run(
+        input=sys.stdin,
+        output=sys.stdout,
+        errors=args.errors,
+        format=args.format,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    return 1 if failures else 0
@@ -0,0 +1,165 @@
+import os
+import threading
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from .chains import EVM_CHAINS
+from .types import Network
+
+if TYPE_CHECKING:
+    from .caching import UrlCache
+    from .explorer_health import ExplorerSelector
+    from .instrumentation import Instrumentation
+
+# Per network, the environment variables that can override the explorer (in order of precedence) and the default.
+# To support test networks (eg Rinkeby, Goerli), it's best to change the environment variable for your block explorer.
+# It'll presumably have the same paths as the corresponding mainnet explorer, so we can still build URLs without
+# getting into the minutiae of which specific chain it is.
+EXPLORER_BASE_PATHS: Dict[str, Tuple[Tuple[str, ...], str]] = {
+    # Another option is bitcoin.com (redirecting to blockchair.com), but it focuses on cash rather than tokens
+    Network.BITCOIN_CASH: (
+        ("SLP_EXPLORER_BASEPATH", "EXPLORER_BASEPATH"),
+        "https://simpleledger.info",
+    ),
+    # Could also be https://better-call.dev/
+    Network.TEZOS: (("TEZOS_EXPLORER_BASEPATH",), "https://tzkt.io"),
+    Network.SUI: (("SUI_EXPLORER_BASEPATH",), "https://suiscan.xyz/mainnet"),
+    Network.TON: (("TON_EXPLORER_BASEPATH",), "https://tonscan.org"),
+    # EVM chains, including Ethereum and Polygon, are listed in data/evm_chains.json
+    **{
+        chain.network: (chain.environment_variables, chain.base_path)
+        for chain in EVM_CHAINS
+    },
+}
+
+
+# Other explorers whose URLs our link templates know how to build
+ALTERNATE_BASE_PATHS: Dict[str, Tuple[str, ...]] = {
+    Network.BITCOIN_CASH: ("https://blockchair.com/bitcoin-cash",),
+    Network.ETHEREUM: ("https://opensea.io",),
+    Network.MATIC: ("https://opensea.io",),
+    Network.TEZOS: ("https://better-call.dev/mainnet",),
+}
+
+
+class ExplorerConfig(NamedTuple):
+    # An immutable snapshot of the explorer settings, so building a URL never has to consult the environment.
+    # Base paths are already right-stripped of slashes.
+    base_paths: Mapping[str, str]
+    # Parse every generated URL rather than relying on the templates having been validated when they were compiled
+    strict_validation: bool = False
+    # An `EvmAddressCase` to canonicalize EVM addresses with, so that equivalent addresses produce identical URLs
+    evm_address_case: Optional[str] = None
+    # Chooses between each network's explorers by their health, in place of `base_paths` for the networks it manages
+    explorer_selector: Optional["ExplorerSelector"] = None
+    # Counts and times the URLs built with this config. When None, as by default, building URLs costs nothing extra.
+    instrumentation: Optional["Instrumentation"] = None
+    # Reuses the URLs built for popular identifiers. When None, as by default, every URL is built afresh.
+    url_cache: Optional["UrlCache"] = None
+
+    @classmethod
+    def from_base_paths(
+        cls,
+        base_paths: Mapping[str, str],
+        strict_validation: bool = False,
+        evm_address_case: Optional[str] = None,
+        explorer_selector: Optional["ExplorerSelector"] = None,
+        instrumentation: Optional["Instrumentation"] = None,
+        url_cache: Optional["UrlCache"] = None,
+    ) -> "ExplorerConfig":
+        return cls(
+            base_paths=MappingProxyType(
+                {
+                    network: base_path.rstrip("/")
+                    for network, base_path in base_paths.items()
+                }
+            ),
+            strict_validation=strict_validation,
+            evm_address_case=evm_address_case,
+            explorer_selector=explorer_selector,
+            instrumentation=instrumentation,
+            url_cache=url_cache,
+        )
+
+    @classmethod
+    def from_environ(
+        cls, environ: Optional[Mapping[str, str]] = None
+    ) -> "ExplorerConfig":
+        if environ is None:
+            environ = os.environ
+        base_paths = {}
+        for network, (
+            environment_variables,
+            base_path,
+        ) in EXPLORER_BASE_PATHS.items():
+            for environment_variable in environment_variables:
+                value = environ.get(environment_variable)
+                if value is not None:
+                    base_path = value
+                    break
+            base_paths[network] = base_path
+        return cls.from_base_paths(
+            base_paths,
+            strict_validation=environ.get("EXPLORER_STRICT_VALIDATION", "false")
+            in {"true", "1"},
+            evm_address_case=environ.get("EVM_ADDRESS_CASE") or None,
+        )
+
+    def get_base_path(self, network: str, kind: Optional[str] = None) -> str:
+        # `kind` lets the explorer selector skip explorers that can't link to that kind of thing
+        if self.explorer_selector is not None:
+            base_path = self.explorer_selector.get_base_path(network, kind)
+            if base_path is not None:
+                return base_path
+        try:
+            return self.base_paths[network]
+        except KeyError:
+            raise NotImplementedError(
+                f"Exploration of the {network} network is not supported"
+            )
+
+
+_default_config: Optional[ExplorerConfig] = None
+_default_config_lock = threading.Lock()
+
+
+def get_default_config() -> ExplorerConfig:
+    # Reads don't lock: replacing the default is a single reference assignment
+    config = _default_config
+    if config is None:
+        with _default_config_lock:
+            if _default_config is None:
+                _set_default_config(ExplorerConfig.from_environ())
+            config = _default_config
+    return config
+
+
+def _set_default_config(config: ExplorerConfig) -> None:
+    global _default_config
+    _default_config = config
+
+
+def set_default_config(config: ExplorerConfig) -> None:
+    with _default_config_lock:
+        _set_default_config(config)
+
+
+def reload_default_config(
+    environ: Optional[Mapping[str, str]] = None,
+) -> ExplorerConfig:
+    # For long-running workers to pick up new explorer settings without a restart
+    config = ExplorerConfig.from_environ(environ)
+    set_default_config(config)
+    return config
+
+
+# Set by `ExplorerContext` to override the default config for the current thread or asyncio task
+context_config: ContextVar[Optional[ExplorerConfig]] = ContextVar(
+    "explorer_config", default=None
+)
+
+
+def get_current_config() -> ExplorerConfig:
+    # The config of the innermost `ExplorerContext`, or the default outside of one
+    return context_config.get() or get_default_config()
@@ -0,0 +1,102 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+from .config import ExplorerConfig, context_config, get_current_config
+from .templates import compile_link_template
+from .types import LINK_KINDS
+
+# Explorer settings for a block of code, eg for one tenant's request in a multi-tenant service:
+#   with ExplorerContext(base_paths={Network.ETHEREUM: "https://sepolia.etherscan.io"}):
+#       get_explorer_url_for_transaction(Network.ETHEREUM, transaction_hash)
+# The settings are held in a context variable, so they follow the current thread or asyncio task and can't leak into
+# others. Every URL builder that isn't given a `config` uses them.
+
+# The tokens for undoing each `with` block in the current context, innermost last. As a context variable, they're
+# separate per thread and task, so one `ExplorerContext` can be entered by many at once.
+_context_tokens: ContextVar[Tuple[Any, ...]] = ContextVar(
+    "explorer_context_tokens", default=()
+)
+
+
+class ExplorerContext:
+    def __init__(
+        self,
+        config: Optional[ExplorerConfig] = None,
+        base_paths: Optional[Mapping[str, str]] = None,
+        **options,
+    ):
+        # Starts from `config`, or else the config in effect when the block is entered, with `base_paths` overriding
+        # individual networks and `options` replacing other `ExplorerConfig` fields, eg `evm_address_case`. So a context
+        # made once, eg as a decorator at import time, still follows later changes to the default config.
+        self._config = config
+        self._base_paths = (
+            {
+                network: base_path.rstrip("/")
+                for network, base_path in base_paths.items()
+            }
+            if base_paths
+            else None
+        )
+        self._options = options
+        # (config, the config it was resolved from), replaced whole, so threads entering at once can share it
+        self._resolved: Optional[Tuple[ExplorerConfig, ExplorerConfig]] = None
+        config = self.config
+        # Compiling every template up front means a bad base path fails here rather than in the middle of a request
+        for network, base_path in config.base_paths.items():
+            for kind in LINK_KINDS:
+                compile_link_template(
+                    network,
+                    kind,
+                    base_path,
+                    config.strict_validation,
+                    config.evm_address_case,
+                )
+
+    @property
+    def config(self) -> ExplorerConfig:
+        # The config this context applies, were it entered now
+        base = self._config or get_current_config()
+        resolved = self._resolved
+        if resolved is not None and resolved[1] is base:
+            return resolved[0]
+        config = base
+        if self._base_paths:
+            config = config._replace(
+                base_paths=MappingProxyType({**config.base_paths, **self._base_paths})
+            )
+        if self._options:
+            config = config._replace(**self._options)
+        self._resolved = (config, base)
+        return config
+
+    def __enter__(self) -> ExplorerConfig:
+        config = self.config
+        token = context_config.set(config)
+        _context_tokens.set(_context_tokens.get() + (token,))
+        return config
+
+    def __exit__(self, *exc_info) -> None:
+        tokens = _context_tokens.get()
+        _context_tokens.set(tokens[:-1])
+        context_config.reset(tokens[-1])
+
+    def __call__(self, function: Callable) -> Callable:
+        # As a decorator, the context applies to each call, including awaiting a coroutine function
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with self:
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self:
+                return function(*args, **kwargs)
+
+        return wrapper
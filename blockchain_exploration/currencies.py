@@ -1,5 +1,6 @@
 from typing import Any, DefaultDict, Dict
 
+from blockchain_exploration.chains import EVM_CHAINS
 from blockchain_exploration.types import Network
 
 
@@ -8,6 +9,8 @@ class CryptoCurrency(DefaultDict):
     code: str
     native_token: bool
     display_text: str
+    # Raw on-chain amounts are in units of 10 ** -decimals, eg satoshi, mutez, wei, MIST or nanoton
+    decimals: int
 
 
 # Supported ISO-style currency codes used for payment tracking.
@@ -19,10 +22,17 @@ NETWORK_CURRENCIES: Dict[Any, Dict[str, CryptoCurrency]] = {
             "code": "bch",
             "native_token": True,
             "display_text": "BCH",
+            "decimals": 8,
         }
     },
     Network.TEZOS: {
-        "xtz": {"symbol": "ꜩ", "code": "xtz", "native_token": True, "display_text": "ꜩ"}
+        "xtz": {
+            "symbol": "ꜩ",
+            "code": "xtz",
+            "native_token": True,
+            "display_text": "ꜩ",
+            "decimals": 6,
+        }
     },
     Network.MATIC: {
         "matic": {
@@ -30,6 +40,7 @@ NETWORK_CURRENCIES: Dict[Any, Dict[str, CryptoCurrency]] = {
             "code": "matic",
             "native_token": True,
             "display_text": "MATIC",
+            "decimals": 18,
         }
     },
     Network.ETHEREUM: {
@@ -38,6 +49,7 @@ NETWORK_CURRENCIES: Dict[Any, Dict[str, CryptoCurrency]] = {
             "code": "eth",
             "native_token": True,
             "display_text": "ether",
+            "decimals": 18,
         }
     },
     Network.SUI: {
@@ -46,6 +58,7 @@ NETWORK_CURRENCIES: Dict[Any, Dict[str, CryptoCurrency]] = {
             "code": "sui",
             "native_token": True,
             "display_text": "sui",
+            "decimals": 9,
         }
     },
     Network.TON: {
@@ -54,12 +67,29 @@ NETWORK_CURRENCIES: Dict[Any, Dict[str, CryptoCurrency]] = {
             "code": "ton",
             "native_token": True,
             "display_text": "ton",
+            "decimals": 9,
         },
         "scor": {
             "symbol": "SCOR",
             "code": "scor",
             "native_token": False,
             "display_text": "$SCOR",
+            "decimals": 9,
         },
     },
 }
+
+# Native currencies of the other EVM chains in data/evm_chains.json
+for _chain in EVM_CHAINS:
+    NETWORK_CURRENCIES.setdefault(
+        _chain.network,
+        {
+            _chain.currency.code: {
+                "symbol": _chain.currency.symbol,
+                "code": _chain.currency.code,
+                "native_token": True,
+                "display_text": _chain.currency.display_text,
+                "decimals": _chain.currency.decimals,
+            }
+        },
+    )
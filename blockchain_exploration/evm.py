@@ -0,0 +1,140 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from .types import EvmAddressCase
+
+# Keccak-256 as used by Ethereum, which pads differently from the standardised SHA3-256 in `hashlib`. It's only used
+# for EIP-55 checksums of 20-byte addresses, so a pure Python implementation keeps us free of native dependencies.
+
+_ROUND_CONSTANTS = (
+    0x0000000000000001,
+    0x0000000000008082,
+    0x800000000000808A,
+    0x8000000080008000,
+    0x000000000000808B,
+    0x0000000080000001,
+    0x8000000080008081,
+    0x8000000000008009,
+    0x000000000000008A,
+    0x0000000000000088,
+    0x0000000080008009,
+    0x000000008000000A,
+    0x000000008000808B,
+    0x800000000000008B,
+    0x8000000000008089,
+    0x8000000000008003,
+    0x8000000000008002,
+    0x8000000000000080,
+    0x000000000000800A,
+    0x800000008000000A,
+    0x8000000080008081,
+    0x8000000000008080,
+    0x0000000080000001,
+    0x8000000080008008,
+)
+
+# Rotation offsets for the lane at (x, y), indexed by x + 5 * y
+_ROTATIONS = (
+    (0, 1, 62, 28, 27),
+    (36, 44, 6, 55, 20),
+    (3, 10, 43, 25, 39),
+    (41, 45, 15, 21, 8),
+    (18, 2, 61, 56, 14),
+)
+# For each lane at x + 5 * y: its index, x, where the π step moves it to, ie (y, 2x + 3y), and its ρ rotation
+_RHO_PI = tuple(
+    (x + 5 * y, x, y + 5 * ((2 * x + 3 * y) % 5), _ROTATIONS[y][x])
+    for y in range(5)
+    for x in range(5)
+)
+
+_MASK = (1 << 64) - 1
+_RATE = 136  # Bytes absorbed per permutation for a 256-bit output
+
+
+def _permute(state: List[int]) -> None:
+    mask = _MASK
+    for round_constant in _ROUND_CONSTANTS:
+        # θ
+        c0, c1, c2, c3, c4 = [
+            state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15] ^ state[x + 20]
+            for x in range(5)
+        ]
+        d = (
+            c4 ^ (((c1 << 1) | (c1 >> 63)) & mask),
+            c0 ^ (((c2 << 1) | (c2 >> 63)) & mask),
+            c1 ^ (((c3 << 1) | (c3 >> 63)) & mask),
+            c2 ^ (((c4 << 1) | (c4 >> 63)) & mask),
+            c3 ^ (((c0 << 1) | (c0 >> 63)) & mask),
+        )
+        # ρ and π. Lanes are below 2 ** 64, so a rotation by 0 needs no special case.
+        moved = [0] * 25
+        for index, x, target, offset in _RHO_PI:
+            lane = state[index] ^ d[x]
+            moved[target] = ((lane << offset) | (lane >> (64 - offset))) & mask
+        # χ
+        for y in (0, 5, 10, 15, 20):
+            b0, b1, b2, b3, b4 = moved[y : y + 5]
+            state[y] = b0 ^ (~b1 & b2)
+            state[y + 1] = b1 ^ (~b2 & b3)
+            state[y + 2] = b2 ^ (~b3 & b4)
+            state[y + 3] = b3 ^ (~b4 & b0)
+            state[y + 4] = b4 ^ (~b0 & b1)
+        # ι
+        state[0] ^= round_constant
+
+
+def keccak_256(data: bytes) -> bytes:
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % _RATE))
+    padded[-1] |= 0x80
+    state = [0] * 25
+    for offset in range(0, len(padded), _RATE):
+        for index in range(_RATE // 8):
+            start = offset + index * 8
+            state[index] ^= int.from_bytes(padded[start : start + 8], "little")
+        _permute(state)
+    return b"".join(lane.to_bytes(8, "little") for lane in state[:4])
+
+
+_EVM_ADDRESS = re.compile(r"0[xX][0-9a-fA-F]{40}")
+
+
+def to_checksum_address(address: str) -> str:
+    # https://eips.ethereum.org/EIPS/eip-55
+    if not _EVM_ADDRESS.fullmatch(address):
+        raise ValueError(f"Not an EVM address: {address!r}")
+    hex_address = address[2:].lower()
+    digest = keccak_256(hex_address.encode("ascii")).hex()
+    return "0x" + "".join(
+        character.upper() if digest[index] >= "8" else character
+        for index, character in enumerate(hex_address)
+    )
+
+
+@lru_cache(maxsize=65536)
+def canonicalize_evm_address(address: str, case: str = EvmAddressCase.CHECKSUM) -> str:
+    # Memoized, since the same contracts turn up again and again
+    if case == EvmAddressCase.CHECKSUM:
+        return to_checksum_address(address)
+    elif case == EvmAddressCase.LOWER:
+        if not _EVM_ADDRESS.fullmatch(address):
+            raise ValueError(f"Not an EVM address: {address!r}")
+        return address.lower()
+    raise ValueError(f"Unknown EVM address case: {case}")
+
+
+def canonicalize_evm_addresses(
+    addresses: Iterable[str], case: str = EvmAddressCase.CHECKSUM
+) -> List[str]:
+    # Repeats within the list are only looked up once
+    results: Dict[str, str] = {}
+    canonical = []
+    for address in addresses:
+        result = results.get(address)
+        if result is None:
+            result = results[address] = canonicalize_evm_address(address, case)
+        canonical.append(result)
+    return canonical
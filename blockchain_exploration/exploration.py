@@ -1,51 +1,36 @@
 import logging
-import os
-from string import whitespace
-from typing import Optional
+from time import perf_counter_ns
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-from .types import Network, TokenType, is_evm_network
+from .chains import EVM_CHAINS, EvmChain
+from .config import EXPLORER_BASE_PATHS, ExplorerConfig, get_current_config
+from .instrumentation import EMPTY
+from .templates import (
+    EVM_FLAVOUR_MATCHERS,
+    EVM_LINK_TEMPLATES,
+    CompiledTemplate,
+    compile_link_template,
+    compile_link_templates,
+    get_validated_url,
+    register_link_templates,
+)
+from .types import LINK_KINDS, LinkKind, Network, TokenType
 
 LOGGER = logging.getLogger()
 
 
-def get_base_path(network: str) -> str:
-    # To support test networks (eg Rinkeby, Goerli), it's best to change the environment variable for your block
-    # explorer. It'll presumably have the same paths as the corresponding mainnet explorer, so we can still build URLs
-    # without getting into the minutiae of which specific chain it is.
-    if network == Network.BITCOIN_CASH:
-        # Another option is bitcoin.com (redirecting to blockchair.com), but it focuses on cash rather than tokens
-        result = os.getenv(
-            "SLP_EXPLORER_BASEPATH",
-            os.getenv("EXPLORER_BASEPATH", "https://simpleledger.info"),
-        )
-    elif network == Network.ETHEREUM:
-        result = os.getenv("ETH_EXPLORER_BASEPATH", "https://etherscan.io")
-    elif network == Network.MATIC:
-        # Could also be https://opensea.io/assets/matic sometimes
-        result = os.getenv("MATIC_EXPLORER_BASEPATH", "https://polygonscan.com")
-    elif network == Network.TEZOS:
-        # Could also be https://better-call.dev/
-        result = os.getenv("TEZOS_EXPLORER_BASEPATH", "https://tzkt.io")
-    elif network == Network.SUI:
-        result = os.getenv("SUI_EXPLORER_BASEPATH", "https://suiscan.xyz/mainnet")
-    elif network == Network.TON:
-        result = os.getenv("TON_EXPLORER_BASEPATH", "https://tonscan.org")
-    else:
-        raise NotImplementedError(
-            f"Exploration of the {network} network is not supported"
-        )
-    return result.rstrip("/")
-
-
-def get_validated_url(url: str) -> str:
-    parsed = urlparse(url)
-    if not (parsed.scheme and parsed.netloc and parsed.path):
-        raise ValueError(f"An invalid explorer URL was generated: {url}")
-    return url.strip(whitespace)
+def get_base_path(
+    network: str, config: Optional[ExplorerConfig] = None, kind: Optional[str] = None
+) -> str:
+    # Explorers are configured through the environment, which is read once into the default `ExplorerConfig`. Call
+    # `reload_default_config()` to pick up changes, or use an `ExplorerContext` to override them for a task.
+    return (config or get_current_config()).get_base_path(network, kind)
 
 
 def validated_url(naive_func):
+    # URL builders validate their own results now (see `CompiledTemplate`), but this remains for wrapping other
+    # functions that return explorer URLs
     def validated_func(*args, **kwargs):
         result = naive_func(*args, **kwargs)
         if result:
@@ -56,222 +41,356 @@ def validated_url(naive_func):
     return validated_func
 
 
-@validated_url
+def get_link_template(
+    network: str,
+    kind: str,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> CompiledTemplate:
+    config = config or get_current_config()
+    if config.instrumentation is not None:
+        return _get_instrumented_link_template(network, kind, base_path, config)
+    template = compile_link_template(
+        network,
+        kind,
+        base_path or config.get_base_path(network, kind),
+        config.strict_validation,
+        config.evm_address_case,
+    )
+    if config.url_cache is not None:
+        # A `CachedTemplate`, which builds the same URLs
+        template = config.url_cache.wrap(template)
+    return template
+
+
+def _get_instrumented_link_template(
+    network: str, kind: str, base_path: Optional[str], config: ExplorerConfig
+):
+    # An `InstrumentedTemplate`, which builds the same URLs. Errors finding the template, eg for unknown networks and
+    # invalid base paths, are counted like failed builds.
+    started = perf_counter_ns()
+    try:
+        base_path = base_path or config.get_base_path(network, kind)
+        template = compile_link_template(
+            network, kind, base_path, config.strict_validation, config.evm_address_case
+        )
+    except (NotImplementedError, ValueError) as error:
+        config.instrumentation.record_failure(
+            network, kind, base_path, error, perf_counter_ns() - started
+        )
+        raise
+    if config.url_cache is not None:
+        # Inside the instrumentation, so that cache hits are counted too
+        template = config.url_cache.wrap(template)
+    return config.instrumentation.wrap(network, kind, base_path, template)
+
+
+def _record_empty_account(
+    network: str, base_path: Optional[str], config: Optional[ExplorerConfig]
+) -> None:
+    # Accounts without an address have no URL, and no template is looked up for them, so their outcome is recorded here
+    config = config or get_current_config()
+    if config.instrumentation is not None:
+        config.instrumentation.record_outcome(
+            network,
+            LinkKind.ACCOUNT,
+            base_path or config.base_paths.get(network),
+            EMPTY,
+            0,
+        )
+
+
 def get_explorer_url_for_account(
-    network: str, address: str, base_path: Optional[str] = None
+    network: str,
+    address: str,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
 ) -> Optional[str]:
     # An account is a place that can hold funds 💰. Use this function for non-NFT contracts too.
     if not address:
+        _record_empty_account(network, base_path, config)
         return None
-    base_path = (base_path or get_base_path(network)).rstrip("/")
-    address = address.strip(whitespace)
-    if network == Network.BITCOIN_CASH:
-        return f"{base_path}/address/{address}"
-    elif is_evm_network(network):
-        if base_path.endswith("/opensea.io"):
-            # https://opensea.io/0xeec4013a607d720989db8f464361cdcf2cb7a7bd
-            return f"{base_path}/{address}"
-        else:
-            # https://etherscan.io/address/0xd75004A00Ca9d707a4D318B21353dC8aFB151E72
-            return f"{base_path}/address/{address}"
-    elif network == Network.TEZOS:
-        # https://better-call.dev/mainnet/tz1imqR4V7ehxPeUrewsg6oy7tAPLsDBscTV/operations
-        # https://tzkt.io/tz1fRXMLR27hWoD49tdtKunHyfy3CQb5XZst/operations/
-        return f"{base_path}/{address}/operations/"
-    elif network == Network.SUI:
-        return f"{base_path}/account/{address}"
-    elif network == Network.TON:
-        return f"{base_path}/account/{address}"
-    else:
-        raise NotImplementedError(
-            f"No explorer URL can be constructed for {network} addresses"
-        )
+    template = get_link_template(network, LinkKind.ACCOUNT, base_path, config)
+    return template.build(address)
 
 
-@validated_url
 def get_explorer_url_for_token_wallet(
-    network: str, address: str, base_path: Optional[str] = None
+    network: str,
+    address: str,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
 ) -> str:
     # A token wallet holds tokens 🪙; and perhaps money
-    base_path = (base_path or get_base_path(network)).rstrip("/")
-    address = address.strip(whitespace)
-    if network == Network.BITCOIN_CASH:
-        return get_explorer_url_for_account(network, address=address)
-    elif is_evm_network(network):
-        address_url = get_explorer_url_for_account(
-            network=network, address=address, base_path=base_path
-        )
-        if base_path.endswith("/opensea.io"):
-            # https://opensea.io/0xeec4013a607d720989db8f464361cdcf2cb7a7bd?search[sortBy]=LISTING_DATE&search[chains][0]=MATIC
-            return f"{address_url}?search[sortBy]=LISTING_DATE&search[chains][0]={network.upper()}"
-        else:
-            # https://etherscan.io/address/0xf8e6480aaed82328e837172d4fb450826ec547cf#tokentxnsErc721
-            return f"{address_url}#tokentxnsErc721"
-    elif network == Network.TEZOS:
-        # https://tzkt.io/tz1ZMZddhgxqBMMB5KwSr6L5PDJFQf2nNwbK/tokens
-        return f"{base_path}/{address}/tokens"
-    elif network == Network.SUI:
-        return f"{base_path}/not-implemented/"
-    elif network == Network.TON:
-        return f"{base_path}/{address}#tokens"
-    else:
-        raise NotImplementedError(
-            f"No explorer URL can be constructed for {network} addresses"
-        )
+    template = get_link_template(network, LinkKind.TOKEN_WALLET, base_path, config)
+    return template.build(address)
 
 
-@validated_url
 def get_explorer_url_for_nft_contract(
-    network: str, contract_address, base_path: Optional[str] = None
+    network: str,
+    contract_address,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
 ) -> str:
     # A central overview of an NFT contract, hopefully focusing on tokens rather than blockchain implementation details
-    base_path = (base_path or get_base_path(network)).rstrip("/")
-    if network == Network.BITCOIN_CASH:
-        # https://simpleledger.info/token/62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63
-        return f"{base_path}/token/{contract_address}"
-    elif is_evm_network(network):
-        if base_path.endswith("/opensea.io"):
-            # https://opensea.io/assets?search[query]=0xc4df6018f90f91bad7e24f89279305715b3a276f
-            # If we went to https://opensea.io/0xc4df6018f90f91bad7e24f89279305715b3a276f, they'd show us the tokens
-            # held by that contract.
-            return f"{base_path}/assets?search[query]={contract_address}"
-        else:
-            # https://etherscan.io/token/0xC4df6018F90f91baD7e24f89279305715B3A276F
-            # https://polygonscan.com/token/0x3011810abfec25777a01d5fbef08b2ad12860460
-            return f"{base_path}/token/{contract_address}"
-    elif network == Network.TEZOS:
-        # https://tzkt.io/KT1RFncfJGBN9heZuDGW5vJPYpMKeYcLeZuo/storage/
-        return get_explorer_url_for_account(
-            network=network, address=contract_address, base_path=base_path
-        )
-    elif network == Network.SUI:
-        return f"{base_path}/collection/{contract_address}/items"
-    elif network == Network.TON:
-        # This is a TON jetton contract, not an NFT contract
-        return f"{base_path}/jetton/{contract_address}"
-    else:
-        raise NotImplementedError(
-            f"Exploration of the {network} network by contract is not supported"
-        )
+    return get_link_template(network, LinkKind.NFT_CONTRACT, base_path, config).build(
+        contract_address
+    )
 
 
-@validated_url
 def get_explorer_url_for_token(
-    network: str, address: str, token_id: Optional[str], base_path: Optional[str] = None
+    network: str,
+    address: str,
+    token_id: Optional[str],
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
 ) -> str:
     # An individual token 🪙
     # address can be either for a token (BCH) or a contract (EVM, or Tezos)
-    base_path = (base_path or get_base_path(network)).rstrip("/")
-    if network == Network.BITCOIN_CASH:
-        # https://simpleledger.info/token/62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63
-        return f"{base_path}/token/{address}"
-    elif is_evm_network(network):
-        if base_path.endswith("/opensea.io"):
-            # https://opensea.io/assets/0xc4df6018f90f91bad7e24f89279305715b3a276f/1288
-            return get_explorer_url_for_nft_contract(
-                network=network, contract_address=address, base_path=base_path
-            )
-        else:
-            # https://polygonscan.com/token/0x3011810abfec25777a01d5fbef08b2ad12860460?a=3191
-            return f"{base_path}/token/{address}/?a={token_id}"
-    elif network == Network.TEZOS:
-        # https://tzkt.io/KT1LHqbTKHKRtTzQAF4Z8KGa1xixQ2266S4w/operations/
-        # https://better-call.dev/mainnet/KT1LHqbTKHKRtTzQAF4Z8KGa1xixQ2266S4w/tokens
-        return get_explorer_url_for_nft_contract(
-            network=network, contract_address=address, base_path=base_path
-        )
-    elif network == Network.SUI:
-        # token_id => object_id
-        return f"{base_path}/object/{token_id}"
-    elif network == Network.TON:
-        return f"{base_path}/not-implemented/"
-    else:
-        raise NotImplementedError(
-            f"Exploration of the {network} network is not supported"
-        )
+    return get_link_template(network, LinkKind.TOKEN, base_path, config).build(
+        address, token_id
+    )
+
+
+def get_explorer_url(
+    network: str,
+    kind: str,
+    identifier: Optional[str],
+    token_id: Optional[str] = None,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> Optional[str]:
+    # For callers that only know which kind of link they need at runtime, eg the command line. The identifier is
+    # whatever the `get_explorer_url_for_*()` function for that kind takes as its first argument.
+    if kind not in LINK_KINDS:
+        raise ValueError(f"Unknown kind of explorer link: {kind}")
+    if kind == LinkKind.ACCOUNT and not identifier:
+        _record_empty_account(network, base_path, config)
+        return None
+    return get_link_template(network, kind, base_path, config).build(
+        identifier, token_id
+    )
+
+
+# Give callers some guidance that calling `get_explorer_url_for_token()` won't be as desriable as they might have
+# hoped for.
+TOKEN_URL_UNSUPPORTED_NETWORKS = frozenset({Network.BITCOIN_CASH, Network.TEZOS})
 
 
 def is_token_url_supported(network: str) -> bool:
-    # Give callers some guidance that calling `get_explorer_url_for_token()` won't be as desriable as they might have
-    # hoped for.
-    if network in {Network.BITCOIN_CASH, Network.TEZOS}:
-        return False
-    else:
-        return True
+    return network not in TOKEN_URL_UNSUPPORTED_NETWORKS
 
 
-@validated_url
 def get_explorer_url_for_transaction(
-    network: str, transaction_hash: str, base_path: Optional[str] = None
+    network: str,
+    transaction_hash: str,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
 ) -> str:
     # A blockchain transaction, eg the sending of funds or tokens 🕊
-    base_path = (base_path or get_base_path(network)).rstrip("/")
-    transaction_hash = transaction_hash.strip(whitespace)
-    if network == Network.BITCOIN_CASH:
-        # https://simpleledger.info/#tx/f63da6fedacb67d7f45fb1aab5663e239e0b09596e670c9e97ced7a80c34c24c
-        if base_path.endswith("/simpleledger.info"):
-            # https://blockchair.com/bitcoin-cash/transaction/62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63
-            return f"{base_path}/#tx/{transaction_hash}"
-        else:
-            raise NotImplementedError(
-                f"{network} URLs are not supported for {base_path}"
-            )
-    elif is_evm_network(network):
-        if base_path.endswith("/opensea.io"):
-            raise NotImplementedError(
-                f"OpenSea does not offer links to individual transactions"
-            )
-        else:
-            # https://polygonscan.com/tx/0x1d13a622fd628e0c77ea28805cfe6cfd3c23ab95a13a8ff81a11cb08a17f35a3
-            return f"{base_path}/tx/{transaction_hash}"
-    elif network == Network.TEZOS:
-        if "better-call.dev" in base_path:
-            # https://better-call.dev/mainnet/opg/ooZ2UVPNprv9GfMCwp6JgpUD54G668xrgnkPR2DRCZokfNChDrS/contents
-            return f"{base_path}/opg/{transaction_hash}"
-        else:
-            # https://tzkt.io/ooZ2UVPNprv9GfMCwp6JgpUD54G668xrgnkPR2DRCZokfNChDrS
-            return f"{base_path}/{transaction_hash}"
-    elif network == Network.SUI:
-        return f"{base_path}/tx/{transaction_hash}"
-    elif network == Network.TON:
-        return f"{base_path}/tx/{transaction_hash}"
-    else:
-        raise NotImplementedError(
-            f"Exploration of the {network} network is not supported"
+    template = get_link_template(network, LinkKind.TRANSACTION, base_path, config)
+    return template.build(transaction_hash)
+
+
+class _Unsupported:
+    # Falsy, like a missing link, but distinguishable from one
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "UNSUPPORTED"
+
+    def __reduce__(self) -> str:
+        return "UNSUPPORTED"
+
+
+# Stands in for a link the network's explorer can't provide, rather than raising or linking to a /not-implemented/ page
+UNSUPPORTED = _Unsupported()
+
+Link = Union[str, None, _Unsupported]
+
+
+class ExplorerLinks(NamedTuple):
+    # None where the identifiers a link needs weren't given; a token link needs both the contract and token ID
+    account: Link = None
+    token_wallet: Link = None
+    nft_contract: Link = None
+    token: Link = None
+    transaction: Link = None
+
+
+# In the order of `ExplorerLinks`' fields
+LINK_BUNDLE_KINDS = (
+    LinkKind.ACCOUNT,
+    LinkKind.TOKEN_WALLET,
+    LinkKind.NFT_CONTRACT,
+    LinkKind.TOKEN,
+    LinkKind.TRANSACTION,
+)
+
+
+def _get_link_templates(
+    network: str, base_path: Optional[str], config: ExplorerConfig
+) -> Tuple[Optional[CompiledTemplate], ...]:
+    if base_path is None and config.explorer_selector is None:
+        # Otherwise the explorer may differ by kind of link
+        base_path = config.base_paths.get(network)
+        if base_path is None:
+            return (None,) * len(LINK_BUNDLE_KINDS)
+    if (
+        base_path is not None
+        and config.url_cache is None
+        and config.instrumentation is None
+    ):
+        # Compiled together once per explorer
+        return compile_link_templates(
+            network,
+            LINK_BUNDLE_KINDS,
+            base_path,
+            config.strict_validation,
+            config.evm_address_case,
         )
+    templates = []
+    for kind in LINK_BUNDLE_KINDS:
+        try:
+            template = get_link_template(network, kind, base_path, config)
+        except NotImplementedError:
+            template = None
+        templates.append(
+            None
+            if template is None or template.error is not None or template.is_placeholder
+            else template
+        )
+    return tuple(templates)
+
+
+def get_explorer_links(
+    network: str,
+    address: Optional[str] = None,
+    contract: Optional[str] = None,
+    token_id: Optional[str] = None,
+    tx_hash: Optional[str] = None,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> ExplorerLinks:
+    # Every link for one entity, eg a wallet or token page, resolving the config and explorer once rather than once per
+    # link. Links the explorer can't provide are UNSUPPORTED, including tokens on networks without token pages (see
+    # `is_token_url_supported()`). Invalid identifiers still raise a ValueError.
+    account, token_wallet, nft_contract, token, transaction = _get_link_templates(
+        network, base_path, config or get_current_config()
+    )
+    if not is_token_url_supported(network):
+        token = None
+    return ExplorerLinks(
+        account=(
+            (account.build(address) if account else UNSUPPORTED) if address else None
+        ),
+        token_wallet=(
+            (token_wallet.build(address) if token_wallet else UNSUPPORTED)
+            if address
+            else None
+        ),
+        nft_contract=(
+            (nft_contract.build(contract) if nft_contract else UNSUPPORTED)
+            if contract
+            else None
+        ),
+        token=(
+            (token.build(contract, token_id) if token else UNSUPPORTED)
+            if contract and token_id is not None
+            else None
+        ),
+        transaction=(
+            (transaction.build(tx_hash) if transaction else UNSUPPORTED)
+            if tx_hash
+            else None
+        ),
+    )
+
+
+# EVM chains, including Ethereum and Polygon, take their token types from data/evm_chains.json
+TOKEN_TYPES_BY_NETWORK: Dict[str, str] = {
+    Network.SUI: TokenType.SUI,
+    Network.TEZOS: TokenType.TEZOS,
+    Network.BITCOIN_CASH: TokenType.SLP,
+    Network.TON: TokenType.SCOR,
+    **{chain.network: chain.token_type for chain in EVM_CHAINS},
+}
+
+NETWORKS_BY_TOKEN_TYPE: Dict[str, str] = {
+    TokenType.SUI: Network.SUI,
+    TokenType.TEZOS: Network.TEZOS,
+    TokenType.SLP: Network.BITCOIN_CASH,
+    TokenType.TON: Network.TON,
+    TokenType.SCOR: Network.TON,
+    **{chain.token_type: chain.network for chain in EVM_CHAINS},
+}
 
 
 def get_token_type_by_network(network: str) -> str:
-    if network == Network.SUI:
-        return TokenType.SUI
-    elif network == Network.MATIC:
-        return TokenType.ERC721_MATIC
-    elif network == Network.ETHEREUM:
-        return TokenType.ERC721_ETH
-    elif network == Network.TEZOS:
-        return TokenType.TEZOS
-    elif network == Network.BITCOIN_CASH:
-        return TokenType.SLP
-    elif network == Network.TON:
-        return TokenType.SCOR
-    else:
+    try:
+        return TOKEN_TYPES_BY_NETWORK[network]
+    except KeyError:
         raise NotImplementedError(f"No token type known for {network}")
 
 
 def get_network_by_token_type(token_type: str) -> str:
-    if token_type == TokenType.SUI:
-        return Network.SUI
-    elif token_type == TokenType.ERC721_MATIC:
-        return Network.MATIC
-    elif token_type == TokenType.ERC721_ETH:
-        return Network.ETHEREUM
-    elif token_type == TokenType.TEZOS:
-        return Network.TEZOS
-    elif token_type == TokenType.SLP:
-        return Network.BITCOIN_CASH
-    elif token_type == TokenType.TON:
-        return Network.TON
-    elif token_type == TokenType.SCOR:
-        return Network.TON
-    else:
+    try:
+        return NETWORKS_BY_TOKEN_TYPE[token_type]
+    except KeyError:
         raise NotImplementedError(f"No network known for {token_type}")
+
+
+def register_evm_chain(chain: EvmChain) -> None:
+    # Adds an EVM chain at runtime, with the same URL templates as the bundled ones. Its explorer is read from the
+    # environment by configs created afterwards, eg by `reload_default_config()`.
+    EVM_CHAINS.register(chain)
+    register_link_templates(
+        chain.network, EVM_LINK_TEMPLATES, flavour_matchers=EVM_FLAVOUR_MATCHERS
+    )
+    EXPLORER_BASE_PATHS[chain.network] = (chain.environment_variables, chain.base_path)
+    TOKEN_TYPES_BY_NETWORK[chain.network] = chain.token_type
+    NETWORKS_BY_TOKEN_TYPE[chain.token_type] = chain.network
+
+
+# Batch variants of the URL builders. The template is resolved once per batch rather than once per item, and each item
+# then only costs an identifier check and a string format. Results are in input order and match the per-item functions
+# exactly.
+
+
+def get_explorer_urls_for_accounts(
+    network: str,
+    addresses: Iterable[str],
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> List[Optional[str]]:
+    addresses = list(addresses)
+    if not any(addresses):
+        # Mirrors `get_explorer_url_for_account()`, which doesn't look at the network for empty addresses
+        for _ in addresses:
+            _record_empty_account(network, base_path, config)
+        return [None] * len(addresses)
+    template = get_link_template(network, LinkKind.ACCOUNT, base_path, config)
+    return [template.build(address) for address in addresses]
+
+
+def get_explorer_urls_for_tokens(
+    network: str,
+    tokens: Iterable[Tuple[str, Optional[str]]],
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> List[Optional[str]]:
+    # `tokens` holds (address, token_id) pairs, as would be passed to `get_explorer_url_for_token()`
+    template = get_link_template(network, LinkKind.TOKEN, base_path, config)
+    return [template.build(address, token_id) for address, token_id in tokens]
+
+
+def get_explorer_urls_for_transactions(
+    network: str,
+    transaction_hashes: Iterable[str],
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> List[str]:
+    template = get_link_template(network, LinkKind.TRANSACTION, base_path, config)
+    return [template.build(transaction_hash) for transaction_hash in transaction_hashes]
@@ -0,0 +1,256 @@
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .config import ALTERNATE_BASE_PATHS, ExplorerConfig
+from .link_health import LinkChecker, LinkHealth
+from .templates import compile_link_template
+from .types import LINK_KINDS
+
+LOGGER = logging.getLogger()
+
+# Picks between the explorers for each network by probing them in the background. Building a URL only reads the latest
+# snapshot of the results, so it never waits for a probe. To use it for every link:
+#   selector = ExplorerSelector.from_config(get_default_config())
+#   selector.start()
+#   set_default_config(get_default_config()._replace(explorer_selector=selector))
+
+
+class ExplorerHealth(NamedTuple):
+    base_path: str
+    # False while the circuit is open, ie after `failure_threshold` consecutive failures and until `cooldown` passes
+    healthy: bool = True
+    # Smoothed response time in seconds, or None before the first successful probe
+    latency: Optional[float] = None
+    consecutive_failures: int = 0
+    error: Optional[str] = None
+    last_checked: Optional[float] = None
+    open_until: Optional[float] = None
+
+
+class _Snapshot(NamedTuple):
+    health: Mapping[str, ExplorerHealth]
+    # The best base path by (network, kind), for `get_base_path()`
+    best: Mapping[Tuple[str, Optional[str]], str]
+
+
+def get_candidate_base_paths(config: ExplorerConfig) -> Dict[str, Tuple[str, ...]]:
+    # The configured explorer for each network, followed by the alternates known to work with our link templates
+    return {
+        network: tuple(
+            dict.fromkeys([base_path, *ALTERNATE_BASE_PATHS.get(network, ())])
+        )
+        for network, base_path in config.base_paths.items()
+    }
+
+
+def supports_kind(network: str, kind: str, base_path: str) -> bool:
+    # eg OpenSea has no transaction pages
+    try:
+        return compile_link_template(network, kind, base_path).error is None
+    except ValueError:
+        return False
+
+
+class ExplorerSelector:
+    def __init__(
+        self,
+        candidates: Mapping[str, Sequence[str]],
+        probe_interval: float = 60.0,
+        timeout: float = 5.0,
+        failure_threshold: int = 3,
+        cooldown: float = 300.0,
+        # Weight of the newest latency in the moving average
+        smoothing: float = 0.3,
+        # Latencies closer than this are treated as equal, so the preferred explorer keeps its place despite jitter
+        latency_resolution: float = 0.25,
+        probe: Optional[Callable[[Iterable[str]], Iterable[LinkHealth]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        # `candidates` are base paths in order of preference for each network
+        self.candidates = {
+            network: tuple(base_path.rstrip("/") for base_path in base_paths)
+            for network, base_paths in candidates.items()
+        }
+        self.probe_interval = probe_interval
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.latency_resolution = latency_resolution
+        self._clock = clock
+        self.timeout = timeout
+        # Made when first probing, and again after `stop()` closes it, so a selector can be started and stopped again
+        self._checker: Optional[LinkChecker] = None
+        self._probe = probe or self._probe_with_checker
+        self._probe_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._snapshot: _Snapshot = self._rank_all(
+            MappingProxyType(
+                {
+                    base_path: ExplorerHealth(base_path)
+                    for base_paths in self.candidates.values()
+                    for base_path in base_paths
+                }
+            )
+        )
+
+    @classmethod
+    def from_config(cls, config: ExplorerConfig, **kwargs) -> "ExplorerSelector":
+        return cls(get_candidate_base_paths(config), **kwargs)
+
+    def __enter__(self) -> "ExplorerSelector":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _probe_with_checker(self, base_paths: Iterable[str]) -> Iterable[LinkHealth]:
+        # Results are reported against the base path rather than the root page that was fetched. Only called while
+        # holding the probe lock.
+        if self._checker is None:
+            self._checker = LinkChecker(
+                workers=8,
+                connections_per_host=1,
+                requests_per_second_per_host=None,
+                retries=0,
+                timeout=self.timeout,
+            )
+        for result in self._checker.check_all(
+            f"{base_path}/" for base_path in base_paths
+        ):
+            yield result._replace(url=result.url[:-1])
+
+    def get_base_path(self, network: str, kind: Optional[str] = None) -> Optional[str]:
+        # The best explorer in the latest snapshot that can link to `kind`, or None for networks it doesn't manage.
+        # When every candidate is failing, the most preferred one that supports the kind is still returned.
+        return self._snapshot.best.get((network, kind))
+
+    def snapshot(self) -> Mapping[str, ExplorerHealth]:
+        # Health by base path, replaced as a whole after each round of probes
+        return self._snapshot.health
+
+    def ranked_base_paths(self, network: str) -> Tuple[str, ...]:
+        health = self._snapshot.health
+        return tuple(
+            sorted(
+                self.candidates.get(network, ()),
+                key=lambda base_path: self._rank(health[base_path]),
+            )
+        )
+
+    def _rank(self, health: ExplorerHealth) -> Tuple:
+        if health.latency is None:
+            latency_rank = float("inf")
+        else:
+            latency_rank = int(health.latency / self.latency_resolution)
+        return (not health.healthy, health.consecutive_failures > 0, latency_rank)
+
+    def _rank_all(self, health: Mapping[str, ExplorerHealth]) -> _Snapshot:
+        best = {}
+        for network, base_paths in self.candidates.items():
+            # `sorted()` is stable, so the configured order breaks ties
+            ranked = sorted(
+                base_paths, key=lambda base_path: self._rank(health[base_path])
+            )
+            for kind in [None, *LINK_KINDS]:
+                supporting = [
+                    base_path
+                    for base_path in ranked
+                    if kind is None or supports_kind(network, kind, base_path)
+                ]
+                if not supporting:
+                    continue
+                for base_path in supporting:
+                    if health[base_path].healthy:
+                        best[(network, kind)] = base_path
+                        break
+                else:
+                    # Nothing is healthy, so fall back to the configured order
+                    best[(network, kind)] = min(supporting, key=base_paths.index)
+        return _Snapshot(health, MappingProxyType(best))
+
+    def probe_all(self) -> Mapping[str, ExplorerHealth]:
+        # Probes every candidate whose circuit isn't open, and publishes a new snapshot
+        with self._probe_lock:
+            now = self._clock()
+            health = dict(self._snapshot.health)
+            due = [
+                base_path
+                for base_path, state in health.items()
+                if state.open_until is None or state.open_until <= now
+            ]
+            results = {result.url: result for result in self._probe(due)}
+            now = self._clock()
+            for base_path in due:
+                state = health[base_path]
+                result = results.get(base_path)
+                if result is not None and result.ok:
+                    latency = (
+                        result.elapsed
+                        if state.latency is None
+                        else self.smoothing * result.elapsed
+                        + (1 - self.smoothing) * state.latency
+                    )
+                    health[base_path] = ExplorerHealth(
+                        base_path, latency=latency, last_checked=now
+                    )
+                    continue
+                failures = state.consecutive_failures + 1
+                is_open = failures >= self.failure_threshold
+                if is_open and state.healthy:
+                    LOGGER.warning(
+                        "Avoiding %s for %ss after %s failures",
+                        base_path,
+                        self.cooldown,
+                        failures,
+                    )
+                health[base_path] = state._replace(
+                    healthy=not is_open,
+                    consecutive_failures=failures,
+                    error=result.error if result is not None else "Not probed",
+                    last_checked=now,
+                    open_until=now + self.cooldown if is_open else None,
+                )
+            # Health and the choices made from it are replaced together, in a single assignment, so readers never see
+            # one without the other
+            self._snapshot = self._rank_all(MappingProxyType(health))
+            return self._snapshot.health
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.probe_all()
+            except Exception:
+                LOGGER.exception("Probing explorers failed")
+            self._stop.wait(self.probe_interval)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="explorer-health", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._probe_lock:
+            if self._checker is not None:
+                self._checker.close()
+                self._checker = None
@@ -0,0 +1,277 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter_ns
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .config import get_default_config, set_default_config
+from .templates import PLACEHOLDER_PATH, CompiledTemplate, get_explorer_flavour
+from .types import ExplorerFlavour
+
+# Opt-in counters and latency histograms for building explorer URLs, keyed by function, network and explorer flavour.
+# Nothing is measured unless a config carries an `Instrumentation`, eg for the whole process:
+#   instrumentation = enable_instrumentation()
+#   ...
+#   print(instrumentation.export_prometheus())
+
+# Outcomes of building a URL
+OK = "ok"
+EMPTY = "empty"  # eg an account without an address, for which no URL is built
+PLACEHOLDER = "placeholder"  # A dead /not-implemented/ link, eg for SUI token wallets and TON tokens
+NOT_IMPLEMENTED = "not_implemented"
+INVALID = "invalid"  # A ValueError, eg for an identifier with a slash in it
+
+# Upper bounds of the latency buckets, in nanoseconds
+LATENCY_BUCKETS_NS = (500, 1_000, 2_500, 5_000, 10_000, 25_000, 100_000, 1_000_000)
+
+# (function, network, flavour)
+MetricKey = Tuple[str, str, str]
+
+
+class BuildEvent(NamedTuple):
+    function: str
+    network: str
+    flavour: str
+    outcome: str
+    duration_ns: int
+    url: Optional[str]
+
+
+class LatencyHistogram(NamedTuple):
+    # Counts per bucket of `LATENCY_BUCKETS_NS`, not cumulative, with a final bucket for anything slower
+    buckets: Tuple[int, ...]
+    sum_ns: int
+    count: int
+
+
+class InstrumentationSnapshot(NamedTuple):
+    # Keyed by (function, network, flavour, outcome)
+    counts: Dict[Tuple[str, str, str, str], int]
+    latencies: Dict[MetricKey, LatencyHistogram]
+
+
+class _ThreadStats:
+    # Only ever written by its own thread, so recording needs no lock
+    __slots__ = ("counts", "latencies")
+
+    def __init__(self):
+        self.counts: Dict[Tuple[str, str, str, str], int] = {}
+        # Bucket counts followed by the sum of durations
+        self.latencies: Dict[MetricKey, List[int]] = {}
+
+
+def get_function_name(kind: str) -> str:
+    # The `exploration` function that builds links of this kind, eg get_explorer_url_for_token_wallet
+    return "get_explorer_url_for_" + kind.replace("-", "_")
+
+
+def get_metric_key(network: str, kind: str, base_path: Optional[str]) -> MetricKey:
+    # Without a base path, eg for networks without an explorer, the flavour is the default
+    flavour = (
+        get_explorer_flavour(network, base_path.rstrip("/"))
+        if base_path
+        else ExplorerFlavour.DEFAULT
+    )
+    return get_function_name(kind), network, flavour
+
+
+class Instrumentation:
+    def __init__(self):
+        self._local = threading.local()
+        self._threads: List[_ThreadStats] = []
+        self._lock = threading.Lock()
+        self._templates: Dict[Tuple, "InstrumentedTemplate"] = {}
+        self.hooks: List[Callable[[BuildEvent], None]] = []
+
+    def add_hook(self, hook: Callable[[BuildEvent], None]) -> None:
+        # Called with a `BuildEvent` after every URL is built, or fails to be
+        self.hooks = [*self.hooks, hook]
+
+    def remove_hook(self, hook: Callable[[BuildEvent], None]) -> None:
+        self.hooks = [existing for existing in self.hooks if existing != hook]
+
+    def wrap(
+        self, network: str, kind: str, base_path: str, template: CompiledTemplate
+    ) -> "InstrumentedTemplate":
+        key = (network, kind, template)
+        instrumented = self._templates.get(key)
+        if instrumented is None:
+            instrumented = self._templates[key] = InstrumentedTemplate(
+                self, template, get_metric_key(network, kind, base_path)
+            )
+        return instrumented
+
+    def record_outcome(
+        self,
+        network: str,
+        kind: str,
+        base_path: Optional[str],
+        outcome: str,
+        duration_ns: int,
+        url: Optional[str] = None,
+    ) -> None:
+        # For outcomes decided without a template, eg accounts without an address
+        self.record(get_metric_key(network, kind, base_path), outcome, duration_ns, url)
+
+    def record_failure(
+        self,
+        network: str,
+        kind: str,
+        base_path: Optional[str],
+        error: Exception,
+        duration_ns: int,
+    ) -> None:
+        # For errors raised before there's a template, eg for unknown networks
+        outcome = NOT_IMPLEMENTED if isinstance(error, NotImplementedError) else INVALID
+        self.record_outcome(network, kind, base_path, outcome, duration_ns)
+
+    def _get_thread_stats(self) -> _ThreadStats:
+        try:
+            return self._local.stats
+        except AttributeError:
+            stats = self._local.stats = _ThreadStats()
+            with self._lock:
+                self._threads.append(stats)
+            return stats
+
+    def record(
+        self, key: MetricKey, outcome: str, duration_ns: int, url: Optional[str]
+    ) -> None:
+        stats = self._get_thread_stats()
+        count_key = (*key, outcome)
+        stats.counts[count_key] = stats.counts.get(count_key, 0) + 1
+        latencies = stats.latencies.get(key)
+        if latencies is None:
+            latencies = stats.latencies[key] = [0] * (len(LATENCY_BUCKETS_NS) + 2)
+        latencies[bisect_left(LATENCY_BUCKETS_NS, duration_ns)] += 1
+        latencies[-1] += duration_ns
+        for hook in self.hooks:
+            hook(BuildEvent(*key, outcome, duration_ns, url))
+
+    def snapshot(self) -> InstrumentationSnapshot:
+        # Totals across threads. Each thread's counters are copied whole, so they're consistent per thread, if not
+        # quite up to date with builds that are in progress.
+        with self._lock:
+            threads = list(self._threads)
+        counts: Dict[Tuple[str, str, str, str], int] = {}
+        totals: Dict[MetricKey, List[int]] = {}
+        for stats in threads:
+            for key, count in dict(stats.counts).items():
+                counts[key] = counts.get(key, 0) + count
+            for key, latencies in dict(stats.latencies).items():
+                total = totals.setdefault(key, [0] * len(latencies))
+                for index, value in enumerate(list(latencies)):
+                    total[index] += value
+        return InstrumentationSnapshot(
+            counts=counts,
+            latencies={
+                key: LatencyHistogram(
+                    buckets=tuple(total[:-1]), sum_ns=total[-1], count=sum(total[:-1])
+                )
+                for key, total in totals.items()
+            },
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._threads = []
+            self._local = threading.local()
+
+    def export_prometheus(self) -> str:
+        return format_prometheus(self.snapshot())
+
+
+class InstrumentedTemplate:
+    # Stands in for a `CompiledTemplate`, timing and counting each URL it builds
+    __slots__ = ("template", "_instrumentation", "_key", "_ok")
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        template: CompiledTemplate,
+        key: MetricKey,
+    ):
+        self.template = template
+        self._instrumentation = instrumentation
+        self._key = key
+        self._ok = PLACEHOLDER if template.is_placeholder else OK
+
+    def __getattr__(self, name: str):
+        return getattr(self.template, name)
+
+    def build(self, identifier: Optional[str], token_id=None) -> Optional[str]:
+        started = perf_counter_ns()
+        try:
+            url = self.template.build(identifier, token_id)
+        except NotImplementedError:
+            self._instrumentation.record(
+                self._key, NOT_IMPLEMENTED, perf_counter_ns() - started, None
+            )
+            raise
+        except ValueError:
+            self._instrumentation.record(
+                self._key, INVALID, perf_counter_ns() - started, None
+            )
+            raise
+        self._instrumentation.record(
+            self._key,
+            self._ok if url is not None else EMPTY,
+            perf_counter_ns() - started,
+            url,
+        )
+        return url
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(**labels: str) -> str:
+    return ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()
+    )
+
+
+def format_prometheus(snapshot: InstrumentationSnapshot) -> str:
+    # https://prometheus.io/docs/instrumenting/exposition_formats/#text-based-format
+    lines = [
+        "# HELP explorer_url_builds_total Explorer URLs built, by outcome",
+        "# TYPE explorer_url_builds_total counter",
+    ]
+    for (function, network, flavour, outcome), count in sorted(snapshot.counts.items()):
+        labels = _format_labels(
+            function=function, network=network, flavour=flavour, outcome=outcome
+        )
+        lines.append(f"explorer_url_builds_total{{{labels}}} {count}")
+    lines += [
+        "# HELP explorer_url_build_seconds Time taken to build explorer URLs",
+        "# TYPE explorer_url_build_seconds histogram",
+    ]
+    for (function, network, flavour), histogram in sorted(snapshot.latencies.items()):
+        labels = _format_labels(function=function, network=network, flavour=flavour)
+        cumulative = 0
+        for bound, count in zip(
+            [*(f"{bound / 1e9:g}" for bound in LATENCY_BUCKETS_NS), "+Inf"],
+            histogram.buckets,
+        ):
+            cumulative += count
+            lines.append(
+                f'explorer_url_build_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+            )
+        lines.append(
+            f"explorer_url_build_seconds_sum{{{labels}}} {histogram.sum_ns / 1e9!r}"
+        )
+        lines.append(f"explorer_url_build_seconds_count{{{labels}}} {histogram.count}")
+    return "\n".join(lines) + "\n"
+
+
+def enable_instrumentation(
+    instrumentation: Optional[Instrumentation] = None,
+) -> Instrumentation:
+    # Instruments every URL built with the default config
+    instrumentation = instrumentation or Instrumentation()
+    set_default_config(get_default_config()._replace(instrumentation=instrumentation))
+    return instrumentation
+
+
+def disable_instrumentation() -> None:
+    set_default_config(get_default_config()._replace(instrumentation=None))
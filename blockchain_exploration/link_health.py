@@ -0,0 +1,339 @@
+import http.client
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urljoin, urlsplit
+
+from .exploration import get_explorer_url
+from .types import LinkKind
+
+LOGGER = logging.getLogger()
+
+# Explorers that render client-side send a placeholder page, so all we can tell is that the URL resolved
+LOADING_JAVASCRIPT_TEXT = "without JavaScript enabled"
+
+# What an explorer page is expected to mention: transactions are listed for accounts, and hashes for the rest
+EXPECTED_TEXT_BY_KIND = {
+    LinkKind.ACCOUNT: "transaction",
+    LinkKind.TOKEN_WALLET: "hash",
+    LinkKind.NFT_CONTRACT: "hash",
+    LinkKind.TOKEN: "hash",
+    LinkKind.TRANSACTION: "hash",
+}
+
+DEFAULT_HEADERS = {"User-Agent": "Sweet.io link checker", "Accept": "application/json"}
+
+RETRIED_STATUSES = frozenset({429, 500, 502, 503, 504})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+def is_page_loading_javascript(text: str) -> bool:
+    return LOADING_JAVASCRIPT_TEXT in text
+
+
+def contains_expected_text(text: str, expected_text: str) -> bool:
+    return expected_text.lower() in text.lower()
+
+
+class LinkHealth(NamedTuple):
+    url: str
+    ok: bool
+    status: Optional[int] = None
+    error: Optional[str] = None
+    # Whether the page only said it needed JavaScript, so its content couldn't be checked
+    loading_javascript: bool = False
+    expected_text_found: Optional[bool] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+
+
+class HostConnectionPool:
+    # Idle keep-alive connections to a single scheme, host and port
+    def __init__(self, scheme: str, netloc: str, size: int, timeout: float):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self._idle: Deque[http.client.HTTPConnection] = deque()
+        self._size = size
+        self._lock = threading.Lock()
+
+    def acquire(self) -> http.client.HTTPConnection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def release(self, connection: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self._size:
+                    self._idle.append(connection)
+                    return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            while self._idle:
+                self._idle.pop().close()
+
+
+class HostRateLimiter:
+    # Spaces requests to one host evenly, without a background thread
+    def __init__(
+        self,
+        requests_per_second: Optional[float],
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._interval = 1 / requests_per_second if requests_per_second else 0.0
+        self._next = 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+class LinkChecker:
+    # Checks that explorer links resolve to a relevant page, using the same heuristics as the test suite
+    def __init__(
+        self,
+        workers: int = 16,
+        connections_per_host: int = 4,
+        requests_per_second_per_host: Optional[float] = 2.0,
+        retries: int = 2,
+        backoff: float = 0.5,
+        timeout: float = 10.0,
+        max_redirects: int = 5,
+        max_body_size: int = 2 * 1024 * 1024,
+        headers: Optional[Dict[str, str]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.workers = workers
+        self.connections_per_host = connections_per_host
+        self.requests_per_second_per_host = requests_per_second_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.max_body_size = max_body_size
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._sleep = sleep
+        self._hosts: Dict[
+            Tuple[str, str], Tuple[HostConnectionPool, HostRateLimiter]
+        ] = {}
+        self._hosts_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def __enter__(self) -> "LinkChecker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._hosts_lock:
+            for pool, _ in self._hosts.values():
+                pool.close()
+
+    def _get_host(self, scheme: str, netloc: str):
+        key = (scheme, netloc)
+        host = self._hosts.get(key)
+        if host is None:
+            with self._hosts_lock:
+                host = self._hosts.get(key)
+                if host is None:
+                    host = (
+                        HostConnectionPool(
+                            scheme,
+                            netloc,
+                            size=self.connections_per_host,
+                            timeout=self.timeout,
+                        ),
+                        HostRateLimiter(
+                            self.requests_per_second_per_host, sleep=self._sleep
+                        ),
+                    )
+                    self._hosts[key] = host
+        return host
+
+    def _request(self, url: str) -> Tuple[int, Dict[str, str], str]:
+        parts = urlsplit(url)
+        pool, rate_limiter = self._get_host(parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        rate_limiter.wait()
+        connection = pool.acquire()
+        reusable = False
+        try:
+            connection.request("GET", path, headers=self.headers)
+            response = connection.getresponse()
+            body = response.read(self.max_body_size)
+            # Anything left unread would corrupt the next response on this connection
+            reusable = not response.will_close and response.isclosed()
+            charset = response.headers.get_content_charset() or "utf-8"
+            try:
+                text = body.decode(charset, errors="replace")
+            except LookupError:
+                # A charset Python doesn't know, eg a typo
+                text = body.decode("utf-8", errors="replace")
+            return (
+                response.status,
+                {key.lower(): value for key, value in response.getheaders()},
+                text,
+            )
+        finally:
+            pool.release(connection, reusable=reusable)
+
+    def _get_retry_delay(self, attempt: int, headers: Dict[str, str]) -> float:
+        retry_after = headers.get("retry-after", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * 2**attempt
+
+    def check(self, url: str, expected_text: Optional[str] = None) -> LinkHealth:
+        started = time.monotonic()
+        attempt = 0
+        redirects = 0
+        current_url = url
+        while True:
+            attempt += 1
+            try:
+                status, headers, text = self._request(current_url)
+            except (OSError, http.client.HTTPException) as error:
+                if attempt > self.retries:
+                    return LinkHealth(
+                        url=url,
+                        ok=False,
+                        error=f"{type(error).__name__}: {error}",
+                        attempts=attempt,
+                        elapsed=time.monotonic() - started,
+                    )
+                self._sleep(self.backoff * 2 ** (attempt - 1))
+                continue
+            if status in REDIRECT_STATUSES and "location" in headers:
+                redirects += 1
+                if redirects > self.max_redirects:
+                    return LinkHealth(
+                        url=url,
+                        ok=False,
+                        status=status,
+                        error="Too many redirects",
+                        attempts=attempt,
+                        elapsed=time.monotonic() - started,
+                    )
+                current_url = urljoin(current_url, headers["location"])
+                attempt -= 1  # Following a redirect isn't a retry
+                continue
+            if status in RETRIED_STATUSES and attempt <= self.retries:
+                self._sleep(self._get_retry_delay(attempt - 1, headers))
+                continue
+            break
+        elapsed = time.monotonic() - started
+        if not 200 <= status < 300:
+            return LinkHealth(
+                url=url,
+                ok=False,
+                status=status,
+                error=f"HTTP {status}",
+                attempts=attempt,
+                elapsed=elapsed,
+            )
+        if not text:
+            return LinkHealth(
+                url=url,
+                ok=False,
+                status=status,
+                error="Empty response",
+                attempts=attempt,
+                elapsed=elapsed,
+            )
+        if is_page_loading_javascript(text):
+            return LinkHealth(
+                url=url,
+                ok=True,
+                status=status,
+                loading_javascript=True,
+                attempts=attempt,
+                elapsed=elapsed,
+            )
+        found = (
+            None
+            if expected_text is None
+            else contains_expected_text(text, expected_text)
+        )
+        return LinkHealth(
+            url=url,
+            ok=found is not False,
+            status=status,
+            error=(
+                None
+                if found is not False
+                else f"Expected text not found: {expected_text}"
+            ),
+            expected_text_found=found,
+            attempts=attempt,
+            elapsed=elapsed,
+        )
+
+    def check_all(
+        self, links: Iterable[Union[str, Tuple[str, Optional[str]]]]
+    ) -> Iterator[LinkHealth]:
+        # Takes URLs or (URL, expected text) pairs, and yields results as they complete. At most two links per worker
+        # are in flight, so arbitrarily long iterables can be checked.
+        pending = set()
+        for link in links:
+            url, expected_text = (link, None) if isinstance(link, str) else link
+            pending.add(self._executor.submit(self.check, url, expected_text))
+            if len(pending) >= self.workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def iter_explorer_links(
+    entities: Iterable[Tuple[str, str, str, Optional[str]]],
+) -> Iterator[Tuple[str, str]]:
+    # Builds (URL, expected text) pairs for `LinkChecker.check_all()` from (network, kind, identifier, token_id) rows,
+    # skipping entities that explorers can't link to
+    for network, kind, identifier, token_id in entities:
+        try:
+            url = get_explorer_url(
+                network=network, kind=kind, identifier=identifier, token_id=token_id
+            )
+        except (NotImplementedError, ValueError) as error:
+            LOGGER.warning(
+                "No %s link can be checked for %s: %s", kind, identifier, error
+            )
+            continue
+        if url:
+            yield url, EXPECTED_TEXT_BY_KIND[kind]
@@ -0,0 +1,226 @@
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .config import (
+    ALTERNATE_BASE_PATHS,
+    EXPLORER_BASE_PATHS,
+    ExplorerConfig,
+    get_current_config,
+)
+from .templates import (
+    LINK_TEMPLATES,
+    compile_link_template,
+    get_registration_count,
+    is_valid_identifier,
+)
+from .types import LinkKind
+
+# Characters that can't be in a token ID taken from a query string, as they'd have been part of another parameter
+_QUERY_DELIMITERS = ("&", "=")
+
+# Where several kinds of link share a URL (eg Tezos accounts and contracts), the first of these wins
+KIND_PRIORITY = (
+    LinkKind.ACCOUNT,
+    LinkKind.TOKEN_WALLET,
+    LinkKind.NFT_CONTRACT,
+    LinkKind.TOKEN,
+    LinkKind.TRANSACTION,
+)
+
+
+class ParsedExplorerUrl(NamedTuple):
+    # Passing these back to the `get_explorer_url_for_*()` function for the kind rebuilds the same URL
+    network: str
+    kind: str
+    identifier: Optional[str]
+    token_id: Optional[str]
+    base_path: str
+
+
+class _IndexEntry(NamedTuple):
+    network: str
+    kind: str
+    base_path: str
+    infix: str
+    suffix: str
+    uses_identifier: bool
+    uses_token_id: bool
+
+
+def _iter_path_variants(rest: str) -> Iterator[str]:
+    # The path as given, then with its trailing slash toggled, with each of its query parameters alone, and without any
+    # query string, for links that were copied with a slash added or dropped, or with tracking parameters
+    yield rest
+    path, hash_mark, fragment = rest.partition("#")
+    path, question_mark, query = path.partition("?")
+    fragment = hash_mark + fragment
+    toggled = path[:-1] if path.endswith("/") else path + "/"
+    if question_mark:
+        yield toggled + question_mark + query + fragment
+        if "&" in query:
+            for parameter in query.split("&"):
+                yield path + question_mark + parameter + fragment
+                yield toggled + question_mark + parameter + fragment
+        yield path + fragment
+    yield toggled + fragment
+
+
+def _split_origin(url: str) -> Optional[Tuple[str, str]]:
+    # ("host:port", "/path?query#fragment"), ignoring the scheme so http and https URLs are treated alike
+    scheme_end = url.find("://")
+    if scheme_end < 0:
+        return None
+    path_start = url.find("/", scheme_end + 3)
+    if path_start < 0:
+        return url[scheme_end + 3 :].lower(), ""
+    return url[scheme_end + 3 : path_start].lower(), url[path_start:]
+
+
+class ExplorerUrlIndex:
+    # Explorer URL layouts indexed by host, then by the literal text in front of the first identifier, so parsing a URL
+    # takes a dictionary lookup per distinct prefix length on its host rather than trying every template
+    def __init__(self, base_paths_by_network: Dict[str, Iterable[str]]):
+        entries_by_host: Dict[str, Dict[str, List[_IndexEntry]]] = {}
+        for network, base_paths in base_paths_by_network.items():
+            for base_path in dict.fromkeys(base_paths):
+                for priority, kind in enumerate(KIND_PRIORITY):
+                    try:
+                        template = compile_link_template(network, kind, base_path)
+                    except ValueError:
+                        continue  # An unusable base path
+                    if template.error is not None or not (
+                        template.uses_identifier or template.uses_token_id
+                    ):
+                        continue  # Unsupported, or a placeholder like /not-implemented/
+                    origin = _split_origin(template.prefix)
+                    if origin is None:
+                        continue
+                    host, prefix = origin
+                    entry = _IndexEntry(
+                        network=network,
+                        kind=kind,
+                        base_path=base_path.rstrip("/"),
+                        infix=template.infix,
+                        suffix=template.suffix,
+                        uses_identifier=template.uses_identifier,
+                        uses_token_id=template.uses_token_id,
+                    )
+                    entries_by_host.setdefault(host, {}).setdefault(prefix, []).append(
+                        (-len(template.infix) - len(template.suffix), priority, entry)
+                    )
+        self._hosts: Dict[str, Tuple[Tuple[int, ...], Dict[str, Tuple]]] = {}
+        for host, entries_by_prefix in entries_by_host.items():
+            # Longer layouts first, so eg a token wallet isn't mistaken for an account with "#tokens" in its address
+            entries_by_prefix = {
+                prefix: tuple(
+                    entry for *_, entry in sorted(entries, key=lambda item: item[:2])
+                )
+                for prefix, entries in entries_by_prefix.items()
+            }
+            prefix_lengths = tuple(
+                sorted({len(prefix) for prefix in entries_by_prefix}, reverse=True)
+            )
+            self._hosts[host] = (prefix_lengths, entries_by_prefix)
+
+    @classmethod
+    def from_config(cls, config: ExplorerConfig) -> "ExplorerUrlIndex":
+        # Every network with link templates, on its configured, default and alternate explorers
+        networks = dict.fromkeys(network for network, _, _ in LINK_TEMPLATES)
+        base_paths_by_network = {}
+        for network in networks:
+            base_paths = []
+            if network in config.base_paths:
+                base_paths.append(config.base_paths[network])
+            if network in EXPLORER_BASE_PATHS:
+                base_paths.append(EXPLORER_BASE_PATHS[network][1])
+            base_paths.extend(ALTERNATE_BASE_PATHS.get(network, ()))
+            base_paths_by_network[network] = base_paths
+        return cls(base_paths_by_network)
+
+    def parse(self, url: str) -> Optional[ParsedExplorerUrl]:
+        origin = _split_origin(url.strip())
+        if origin is None:
+            return None
+        host, rest = origin
+        indexed = self._hosts.get(host)
+        if indexed is None:
+            return None
+        for variant in _iter_path_variants(rest):
+            parsed = self._parse_path(indexed, variant)
+            if parsed is not None:
+                return parsed
+        return None
+
+    @staticmethod
+    def _parse_path(
+        indexed: Tuple[Tuple[int, ...], Dict[str, Tuple]], rest: str
+    ) -> Optional[ParsedExplorerUrl]:
+        prefix_lengths, entries_by_prefix = indexed
+        for prefix_length in prefix_lengths:
+            entries = entries_by_prefix.get(rest[:prefix_length])
+            if entries is None:
+                continue
+            for entry in entries:
+                if not rest.endswith(entry.suffix):
+                    continue
+                middle = rest[prefix_length : len(rest) - len(entry.suffix)]
+                identifier = token_id = None
+                if entry.uses_identifier and entry.uses_token_id:
+                    identifier, separator, token_id = middle.partition(entry.infix)
+                    if not separator:
+                        continue
+                elif entry.uses_identifier:
+                    identifier = middle
+                else:
+                    token_id = middle
+                if identifier is not None and not is_valid_identifier(identifier):
+                    continue
+                if token_id is not None and (
+                    not is_valid_identifier(token_id)
+                    or any(character in token_id for character in _QUERY_DELIMITERS)
+                ):
+                    # Eg "1&b=2" from "?a=1&b=2", which the variants with a single parameter parse instead
+                    continue
+                return ParsedExplorerUrl(
+                    network=entry.network,
+                    kind=entry.kind,
+                    identifier=identifier,
+                    token_id=token_id,
+                    base_path=entry.base_path,
+                )
+        return None
+
+
+# Indexes for the most recently used configs, by identity. The configs are kept too, so their IDs can't be reused, and
+# so is the registration count they were built at, so networks registered since are picked up.
+_index_cache: Dict[int, Tuple[ExplorerConfig, int, ExplorerUrlIndex]] = {}
+_INDEX_CACHE_SIZE = 16
+
+
+def get_explorer_url_index(config: Optional[ExplorerConfig] = None) -> ExplorerUrlIndex:
+    config = config or get_current_config()
+    registrations = get_registration_count()
+    cached = _index_cache.get(id(config))
+    if cached is not None and cached[1] == registrations:
+        return cached[2]
+    index = ExplorerUrlIndex.from_config(config)
+    while len(_index_cache) >= _INDEX_CACHE_SIZE:
+        try:
+            del _index_cache[next(iter(_index_cache))]
+        except (KeyError, RuntimeError, StopIteration):
+            break  # Another thread evicted it first
+    _index_cache[id(config)] = (config, registrations, index)
+    return index
+
+
+def parse_explorer_url(
+    url: str, config: Optional[ExplorerConfig] = None
+) -> Optional[ParsedExplorerUrl]:
+    # Returns None for URLs that aren't links to an explorer we know about
+    return get_explorer_url_index(config).parse(url)
+
+
+def parse_explorer_urls(
+    urls: Iterable[str], config: Optional[ExplorerConfig] = None
+) -> List[Optional[ParsedExplorerUrl]]:
+    parse = get_explorer_url_index(config).parse
+    return [parse(url) for url in urls]
@@ -0,0 +1,178 @@
+import html
+from functools import lru_cache
+from typing import IO, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from .config import ExplorerConfig
+from .exploration import get_link_template
+from .templates import CompiledTemplate
+from .types import LinkKind
+
+# Renders explorer links as HTML anchors or Markdown links, eg for notification emails and admin pages:
+#   render_explorer_links(Network.MATIC, LinkKind.TRANSACTION, hashes, label=get_label_for_network(Network.MATIC))
+# The escaped pieces of each template and label are cached, so each link only costs escaping its identifiers, which
+# are usually alphanumeric and need none.
+
+HTML = "html"
+MARKDOWN = "markdown"
+
+# How many links to collect before writing them to the output in one go
+_FLUSH_SIZE = 4096
+
+_MARKDOWN_LABEL_ESCAPES = str.maketrans(
+    {character: "\\" + character for character in "\\`*_[]<>"}
+)
+_MARKDOWN_URL_ESCAPES = str.maketrans({"(": "%28", ")": "%29", " ": "%20"})
+
+
+def _escape_markdown_label(text: str) -> str:
+    return text.translate(_MARKDOWN_LABEL_ESCAPES)
+
+
+def _escape_markdown_url(text: str) -> str:
+    return text.translate(_MARKDOWN_URL_ESCAPES)
+
+
+_LABEL_ESCAPERS = {HTML: html.escape, MARKDOWN: _escape_markdown_label}
+_URL_ESCAPERS = {HTML: html.escape, MARKDOWN: _escape_markdown_url}
+
+
+@lru_cache(maxsize=1024)
+def escape_label(label: str, format: str = HTML) -> str:
+    # Labels like network names and currencies repeat, so they're only escaped once
+    try:
+        return _LABEL_ESCAPERS[format](label)
+    except KeyError:
+        raise ValueError(f"Unknown link format: {format}")
+
+
+class CompiledAnchor(NamedTuple):
+    # The escaped markup around a link's identifiers and label. HTML anchors are
+    # `head + identifier + infix + token_id + tail + label + close`, and Markdown links
+    # `head + label + tail + identifier + infix + token_id + close`.
+    head: str
+    infix: str
+    tail: str
+    close: str
+
+
+@lru_cache(maxsize=1024)
+def compile_anchor(
+    template: CompiledTemplate,
+    format: str = HTML,
+    attributes: Tuple[Tuple[str, str], ...] = (),
+) -> CompiledAnchor:
+    escape = _URL_ESCAPERS.get(format)
+    if escape is None:
+        raise ValueError(f"Unknown link format: {format}")
+    if format == MARKDOWN:
+        return CompiledAnchor(
+            head="[",
+            infix=escape(template.infix),
+            tail="](" + escape(template.prefix),
+            close=escape(template.suffix) + ")",
+        )
+    extra = "".join(
+        f' {html.escape(name)}="{html.escape(value)}"' for name, value in attributes
+    )
+    return CompiledAnchor(
+        head='<a href="' + escape(template.prefix),
+        infix=escape(template.infix),
+        tail=escape(template.suffix) + '"' + extra + ">",
+        close="</a>",
+    )
+
+
+def render_explorer_links(
+    network: str,
+    kind: str,
+    entities: Iterable[Union[str, Tuple[str, Optional[str]]]],
+    format: str = HTML,
+    label: Optional[str] = None,
+    separator: str = "\n",
+    attributes: Optional[Mapping[str, str]] = None,
+    output: Optional[IO[str]] = None,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> Optional[str]:
+    # `entities` are identifiers, or (address, token_id) pairs for tokens. Each link is labelled with `label`, or its
+    # identifier by default, and `attributes` are added to HTML anchors, eg {"target": "_blank"}. Accounts without an
+    # address are rendered as their label alone. The links are written to `output` if given, and returned otherwise.
+    template = get_link_template(network, kind, base_path, config)
+    if template.error is not None:
+        raise NotImplementedError(template.error)
+    anchor = compile_anchor(
+        template, format, tuple(attributes.items()) if attributes else ()
+    )
+    escape_url = _URL_ESCAPERS[format]
+    fixed_label = None if label is None else escape_label(label, format)
+    head, infix, tail, close = anchor
+    markdown = format == MARKDOWN
+    pairs = kind == LinkKind.TOKEN
+    nullable = template.nullable
+    # Links are put together from the escaped pieces of the template rather than from built URLs, but strict mode checks
+    # every URL built, and templates wrapped by instrumentation or a URL cache count and cache each link's URL just like
+    # `get_explorer_url` does
+    build = (
+        template.build
+        if template.strict_validation or type(template) is not CompiledTemplate
+        else None
+    )
+    clean_identifiers = template.clean_identifiers
+    links: List[str] = []
+    append = links.append
+    written = False
+    for entity in entities:
+        identifier, token_id = entity if pairs else (entity, None)
+        if nullable and not identifier:
+            append(fixed_label or "")
+            continue
+        if build is not None:
+            build(identifier, token_id)
+        identifier, token_id = clean_identifiers(identifier, token_id)
+        if fixed_label is None:
+            text = identifier or token_id
+            item_label = text if text.isalnum() else escape_label(text, format)
+        else:
+            item_label = fixed_label
+        if not identifier.isalnum():
+            identifier = escape_url(identifier)
+        if token_id and not token_id.isalnum():
+            token_id = escape_url(token_id)
+        # A single f-string builds each link without intermediate strings
+        if markdown:
+            append(f"{head}{item_label}{tail}{identifier}{infix}{token_id}{close}")
+        else:
+            append(f"{head}{identifier}{infix}{token_id}{tail}{item_label}{close}")
+        if output is not None and len(links) >= _FLUSH_SIZE:
+            output.write((separator if written else "") + separator.join(links))
+            written = True
+            links.clear()
+    if output is None:
+        return separator.join(links)
+    if links:
+        output.write((separator if written else "") + separator.join(links))
+    return None
+
+
+def render_explorer_link(
+    network: str,
+    kind: str,
+    identifier: str,
+    token_id: Optional[str] = None,
+    format: str = HTML,
+    label: Optional[str] = None,
+    attributes: Optional[Mapping[str, str]] = None,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> str:
+    entity = (identifier, token_id) if kind == LinkKind.TOKEN else identifier
+    return render_explorer_links(
+        network,
+        kind,
+        [entity],
+        format=format,
+        label=label,
+        attributes=attributes,
+        base_path=base_path,
+        config=config,
+    )
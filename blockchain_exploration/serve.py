@@ -0,0 +1,385 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from .exploration import (
+    get_explorer_url,
+    get_network_by_token_type,
+    get_token_type_by_network,
+)
+
+# A small HTTP service over the URL builders, for services in other languages, using only the standard library:
+#   python -m blockchain_exploration.serve --port 8080
+#
+#   GET /go/<network>/<kind>/<identifier>[/<token_id>]  redirects to the explorer
+#   POST /links  takes a JSON list of calls and answers with a result for each, in order:
+#     [{"network": "matic", "kind": "token", "identifier": "0x30…", "token_id": "3191"},
+#      {"function": "get_token_type_by_network", "network": "matic"},
+#      {"function": "get_network_by_token_type", "token_type": "erc721-matic"}]
+#     -> {"results": [{"result": "https://polygonscan.com/token/0x30…/?a=3191"}, {"result": "erc721-matic"},
+#                     {"result": "matic"}]}
+#   Failed calls get {"error": "NotImplementedError", "message": "…"} instead, like rows of the command line.
+#   Identifiers must be strings, and token IDs strings or integers. Links are always to the configured explorers.
+# Connections are kept alive between requests. At most `concurrency` requests are handled at once; others wait.
+
+LOGGER = logging.getLogger()
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_MAX_BATCH = 10_000
+MAX_BODY_SIZE = 4 * 1024 * 1024
+MAX_HEADER_SIZE = 16 * 1024
+# Seconds an idle keep-alive connection is held open
+KEEP_ALIVE_TIMEOUT = 15.0
+# Seconds allowed for a request's body to arrive, and for its response to be sent
+REQUEST_TIMEOUT = 30.0
+
+# Characters left as they are in Location headers
+LOCATION_SAFE_CHARACTERS = ":/?#[]@!$&'()*+,;=%"
+
+GET_EXPLORER_URL = "get_explorer_url"
+GET_TOKEN_TYPE_BY_NETWORK = "get_token_type_by_network"
+GET_NETWORK_BY_TOKEN_TYPE = "get_network_by_token_type"
+
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def call(request: Dict[str, Any]) -> Dict[str, str]:
+    # One call of a batch, defaulting to `get_explorer_url()`
+    try:
+        function = request.get("function", GET_EXPLORER_URL)
+        if function == GET_EXPLORER_URL:
+            network, kind = request["network"], request["kind"]
+            if "base_path" in request:
+                # Links only ever point at the configured explorers, so the service can't be used to vouch for others
+                raise ValueError("Calls can't choose their own base_path")
+            identifier = request.get("identifier")
+            token_id = request.get("token_id")
+            if not isinstance(identifier, str):
+                raise ValueError(f"The identifier must be a string: {identifier!r}")
+            if not (
+                token_id is None
+                or isinstance(token_id, str)
+                or (isinstance(token_id, int) and not isinstance(token_id, bool))
+            ):
+                raise ValueError(
+                    f"The token ID must be a string or an integer: {token_id!r}"
+                )
+            result = get_explorer_url(
+                network=network,
+                kind=kind,
+                identifier=identifier,
+                token_id=token_id,
+            )
+        elif function == GET_TOKEN_TYPE_BY_NETWORK:
+            result = get_token_type_by_network(request["network"])
+        elif function == GET_NETWORK_BY_TOKEN_TYPE:
+            result = get_network_by_token_type(request["token_type"])
+        else:
+            raise ValueError(f"Unknown function: {function}")
+    except KeyError as error:
+        return {"error": "KeyError", "message": f"Missing field {error}"}
+    except (NotImplementedError, ValueError) as error:
+        return {"error": type(error).__name__, "message": str(error)}
+    except (AttributeError, TypeError):
+        # Eg a call that isn't an object, or an identifier that isn't a string
+        return {"error": "ValueError", "message": f"Invalid call: {request!r}"}
+    return {"result": result}
+
+
+def call_all(body: bytes, max_batch: int) -> List[Dict[str, str]]:
+    try:
+        requests = json.loads(body)
+    except ValueError as error:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {error}")
+    except RecursionError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "The JSON is nested too deeply")
+    if not isinstance(requests, list):
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Expected a JSON list of calls")
+    if len(requests) > max_batch:
+        raise HttpError(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            f"At most {max_batch} calls can be made at once",
+        )
+    return [call(request) for request in requests]
+
+
+def redirect(path: str, query: str) -> str:
+    # /go/<network>/<kind>/<identifier>[/<token_id>], or the token ID as ?token_id=
+    segments = [unquote(segment) for segment in path.split("/")[2:]]
+    if len(segments) not in (3, 4):
+        raise HttpError(
+            HTTPStatus.NOT_FOUND,
+            "Expected /go/<network>/<kind>/<identifier>[/<token_id>]",
+        )
+    network, kind, identifier = segments[:3]
+    token_id = segments[3] if len(segments) == 4 else None
+    if token_id is None and query:
+        token_id = parse_qs(query).get("token_id", [None])[0]
+    try:
+        url = get_explorer_url(
+            network=network, kind=kind, identifier=identifier, token_id=token_id
+        )
+    except NotImplementedError as error:
+        raise HttpError(HTTPStatus.NOT_FOUND, str(error))
+    except ValueError as error:
+        raise HttpError(HTTPStatus.BAD_REQUEST, str(error))
+    if not url:
+        raise HttpError(
+            HTTPStatus.NOT_FOUND, "No explorer link for an empty identifier"
+        )
+    # Location must be ASCII, so other characters in identifiers, eg "€" or "é", are percent-encoded, leaving the
+    # URL's own delimiters and existing escapes alone
+    return quote(url, safe=LOCATION_SAFE_CHARACTERS)
+
+
+class Request:
+    __slots__ = ("method", "target", "version", "headers", "content_length", "body")
+
+    def __init__(self, method: str, target: str, version: str, headers: Dict[str, str]):
+        self.method = method
+        self.target = target
+        self.version = version
+        self.headers = headers
+        self.content_length = 0
+        self.body = b""
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+async def read_request_head(reader: asyncio.StreamReader) -> Optional[Request]:
+    # The request line and headers, or None once the client has closed the connection between requests
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as error:
+        if error.partial.strip():
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Incomplete request")
+        return None
+    except asyncio.LimitOverrunError:
+        raise HttpError(
+            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "The headers are too large"
+        )
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid request line")
+    if version not in ("HTTP/1.0", "HTTP/1.1"):
+        raise HttpError(
+            HTTPStatus.HTTP_VERSION_NOT_SUPPORTED, f"Unsupported version: {version}"
+        )
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    request = Request(method, target, version, headers)
+    if "transfer-encoding" in headers:
+        raise HttpError(
+            HTTPStatus.NOT_IMPLEMENTED, "Chunked bodies aren't supported; send a length"
+        )
+    length = headers.get("content-length", "0")
+    if not length.isdigit():
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+    request.content_length = int(length)
+    if request.content_length > MAX_BODY_SIZE:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "The body is too large")
+    return request
+
+
+async def read_request_body(reader: asyncio.StreamReader, request: Request) -> None:
+    if request.content_length:
+        try:
+            request.body = await reader.readexactly(request.content_length)
+        except asyncio.IncompleteReadError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Incomplete body")
+
+
+def format_response(
+    status: HTTPStatus,
+    body: bytes = b"",
+    keep_alive: bool = True,
+    headers: Sequence[Tuple[str, str]] = (),
+) -> bytes:
+    head = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        *(f"{name}: {value}" for name, value in headers),
+    ]
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+def format_json_response(
+    status: HTTPStatus, data: Any, keep_alive: bool = True
+) -> bytes:
+    return format_response(
+        status,
+        json.dumps(data, separators=(",", ":")).encode(),
+        keep_alive,
+        [("Content-Type", "application/json")],
+    )
+
+
+class LinkServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        keep_alive_timeout: float = KEEP_ALIVE_TIMEOUT,
+        request_timeout: float = REQUEST_TIMEOUT,
+    ):
+        if concurrency <= 0:
+            raise ValueError(
+                f"At least one request must be handled at once: {concurrency}"
+            )
+        self.host = host
+        self.port = port
+        self.concurrency = concurrency
+        self.max_batch = max_batch
+        self.keep_alive_timeout = keep_alive_timeout
+        self.request_timeout = request_timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def start(self) -> None:
+        # Port 0 picks a free port, which is then available as `port`
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_HEADER_SIZE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        LOGGER.info("Serving explorer links on http://%s:%s", self.host, self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def respond(self, request: Request) -> bytes:
+        parts = urlsplit(request.target)
+        keep_alive = request.keep_alive
+        try:
+            if parts.path.startswith("/go/"):
+                if request.method not in ("GET", "HEAD"):
+                    raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+                url = redirect(parts.path, parts.query)
+                return format_response(
+                    HTTPStatus.FOUND, keep_alive=keep_alive, headers=[("Location", url)]
+                )
+            if parts.path == "/links":
+                if request.method != "POST":
+                    raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+                results = call_all(request.body, self.max_batch)
+                return format_json_response(
+                    HTTPStatus.OK, {"results": results}, keep_alive
+                )
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Not found: {parts.path}")
+        except HttpError as error:
+            return format_json_response(error.status, {"error": str(error)}, keep_alive)
+        except Exception:
+            # A bug, but the client still gets an answer rather than a dropped connection
+            LOGGER.exception(
+                "Failed to respond to %s %s", request.method, request.target
+            )
+            return format_json_response(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": "Internal server error"},
+                keep_alive=False,
+            )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        read_request_head(reader), self.keep_alive_timeout
+                    )
+                    if request is None:
+                        return
+                    # Bodies are read before taking a slot, so slow clients can't hold one while they trickle theirs in,
+                    # and each step is timed out so they can't keep the connection either
+                    await asyncio.wait_for(
+                        read_request_body(reader, request), self.request_timeout
+                    )
+                    # Requests hold a slot until their response has been sent, which bounds memory use as well as work
+                    async with self._semaphore:
+                        writer.write(self.respond(request))
+                        await asyncio.wait_for(writer.drain(), self.request_timeout)
+                except HttpError as error:
+                    # The rest of the stream can't be trusted after a malformed request
+                    writer.write(
+                        format_json_response(
+                            error.status, {"error": str(error)}, keep_alive=False
+                        )
+                    )
+                    await asyncio.wait_for(writer.drain(), self.request_timeout)
+                    return
+                if not request.keep_alive:
+                    return
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m blockchain_exploration.serve",
+        description="Serve explorer links over HTTP",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Requests handled at once; others wait",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        help="Calls allowed in one request to /links",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    server = LinkServer(
+        args.host, args.port, concurrency=args.concurrency, max_batch=args.max_batch
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
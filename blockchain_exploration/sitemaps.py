@@ -0,0 +1,229 @@
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+from typing import IO, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from .cli import iter_chunk_results, positive_int
+from .exploration import (
+    get_explorer_url_for_nft_contract,
+    get_explorer_url_for_token,
+    is_token_url_supported,
+)
+from .templates import PLACEHOLDER_PATH
+
+# Writes sitemaps of the explorer pages for minted tokens, and their contracts, from a stream of records:
+#   write_sitemaps(records, "public/sitemaps", "https://example.com/sitemaps", workers=4)
+# Records are (network, contract, token_id), with a token ID of None to list just the contract. URLs are built in
+# chunks across processes and written in input order, so the same records always give byte-identical files (gzip's
+# timestamp is zeroed), and memory use is constant. Each contract is listed once per run of consecutive records for it,
+# so sort by contract to list each exactly once. Tokens are only listed where the explorer has pages for them.
+# https://www.sitemaps.org/protocol.html
+
+MAX_URLS_PER_SITEMAP = 50_000
+# Uncompressed, less the closing tag
+MAX_BYTES_PER_SITEMAP = 50 * 1024 * 1024 - 16
+
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_FOOTER = "</urlset>\n"
+INDEX_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+INDEX_FOOTER = "</sitemapindex>\n"
+INDEX_FILENAME = "sitemap-index.xml"
+
+# Sitemaps must escape these as entities
+_ENTITIES = {'"': "&quot;", "'": "&apos;"}
+
+Record = Tuple[str, str, Optional[str]]
+# (contract URL, token URL, error) for each record, the URLs as <url> elements
+EntryResult = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class SitemapSummary(NamedTuple):
+    sitemaps: Tuple[str, ...]  # Filenames, in order
+    url_count: int
+    failures: int
+
+
+def _format_entry(url: Optional[str]) -> Optional[str]:
+    # Dead placeholder links, eg for TON tokens, don't belong in sitemaps
+    if url is None or PLACEHOLDER_PATH in url:
+        return None
+    return f"<url><loc>{escape(url, _ENTITIES)}</loc></url>\n"
+
+
+def build_sitemap_entries(records: List[Record]) -> List[EntryResult]:
+    results = []
+    for network, contract, token_id in records:
+        try:
+            contract_url = get_explorer_url_for_nft_contract(network, contract)
+            token_url = None
+            if token_id is not None and is_token_url_supported(network):
+                token_url = get_explorer_url_for_token(network, contract, token_id)
+                # Explorers without token pages link to the contract instead, which is already listed
+                if token_url == contract_url:
+                    token_url = None
+            results.append(
+                (_format_entry(contract_url), _format_entry(token_url), None)
+            )
+        except (NotImplementedError, ValueError) as error:
+            results.append((None, None, f"{type(error).__name__}: {error}"))
+    return results
+
+
+class _SitemapWriter:
+    def __init__(self, directory: str, prefix: str, max_urls: int):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_urls = max_urls
+        self.filenames: List[str] = []
+        self._file: Optional[IO[str]] = None
+        self._urls = 0
+        self._bytes = 0
+
+    def write(self, entry: str) -> None:
+        size = len(entry.encode())
+        if (
+            self._file is None
+            or self._urls >= self.max_urls
+            or self._bytes + size > MAX_BYTES_PER_SITEMAP
+        ):
+            self._open()
+        self._file.write(entry)
+        self._urls += 1
+        self._bytes += size
+
+    def _open(self) -> None:
+        self.close()
+        filename = f"{self.prefix}-{len(self.filenames) + 1:05d}.xml.gz"
+        self.filenames.append(filename)
+        # No filename or timestamp in the gzip header, so the output only depends on the records
+        binary = gzip.GzipFile(
+            filename="",
+            mode="wb",
+            fileobj=open(os.path.join(self.directory, filename), "wb"),
+            mtime=0,
+        )
+        self._file = _GzipText(binary)
+        self._file.write(SITEMAP_HEADER)
+        self._urls = 0
+        self._bytes = len(SITEMAP_HEADER)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.write(SITEMAP_FOOTER)
+            self._file.close()
+            self._file = None
+
+
+class _GzipText:
+    # Text on top of a `GzipFile` that also closes the file beneath it, which `GzipFile` leaves open when given one
+    def __init__(self, binary: gzip.GzipFile):
+        self._binary = binary
+
+    def write(self, text: str) -> None:
+        self._binary.write(text.encode())
+
+    def close(self) -> None:
+        fileobj = self._binary.fileobj
+        self._binary.close()
+        fileobj.close()
+
+
+def write_sitemap_index(directory: str, base_url: str, sitemaps: Sequence[str]) -> str:
+    path = os.path.join(directory, INDEX_FILENAME)
+    with open(path, "w", encoding="utf-8", newline="\n") as output:
+        output.write(INDEX_HEADER)
+        for filename in sitemaps:
+            location = escape(f"{base_url.rstrip('/')}/{filename}", _ENTITIES)
+            output.write(f"<sitemap><loc>{location}</loc></sitemap>\n")
+        output.write(INDEX_FOOTER)
+    return path
+
+
+def write_sitemaps(
+    records: Iterable[Record],
+    directory: str,
+    base_url: str,
+    workers: int = 1,
+    chunk_size: int = 1000,
+    include_contracts: bool = True,
+    prefix: str = "sitemap",
+    max_urls: int = MAX_URLS_PER_SITEMAP,
+    errors: Optional[IO[str]] = None,
+) -> SitemapSummary:
+    # `base_url` is where the sitemaps will be published, for the index. Records without URLs are skipped, with their
+    # reasons written to `errors` as JSON lines.
+    os.makedirs(directory, exist_ok=True)
+    writer = _SitemapWriter(directory, prefix, max_urls)
+    url_count = failures = 0
+    previous_contract = None
+    try:
+        for record_number, (record, (contract_entry, token_entry, error)) in enumerate(
+            iter_chunk_results(build_sitemap_entries, records, workers, chunk_size),
+            start=1,
+        ):
+            if error is not None:
+                failures += 1
+                if errors is not None:
+                    errors.write(
+                        json.dumps({"record": record_number, "error": error}) + "\n"
+                    )
+                continue
+            contract = record[:2]
+            if include_contracts and contract_entry and contract != previous_contract:
+                writer.write(contract_entry)
+                url_count += 1
+            previous_contract = contract
+            if token_entry:
+                writer.write(token_entry)
+                url_count += 1
+    finally:
+        writer.close()
+    write_sitemap_index(directory, base_url, writer.filenames)
+    return SitemapSummary(tuple(writer.filenames), url_count, failures)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m blockchain_exploration.sitemaps",
+        description="Write sitemaps of explorer links for CSV rows of (network, contract, token_id) read from stdin",
+    )
+    parser.add_argument("directory")
+    parser.add_argument("base_url", help="Where the sitemaps will be published")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=positive_int, default=1000)
+    parser.add_argument(
+        "--no-contracts", action="store_true", help="Only list token pages"
+    )
+    args = parser.parse_args(argv)
+    records = (
+        (row["network"], row["contract"], row.get("token_id") or None)
+        for row in csv.DictReader(sys.stdin)
+    )
+    summary = write_sitemaps(
+        records,
+        args.directory,
+        args.base_url,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        include_contracts=not args.no_contracts,
+        errors=sys.stderr,
+    )
+    print(
+        f"Wrote {summary.url_count} URLs to {len(summary.sitemaps)} sitemaps",
+        file=sys.stderr,
+    )
+    return 1 if summary.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,416 @@
+import re
+from functools import lru_cache
+from string import whitespace
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+from .chains import EVM_CHAINS
+from .evm import canonicalize_evm_address
+from .types import ExplorerFlavour, LinkKind, Network, is_evm_network
+
+
+class LinkTemplate(NamedTuple):
+    # Fields: {base_path}, {identifier} (an address, contract or transaction hash), {token_id} and {chain} (the
+    # upper-cased network name)
+    pattern: str
+    # Links that are really account pages return None for an empty identifier, like `get_explorer_url_for_account()`
+    nullable: bool = False
+
+
+class Unsupported(NamedTuple):
+    # Fields: {network} and {base_path}
+    message: str
+
+
+# Templates for links an explorer doesn't have yet point here, so that callers that expect a URL still get one
+PLACEHOLDER_PATH = "/not-implemented/"
+
+# Identifiers are interpolated into the path or query, so they mustn't be able to start a new path segment, query or
+# fragment
+_find_unsafe_character = re.compile(r"[\s/?#]").search
+
+
+def get_validated_url(url: str) -> str:
+    parsed = urlparse(url)
+    if not (parsed.scheme and parsed.netloc and parsed.path):
+        raise ValueError(f"An invalid explorer URL was generated: {url}")
+    return url.strip(whitespace)
+
+
+def is_valid_identifier(identifier: str) -> bool:
+    return bool(identifier) and not _find_unsafe_character(identifier)
+
+
+def get_validated_identifier(identifier) -> str:
+    if identifier.__class__ is not str:
+        if identifier is None:
+            raise ValueError("No identifier was given for an explorer URL")
+        # Eg token IDs as integers, or numpy strings, which are checked like any other string
+        identifier = str(identifier)
+    if identifier.isalnum():
+        # The common case for hex and base58 identifiers, and much cheaper than the regular expression
+        return identifier
+    identifier = identifier.strip(whitespace)
+    if _find_unsafe_character(identifier):
+        raise ValueError(
+            f"An invalid identifier was given for an explorer URL: {identifier!r}"
+        )
+    return identifier
+
+
+class CompiledTemplate(NamedTuple):
+    # A template bound to a single base path. URLs are `prefix + identifier + infix + token_id + suffix`, leaving out
+    # whichever identifiers the template doesn't use. The base path and template were validated when compiling, so
+    # only the identifiers need checking for each URL, unless `strict_validation` asks for every URL to be parsed too.
+    prefix: str = ""
+    infix: str = ""
+    suffix: str = ""
+    uses_identifier: bool = True
+    uses_token_id: bool = False
+    nullable: bool = False
+    strict_validation: bool = False
+    # How to canonicalize identifiers that are EVM addresses, if at all
+    evm_address_case: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def is_placeholder(self) -> bool:
+        # Builds dead /not-implemented/ links
+        return PLACEHOLDER_PATH in self.prefix + self.suffix
+
+    def build(self, identifier: Optional[str], token_id=None) -> Optional[str]:
+        if self.error is not None:
+            raise NotImplementedError(self.error)
+        if self.nullable and not identifier:
+            return None
+        if self.uses_identifier:
+            identifier = get_validated_identifier(identifier)
+            if self.evm_address_case is not None:
+                identifier = canonicalize_evm_address(identifier, self.evm_address_case)
+            if self.uses_token_id:
+                url = (
+                    self.prefix
+                    + identifier
+                    + self.infix
+                    + get_validated_identifier(token_id)
+                    + self.suffix
+                )
+            else:
+                url = self.prefix + identifier + self.suffix
+        elif self.uses_token_id:
+            url = self.prefix + get_validated_identifier(token_id) + self.suffix
+        else:
+            url = self.prefix + self.suffix
+        if self.strict_validation:
+            return get_validated_url(url=url)
+        return url
+
+    def clean_identifiers(
+        self, identifier: Optional[str], token_id=None
+    ) -> Tuple[str, str]:
+        # The identifier and token ID exactly as `build()` would interpolate them, or "" for any the template doesn't
+        # use, for callers that assemble the pieces themselves
+        if self.uses_identifier:
+            identifier = get_validated_identifier(identifier)
+            if self.evm_address_case is not None:
+                identifier = canonicalize_evm_address(identifier, self.evm_address_case)
+        else:
+            identifier = ""
+        token_id = get_validated_identifier(token_id) if self.uses_token_id else ""
+        return identifier, token_id
+
+
+# Anything not listed for a specific flavour falls back to the network's ExplorerFlavour.DEFAULT entry
+LINK_TEMPLATES: Dict[Tuple[str, str, str], Union[LinkTemplate, Unsupported]] = {}
+
+# Per network, predicates on the (right-stripped) base path that identify alternative explorers
+FLAVOUR_MATCHERS: Dict[str, Tuple[Tuple[str, Callable[[str], bool]], ...]] = {}
+
+UNSUPPORTED_NETWORK_MESSAGES = {
+    LinkKind.ACCOUNT: "No explorer URL can be constructed for {network} addresses",
+    LinkKind.TOKEN_WALLET: "No explorer URL can be constructed for {network} addresses",
+    LinkKind.NFT_CONTRACT: "Exploration of the {network} network by contract is not supported",
+    LinkKind.TOKEN: "Exploration of the {network} network is not supported",
+    LinkKind.TRANSACTION: "Exploration of the {network} network is not supported",
+}
+
+# Counts calls to `register_link_templates()`, so that anything derived from the templates can tell when it's stale
+_registrations = 0
+
+
+def register_link_templates(
+    network: str,
+    templates: Dict[Tuple[str, str], Union[LinkTemplate, Unsupported]],
+    flavour_matchers: Tuple[Tuple[str, Callable[[str], bool]], ...] = (),
+) -> None:
+    # `templates` is keyed by (link kind, explorer flavour)
+    for (kind, flavour), template in templates.items():
+        LINK_TEMPLATES[(network, kind, flavour)] = template
+    FLAVOUR_MATCHERS[network] = tuple(flavour_matchers)
+    compile_link_template.cache_clear()
+    compile_link_templates.cache_clear()
+    get_explorer_flavour.cache_clear()
+    global _registrations
+    _registrations += 1
+
+
+def get_registration_count() -> int:
+    return _registrations
+
+
+@lru_cache(maxsize=1024)
+def get_explorer_flavour(network: str, base_path: str) -> str:
+    for flavour, matches in FLAVOUR_MATCHERS.get(network, ()):
+        if matches(base_path):
+            return flavour
+    return ExplorerFlavour.DEFAULT
+
+
+@lru_cache(maxsize=1024)
+def compile_link_template(
+    network: str,
+    kind: str,
+    base_path: str,
+    strict_validation: bool = False,
+    evm_address_case: Optional[str] = None,
+) -> CompiledTemplate:
+    # Compiled once per (network, kind, base path), so building a URL is a cached lookup and string concatenation
+    base_path = base_path.rstrip("/")
+    flavour = get_explorer_flavour(network, base_path)
+    template = LINK_TEMPLATES.get((network, kind, flavour)) or LINK_TEMPLATES.get(
+        (network, kind, ExplorerFlavour.DEFAULT)
+    )
+    if template is None:
+        return CompiledTemplate(
+            error=UNSUPPORTED_NETWORK_MESSAGES[kind].format(network=network)
+        )
+    elif isinstance(template, Unsupported):
+        return CompiledTemplate(
+            error=template.message.format(network=network, base_path=base_path)
+        )
+    uses_identifier = "{identifier}" in template.pattern
+    uses_token_id = "{token_id}" in template.pattern
+    # Control characters can't appear in a valid base path, so they're safe to split on
+    url = template.pattern.format(
+        base_path=base_path,
+        chain=network.upper(),
+        identifier="\x00",
+        token_id="\x01",
+    )
+    prefix, _, rest = url.partition("\x00") if uses_identifier else ("", "", url)
+    infix, _, suffix = rest.partition("\x01") if uses_token_id else ("", "", rest)
+    if not uses_identifier:
+        prefix, infix = infix, ""
+    if "\x00" in suffix or "\x01" in suffix or "\x01" in prefix:
+        raise ValueError(
+            f"Link templates can use {{identifier}} and then {{token_id}} once each: {template.pattern}"
+        )
+    # Identifiers can't contain a path separator, query or fragment, so if a sample URL has a scheme, domain and path,
+    # so will every URL built from this template
+    parsed = urlparse(f"{prefix}identifier{infix}token-id{suffix}")
+    if not (parsed.scheme and parsed.netloc and parsed.path):
+        raise ValueError(
+            f"An invalid explorer URL would be generated for {network} with {base_path}"
+        )
+    return CompiledTemplate(
+        prefix=prefix,
+        infix=infix,
+        suffix=suffix,
+        uses_identifier=uses_identifier,
+        uses_token_id=uses_token_id,
+        nullable=template.nullable,
+        strict_validation=strict_validation,
+        # Transaction hashes are hex too, but aren't checksummed
+        evm_address_case=(
+            evm_address_case
+            if is_evm_network(network) and kind != LinkKind.TRANSACTION
+            else None
+        ),
+    )
+
+
+@lru_cache(maxsize=256)
+def compile_link_templates(
+    network: str,
+    kinds: Tuple[str, ...],
+    base_path: str,
+    strict_validation: bool = False,
+    evm_address_case: Optional[str] = None,
+) -> Tuple[Optional[CompiledTemplate], ...]:
+    # Several kinds of link from one explorer at once, with None for any it can't provide, including placeholders
+    templates = []
+    for kind in kinds:
+        template = compile_link_template(
+            network, kind, base_path, strict_validation, evm_address_case
+        )
+        templates.append(
+            None if template.error is not None or template.is_placeholder else template
+        )
+    return tuple(templates)
+
+
+register_link_templates(
+    Network.BITCOIN_CASH,
+    {
+        (LinkKind.ACCOUNT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/address/{identifier}", nullable=True
+        ),
+        (LinkKind.TOKEN_WALLET, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/address/{identifier}", nullable=True
+        ),
+        # https://simpleledger.info/token/62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63
+        (LinkKind.NFT_CONTRACT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/token/{identifier}"
+        ),
+        (LinkKind.TOKEN, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/token/{identifier}"
+        ),
+        # https://blockchair.com/bitcoin-cash/transaction/62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63
+        (LinkKind.TRANSACTION, ExplorerFlavour.DEFAULT): Unsupported(
+            "{network} URLs are not supported for {base_path}"
+        ),
+        # https://simpleledger.info/#tx/f63da6fedacb67d7f45fb1aab5663e239e0b09596e670c9e97ced7a80c34c24c
+        (LinkKind.TRANSACTION, ExplorerFlavour.SIMPLELEDGER): LinkTemplate(
+            "{base_path}/#tx/{identifier}"
+        ),
+    },
+    flavour_matchers=(
+        (
+            ExplorerFlavour.SIMPLELEDGER,
+            lambda base_path: base_path.endswith("/simpleledger.info"),
+        ),
+    ),
+)
+
+EVM_LINK_TEMPLATES = {
+    # https://etherscan.io/address/0xd75004A00Ca9d707a4D318B21353dC8aFB151E72
+    (LinkKind.ACCOUNT, ExplorerFlavour.DEFAULT): LinkTemplate(
+        "{base_path}/address/{identifier}", nullable=True
+    ),
+    # https://opensea.io/0xeec4013a607d720989db8f464361cdcf2cb7a7bd
+    (LinkKind.ACCOUNT, ExplorerFlavour.OPENSEA): LinkTemplate(
+        "{base_path}/{identifier}", nullable=True
+    ),
+    # https://etherscan.io/address/0xf8e6480aaed82328e837172d4fb450826ec547cf#tokentxnsErc721
+    (LinkKind.TOKEN_WALLET, ExplorerFlavour.DEFAULT): LinkTemplate(
+        "{base_path}/address/{identifier}#tokentxnsErc721", nullable=True
+    ),
+    # https://opensea.io/0xeec4013a607d720989db8f464361cdcf2cb7a7bd?search[sortBy]=LISTING_DATE&search[chains][0]=MATIC
+    (LinkKind.TOKEN_WALLET, ExplorerFlavour.OPENSEA): LinkTemplate(
+        "{base_path}/{identifier}?search[sortBy]=LISTING_DATE&search[chains][0]={chain}",
+        nullable=True,
+    ),
+    # https://etherscan.io/token/0xC4df6018F90f91baD7e24f89279305715B3A276F
+    # https://polygonscan.com/token/0x3011810abfec25777a01d5fbef08b2ad12860460
+    (LinkKind.NFT_CONTRACT, ExplorerFlavour.DEFAULT): LinkTemplate(
+        "{base_path}/token/{identifier}"
+    ),
+    # https://opensea.io/assets?search[query]=0xc4df6018f90f91bad7e24f89279305715b3a276f
+    # If we went to https://opensea.io/0xc4df6018f90f91bad7e24f89279305715b3a276f, they'd show us the tokens held by
+    # that contract.
+    (LinkKind.NFT_CONTRACT, ExplorerFlavour.OPENSEA): LinkTemplate(
+        "{base_path}/assets?search[query]={identifier}"
+    ),
+    # https://polygonscan.com/token/0x3011810abfec25777a01d5fbef08b2ad12860460?a=3191
+    (LinkKind.TOKEN, ExplorerFlavour.DEFAULT): LinkTemplate(
+        "{base_path}/token/{identifier}/?a={token_id}"
+    ),
+    # OpenSea shows the contract's tokens rather than the individual token
+    (LinkKind.TOKEN, ExplorerFlavour.OPENSEA): LinkTemplate(
+        "{base_path}/assets?search[query]={identifier}"
+    ),
+    # https://polygonscan.com/tx/0x1d13a622fd628e0c77ea28805cfe6cfd3c23ab95a13a8ff81a11cb08a17f35a3
+    (LinkKind.TRANSACTION, ExplorerFlavour.DEFAULT): LinkTemplate(
+        "{base_path}/tx/{identifier}"
+    ),
+    (LinkKind.TRANSACTION, ExplorerFlavour.OPENSEA): Unsupported(
+        "OpenSea does not offer links to individual transactions"
+    ),
+}
+
+EVM_FLAVOUR_MATCHERS = (
+    (ExplorerFlavour.OPENSEA, lambda base_path: base_path.endswith("/opensea.io")),
+)
+
+for _chain in EVM_CHAINS:
+    register_link_templates(
+        _chain.network, EVM_LINK_TEMPLATES, flavour_matchers=EVM_FLAVOUR_MATCHERS
+    )
+
+register_link_templates(
+    Network.TEZOS,
+    {
+        # https://better-call.dev/mainnet/tz1imqR4V7ehxPeUrewsg6oy7tAPLsDBscTV/operations
+        # https://tzkt.io/tz1fRXMLR27hWoD49tdtKunHyfy3CQb5XZst/operations/
+        (LinkKind.ACCOUNT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/{identifier}/operations/", nullable=True
+        ),
+        # https://tzkt.io/tz1ZMZddhgxqBMMB5KwSr6L5PDJFQf2nNwbK/tokens
+        (LinkKind.TOKEN_WALLET, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/{identifier}/tokens"
+        ),
+        # Contracts are accounts too: https://tzkt.io/KT1RFncfJGBN9heZuDGW5vJPYpMKeYcLeZuo/operations/
+        (LinkKind.NFT_CONTRACT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/{identifier}/operations/", nullable=True
+        ),
+        # https://tzkt.io/KT1LHqbTKHKRtTzQAF4Z8KGa1xixQ2266S4w/operations/
+        (LinkKind.TOKEN, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/{identifier}/operations/", nullable=True
+        ),
+        # https://tzkt.io/ooZ2UVPNprv9GfMCwp6JgpUD54G668xrgnkPR2DRCZokfNChDrS
+        (LinkKind.TRANSACTION, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/{identifier}"
+        ),
+        # https://better-call.dev/mainnet/opg/ooZ2UVPNprv9GfMCwp6JgpUD54G668xrgnkPR2DRCZokfNChDrS/contents
+        (LinkKind.TRANSACTION, ExplorerFlavour.BETTER_CALL): LinkTemplate(
+            "{base_path}/opg/{identifier}"
+        ),
+    },
+    flavour_matchers=(
+        (ExplorerFlavour.BETTER_CALL, lambda base_path: "better-call.dev" in base_path),
+    ),
+)
+
+register_link_templates(
+    Network.SUI,
+    {
+        (LinkKind.ACCOUNT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/account/{identifier}", nullable=True
+        ),
+        (LinkKind.TOKEN_WALLET, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/not-implemented/"
+        ),
+        (LinkKind.NFT_CONTRACT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/collection/{identifier}/items"
+        ),
+        # token_id => object_id
+        (LinkKind.TOKEN, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/object/{token_id}"
+        ),
+        (LinkKind.TRANSACTION, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/tx/{identifier}"
+        ),
+    },
+)
+
+register_link_templates(
+    Network.TON,
+    {
+        (LinkKind.ACCOUNT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/account/{identifier}", nullable=True
+        ),
+        (LinkKind.TOKEN_WALLET, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/{identifier}#tokens"
+        ),
+        # This is a TON jetton contract, not an NFT contract
+        (LinkKind.NFT_CONTRACT, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/jetton/{identifier}"
+        ),
+        (LinkKind.TOKEN, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/not-implemented/"
+        ),
+        (LinkKind.TRANSACTION, ExplorerFlavour.DEFAULT): LinkTemplate(
+            "{base_path}/tx/{identifier}"
+        ),
+    },
+)
@@ -0,0 +1,239 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .chains import EVM_CHAINS
+from .config import ExplorerConfig
+from .currencies import NETWORK_CURRENCIES
+from .exploration import get_explorer_url_for_nft_contract
+from .types import is_evm_network
+
+# Tokens indexed by (network, code), symbol and (network, contract address), so that each lookup is a single dictionary
+# access, however many tokens are known. The currencies of NETWORK_CURRENCIES are always included, and token lists
+# (https://tokenlists.org) are read on the first lookup after they're added:
+#   TOKENS.add_token_list("tokens/uniswap.json")
+#   get_explorer_url_for_currency(Network.ETHEREUM, "usdc")  -> "https://etherscan.io/token/0xa0b8…"
+# Token lists identify chains by EIP-155 chain ID; tokens on other networks can give a "network" instead, eg for TON
+# jettons or Tezos FA2 tokens. Paths in the TOKEN_LISTS environment variable, separated by os.pathsep, are added to
+# TOKENS when it's created.
+
+LOGGER = logging.getLogger()
+
+TOKEN_LISTS_ENVIRONMENT_VARIABLE = "TOKEN_LISTS"
+
+
+class Token:
+    # Thousands of these are kept, so they have no __dict__
+    __slots__ = (
+        "network",
+        "code",
+        "symbol",
+        "decimals",
+        "contract",
+        "name",
+        "display_text",
+        "native_token",
+    )
+
+    def __init__(
+        self,
+        network: str,
+        code: str,
+        symbol: str,
+        decimals: int,
+        contract: Optional[str] = None,  # None for native currencies
+        name: Optional[str] = None,
+        display_text: Optional[str] = None,
+        native_token: bool = False,
+    ):
+        self.network = network
+        self.code = code
+        self.symbol = symbol
+        self.decimals = decimals
+        self.contract = contract
+        self.name = name
+        self.display_text = display_text or symbol
+        self.native_token = native_token
+
+    def _fields(self) -> Tuple:
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Token) and self._fields() == other._fields()
+
+    def __hash__(self) -> int:
+        return hash(self._fields())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self.__slots__
+        )
+        return f"Token({fields})"
+
+
+def _get_contract_key(network: str, contract: str) -> str:
+    # EVM addresses are the same whatever their case
+    return contract.lower() if is_evm_network(network) else contract
+
+
+def iter_token_list(data: Dict) -> Iterator[Token]:
+    # Tokens on chains that aren't registered are skipped, as are malformed entries, with a warning
+    for index, entry in enumerate(data.get("tokens", ())):
+        try:
+            network = entry.get("network")
+            if network is None:
+                chain = EVM_CHAINS.get_by_chain_id(int(entry["chainId"]))
+                if chain is None:
+                    continue
+                network = chain.network
+            token = Token(
+                network=network,
+                code=entry.get("code") or entry["symbol"].lower(),
+                symbol=entry["symbol"],
+                decimals=int(entry["decimals"]),
+                contract=entry["address"],
+                name=entry.get("name"),
+            )
+        except KeyError as error:
+            LOGGER.warning("Skipping token %d, which has no %s", index, error)
+            continue
+        except (AttributeError, TypeError, ValueError):
+            LOGGER.warning("Skipping token %d, which is malformed: %r", index, entry)
+            continue
+        yield token
+
+
+def load_token_list(path: str) -> List[Token]:
+    with open(path, encoding="utf-8") as input:
+        return list(iter_token_list(json.load(input)))
+
+
+class TokenRegistry:
+    def __init__(self, tokens: Iterable[Token] = (), token_lists: Iterable[str] = ()):
+        self._by_code: Dict[Tuple[str, str], Token] = {}
+        self._by_symbol: Dict[str, List[Token]] = {}
+        self._by_contract: Dict[Tuple[str, str], Token] = {}
+        # Token lists waiting to be read
+        self._pending: List[Union[str, Dict]] = list(token_lists)
+        self._lock = threading.RLock()
+        for token in tokens:
+            self.register(token)
+
+    def register(self, token: Token) -> None:
+        # Codes and contracts are claimed by the first token registered with them, so a token list can't take over a
+        # native currency's code, and a token list's duplicates, eg impostors with the same symbol, are only findable by
+        # their contract
+        with self._lock:
+            code_key = (token.network, token.code)
+            contract_key = (
+                None
+                if token.contract is None
+                else (token.network, _get_contract_key(token.network, token.contract))
+            )
+            if code_key in self._by_code and (
+                contract_key is None or contract_key in self._by_contract
+            ):
+                return
+            self._by_code.setdefault(code_key, token)
+            if contract_key is not None:
+                self._by_contract.setdefault(contract_key, token)
+            self._by_symbol.setdefault(token.symbol.upper(), []).append(token)
+
+    def add_token_list(self, token_list: Union[str, Dict]) -> None:
+        # A path to a token list JSON file, or its parsed contents, read on the next lookup
+        with self._lock:
+            self._pending.append(token_list)
+
+    def _load_pending(self) -> None:
+        # Lists that can't be read are dropped with a warning, rather than failing every lookup, even of the native
+        # currencies, which are always registered
+        with self._lock:
+            while self._pending:
+                token_list = self._pending[0]
+                try:
+                    tokens = (
+                        load_token_list(token_list)
+                        if isinstance(token_list, str)
+                        else list(iter_token_list(token_list))
+                    )
+                except (AttributeError, OSError, TypeError, ValueError) as error:
+                    LOGGER.warning("Skipping token list %.100r: %s", token_list, error)
+                    tokens = []
+                for token in tokens:
+                    self.register(token)
+                # Only once its tokens are all registered, as lookups skip the lock when nothing is pending
+                self._pending.pop(0)
+
+    def get_by_code(self, network: str, code: str) -> Optional[Token]:
+        if self._pending:
+            self._load_pending()
+        return self._by_code.get((network, code))
+
+    def get_by_contract(self, network: str, contract: str) -> Optional[Token]:
+        if self._pending:
+            self._load_pending()
+        return self._by_contract.get((network, _get_contract_key(network, contract)))
+
+    def get_by_symbol(self, symbol: str) -> Tuple[Token, ...]:
+        # Symbols aren't unique, even on one network, so every token with it, in the order they were registered
+        if self._pending:
+            self._load_pending()
+        return tuple(self._by_symbol.get(symbol.upper(), ()))
+
+    def __len__(self) -> int:
+        if self._pending:
+            self._load_pending()
+        return len(self._by_code)
+
+    def __iter__(self) -> Iterator[Token]:
+        if self._pending:
+            self._load_pending()
+        return iter(list(self._by_code.values()))
+
+
+def iter_network_currencies() -> Iterator[Token]:
+    for network, currencies in NETWORK_CURRENCIES.items():
+        for code, currency in currencies.items():
+            yield Token(
+                network=network,
+                code=code,
+                symbol=currency["symbol"],
+                decimals=currency["decimals"],
+                contract=currency.get("contract"),
+                display_text=currency["display_text"],
+                native_token=currency["native_token"],
+            )
+
+
+TOKENS = TokenRegistry(
+    iter_network_currencies(),
+    token_lists=[
+        path
+        for path in os.getenv(TOKEN_LISTS_ENVIRONMENT_VARIABLE, "").split(os.pathsep)
+        if path
+    ],
+)
+
+
+def get_token(network: str, code: str) -> Token:
+    token = TOKENS.get_by_code(network, code)
+    if token is None:
+        raise NotImplementedError(f"No token {code} known for {network}")
+    return token
+
+
+def get_explorer_url_for_currency(
+    network: str,
+    code: str,
+    base_path: Optional[str] = None,
+    config: Optional[ExplorerConfig] = None,
+) -> str:
+    # The explorer page of a token's contract, from its code
+    token = get_token(network, code)
+    if token.contract is None:
+        raise NotImplementedError(
+            f"{token.symbol} is {network}'s native currency, which has no contract"
+        )
+    return get_explorer_url_for_nft_contract(network, token.contract, base_path, config)
@@ -1,3 +1,6 @@
+from .chains import EVM_CHAINS
+
+
 # DO NOT USE THESE FOR SWEET.IO INTERNAL NETWORK REFERENCES, THESE
 # ARE ONLY RELEVANT TO THIS PACKAGE.
 class Network:
@@ -19,8 +22,45 @@ class TokenType:
     SCOR = "scor"  # TON jetton not nft
 
 
+class LinkKind:
+    ACCOUNT = "account"
+    TOKEN_WALLET = "token-wallet"
+    NFT_CONTRACT = "nft-contract"
+    TOKEN = "token"
+    TRANSACTION = "transaction"
+
+
+LINK_KINDS = frozenset(
+    {
+        LinkKind.ACCOUNT,
+        LinkKind.TOKEN_WALLET,
+        LinkKind.NFT_CONTRACT,
+        LinkKind.TOKEN,
+        LinkKind.TRANSACTION,
+    }
+)
+
+
+class ExplorerFlavour:
+    # Explorers for the same network that lay out their URLs differently
+    DEFAULT = "default"
+    OPENSEA = "opensea"  # https://opensea.io/
+    BETTER_CALL = "better-call"  # https://better-call.dev/
+    SIMPLELEDGER = "simpleledger"  # https://simpleledger.info/
+
+
+class EvmAddressCase:
+    # Ways to canonicalize EVM addresses, so that equivalent addresses produce identical URLs
+    LOWER = "lower"
+    CHECKSUM = "checksum"  # https://eips.ethereum.org/EIPS/eip-55
+
+
+# The chains in data/evm_chains.json. `is_evm_network()` also knows about chains registered since.
+EVM_NETWORKS = frozenset(chain.network for chain in EVM_CHAINS)
+
+
 def is_evm_network(network: str) -> bool:
-    return network in {Network.ETHEREUM, Network.MATIC}
+    return network in EVM_CHAINS
 
 
 def get_label_for_network(network: str) -> str:
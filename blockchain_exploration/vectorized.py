@@ -0,0 +1,269 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .config import ExplorerConfig, get_current_config
+from .evm import canonicalize_evm_address
+from .exploration import get_link_template
+from .templates import (
+    get_validated_identifier,
+    get_validated_url,
+    is_valid_identifier,
+)
+from .types import LINK_KINDS, LinkKind
+
+# Builds whole columns of explorer URLs, eg for DataFrames in analytics jobs:
+#   result = build_explorer_urls(LinkKind.TOKEN, frame["network"], frame["contract"], frame["token_id"])
+#   frame["url"] = result.urls
+# Rows are grouped by network (and base path, if given), so each group has a single template, resolved once, and
+# missing values, failures and alignment are handled by NumPy. The URLs themselves are concatenated by a comprehension
+# per group, since NumPy's string ufuncs turned out slower than CPython for this, and the results are Python strings
+# anyway. Needs NumPy, and PyArrow for Arrow arrays:
+#   pip install blockchain-exploration[vectorized]
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+MISSING_IDENTIFIER = "No identifier was given"
+MISSING_NETWORK = "No network was given"
+
+# ASCII characters that can't appear in identifiers
+_UNSAFE_ASCII = bytes(code for code in range(128) if not is_valid_identifier(chr(code)))
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Vectorized URL building needs NumPy: pip install blockchain-exploration[vectorized]"
+        )
+
+
+class VectorizedUrls(NamedTuple):
+    # Aligned with the input rows. `mask` is True where no URL was built, with the reason in `errors`, except for
+    # accounts without an address, which have no URL and no error, like `get_explorer_url_for_account()`.
+    urls: "np.ndarray"  # Objects: str, or None where masked
+    mask: "np.ndarray"  # Booleans
+    errors: "np.ndarray"  # Objects: str or None
+
+    def to_arrow(self) -> "pa.Array":
+        if pa is None:
+            raise ImportError("Arrow output needs PyArrow: pip install pyarrow")
+        return pa.array(self.urls, type=pa.string())
+
+
+def _to_objects(values, length: int = 0) -> Tuple["np.ndarray", "np.ndarray"]:
+    # (object array, missing mask) from NumPy arrays, Arrow arrays, sequences or pandas Series, with missing values
+    # replaced by "", or from a scalar to repeat
+    if values is None or isinstance(values, str):
+        return (
+            np.full(length, values or "", dtype=object),
+            np.full(length, not values, dtype=bool),
+        )
+    if pa is not None and isinstance(values, (pa.Array, pa.ChunkedArray)):
+        missing = values.is_null().to_numpy(zero_copy_only=False)
+        return values.fill_null("").to_numpy(zero_copy_only=False), missing
+    # Converting a list of strings straight to objects saves copying them into a fixed width array first
+    values = (
+        np.asarray(values)
+        if hasattr(values, "dtype")
+        else np.array(values, dtype=object)
+    )
+    if values.dtype.kind == "U":
+        return values.astype(object), np.zeros(len(values), dtype=bool)
+    if values.dtype.kind == "S":
+        return (
+            np.char.decode(values, "utf-8").astype(object),
+            np.zeros(len(values), dtype=bool),
+        )
+    values = values.astype(object)
+    # None, and NaN as pandas uses for missing values, which is the only value that isn't equal to itself
+    missing = np.equal(values, None) | np.not_equal(values, values)
+    if missing.any():
+        values[missing] = ""
+    return values, missing
+
+
+def _are_valid_identifiers(values: List) -> bool:
+    # Whether `get_validated_identifier()` would return every value unchanged, checking them all at once: they're
+    # strings, and their characters are all ASCII and safe (the separator, NUL, is safe too)
+    try:
+        joined = "\0".join(values)
+    except TypeError:
+        return False
+    if not joined.isascii():
+        return False
+    encoded = joined.encode("ascii")
+    return len(encoded.translate(None, _UNSAFE_ASCII)) == len(encoded)
+
+
+def _clean(
+    values: List, clean_one: Callable[[str], str]
+) -> Tuple[List[str], Dict[int, str]]:
+    # Each value cleaned by `clean_one`, and the errors by index for any that can't be
+    if clean_one is get_validated_identifier and _are_valid_identifiers(values):
+        return values, {}
+    try:
+        return [clean_one(value) for value in values], {}
+    except ValueError:
+        pass
+    cleaned, errors = [], {}
+    for index, value in enumerate(values):
+        try:
+            cleaned.append(clean_one(value))
+        except ValueError as error:
+            cleaned.append("")
+            errors[index] = str(error)
+    return cleaned, errors
+
+
+def _build_group(
+    template,
+    rows: "np.ndarray",
+    identifiers: "np.ndarray",
+    missing_identifiers: "np.ndarray",
+    token_ids: "np.ndarray",
+    missing_token_ids: "np.ndarray",
+    urls: "np.ndarray",
+    errors: "np.ndarray",
+) -> None:
+    # Writes the URLs for the group's `rows` into `urls`, and the reasons for any that can't be built into `errors`,
+    # cleaning identifiers just like `CompiledTemplate.build()`
+    valid = np.ones(len(rows), dtype=bool)
+    if template.nullable:
+        # Accounts without an address have no URL, but that isn't an error
+        valid &= ~missing_identifiers & (identifiers != "")
+    for used, missing in (
+        (template.uses_identifier, missing_identifiers),
+        (template.uses_token_id, missing_token_ids),
+    ):
+        if used:
+            failed = valid & missing
+            errors[rows[failed]] = MISSING_IDENTIFIER
+            valid &= ~failed
+    rows = rows[valid]
+    failures: Dict[int, str] = {}
+    if template.uses_identifier:
+        case = template.evm_address_case
+        if case is None:
+            clean_identifier = get_validated_identifier
+        else:
+            clean_identifier = lambda identifier: canonicalize_evm_address(
+                get_validated_identifier(identifier), case
+            )
+        identifiers, failures = _clean(identifiers[valid].tolist(), clean_identifier)
+    if template.uses_token_id:
+        token_ids, token_id_failures = _clean(
+            token_ids[valid].tolist(), get_validated_identifier
+        )
+        failures = {**token_id_failures, **failures}
+    prefix, infix, suffix = template.prefix, template.infix, template.suffix
+    if template.uses_identifier and template.uses_token_id:
+        built = [
+            f"{prefix}{identifier}{infix}{token_id}{suffix}"
+            for identifier, token_id in zip(identifiers, token_ids)
+        ]
+    elif template.uses_identifier:
+        built = [f"{prefix}{identifier}{suffix}" for identifier in identifiers]
+    elif template.uses_token_id:
+        built = [f"{prefix}{token_id}{suffix}" for token_id in token_ids]
+    else:
+        built = [prefix + suffix] * len(rows)
+    if template.strict_validation:
+        built, url_failures = _clean(built, get_validated_url)
+        failures = {**url_failures, **failures}
+    column = np.empty(len(built), dtype=object)
+    column[:] = built
+    for index, error in failures.items():
+        column[index] = None
+        errors[rows[index]] = error
+    urls[rows] = column
+
+
+def _group_rows(networks, base_paths, count: int, errors: "np.ndarray") -> List:
+    # ((network, base path or ""), rows) for each group, marking rows without a network in `errors`
+    if isinstance(networks, str) and networks and not hasattr(base_paths, "__len__"):
+        # A single group, with no need to sort anything
+        return [((networks, base_paths or ""), np.arange(count))]
+    networks, missing_networks = _to_objects(networks, count)
+    errors[missing_networks] = MISSING_NETWORK
+    keys = networks.tolist()
+    if base_paths is not None:
+        keys = list(zip(keys, _to_objects(base_paths, count)[0].tolist()))
+    # Numbering each distinct key with dict lookups mapped in C is quicker than sorting strings with `np.unique()`
+    numbers = {key: number for number, key in enumerate(dict.fromkeys(keys))}
+    codes = np.fromiter(map(numbers.__getitem__, keys), dtype=np.intp, count=count)
+    # Rows sorted by group, so each group is a slice
+    order = np.argsort(codes, kind="stable")
+    ends = np.cumsum(np.bincount(codes, minlength=len(numbers)))
+    groups = []
+    for number, key in enumerate(numbers):
+        rows = order[ends[number - 1] if number else 0 : ends[number]]
+        rows = rows[~missing_networks[rows]]
+        if len(rows):
+            groups.append((key if base_paths is not None else (key, ""), rows))
+    return groups
+
+
+def build_explorer_urls(
+    kind: str,
+    networks,
+    identifiers,
+    token_ids=None,
+    base_paths=None,
+    config: Optional[ExplorerConfig] = None,
+) -> VectorizedUrls:
+    # `networks` and `base_paths` may be arrays or a single value for every row. Unsupported networks and invalid
+    # identifiers mask their rows rather than raising.
+    _require_numpy()
+    if kind not in LINK_KINDS:
+        raise ValueError(f"Unknown link kind: {kind}")
+    config = config or get_current_config()
+    identifiers, missing_identifiers = _to_objects(identifiers)
+    count = len(identifiers)
+    token_ids, missing_token_ids = _to_objects(token_ids, count)
+    urls = np.full(count, None, dtype=object)
+    errors = np.full(count, None, dtype=object)
+    for (network, base_path), rows in _group_rows(networks, base_paths, count, errors):
+        try:
+            template = get_link_template(network, kind, base_path or None, config)
+        except (NotImplementedError, ValueError) as error:
+            errors[rows] = str(error)
+            continue
+        if template.error is not None:
+            errors[rows] = template.error
+            continue
+        _build_group(
+            template,
+            rows,
+            identifiers[rows],
+            missing_identifiers[rows],
+            token_ids[rows],
+            missing_token_ids[rows],
+            urls,
+            errors,
+        )
+    return VectorizedUrls(urls=urls, mask=np.equal(urls, None), errors=errors)
+
+
+def build_account_urls(
+    networks, addresses, base_paths=None, config=None
+) -> VectorizedUrls:
+    return build_explorer_urls(
+        LinkKind.ACCOUNT, networks, addresses, base_paths=base_paths, config=config
+    )
+
+
+def build_token_urls(
+    networks, addresses, token_ids, base_paths=None, config=None
+) -> VectorizedUrls:
+    return build_explorer_urls(
+        LinkKind.TOKEN,
+        networks,
+        addresses,
+        token_ids,
+        base_paths=base_paths,
+        config=config,
+    )
@@ -26,5 +26,7 @@ setup(
         "Operating System :: OS Independent",
     ],
     packages=["blockchain_exploration"],
+    package_data={"blockchain_exploration": ["data/*.json"]},
     install_requires=[],
+    extras_require={"vectorized": ["numpy"], "arrow": ["numpy", "pyarrow"]},
 )
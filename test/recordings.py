@@ -0,0 +1,163 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests import RequestException
+
+from blockchain_exploration.link_health import (
+    EXPECTED_TEXT_BY_KIND,
+    LOADING_JAVASCRIPT_TEXT,
+)
+
+# Recorded explorer responses, so the explorer tests check their pages offline:
+#   URL_RETRIEVAL=replay  (the default) checks against test/fixtures/explorer_responses.json
+#   URL_RETRIEVAL=record  fetches every page again, in parallel, and rewrites the recordings
+#   URL_RETRIEVAL=live    fetches every page without recording
+# URL_RETRIEVAL_ORIGIN, eg http://localhost:8080, sends the requests to a mirror or proxy instead, while still
+# recording them under the explorers' URLs. SKIP_URL_RETRIEVAL=1 still skips checking pages altogether. Pages without a
+# recording are reported as skipped subtests (pytest -rs lists them), so checks that didn't happen never pass silently.
+# Only excerpts around the text the tests look for are kept, so the recordings stay small and diffable.
+
+LOGGER = logging.getLogger()
+
+REPLAY = "replay"
+RECORD = "record"
+LIVE = "live"
+
+RECORDINGS_PATH = os.path.join(
+    os.path.dirname(__file__), "fixtures", "explorer_responses.json"
+)
+
+# Characters kept either side of each text the tests look for
+EXCERPT_CONTEXT = 40
+NEEDLES = (LOADING_JAVASCRIPT_TEXT, *sorted(set(EXPECTED_TEXT_BY_KIND.values())))
+
+HEADERS = {"User-Agent": "Sweet.io test", "Accept": "application/json"}
+
+
+class Recording(NamedTuple):
+    status: int
+    # Excerpts of the page, which mention whatever it did of `NEEDLES`, or "" for an empty page
+    text: str
+
+
+def get_excerpt(text: str) -> str:
+    # Each needle's first mention, with some context, in page order
+    lowered = text.lower()
+    spans = []
+    for needle in NEEDLES:
+        index = lowered.find(needle.lower())
+        if index != -1:
+            spans.append(
+                (
+                    max(index - EXCERPT_CONTEXT, 0),
+                    index + len(needle) + EXCERPT_CONTEXT,
+                )
+            )
+    excerpts = []
+    end = 0
+    for start, stop in sorted(spans):
+        if start < end and excerpts:
+            # Overlapping spans are merged
+            excerpts[-1] += text[end:stop]
+        else:
+            excerpts.append(text[start:stop])
+        end = max(end, stop)
+    # Pages that mention none of them are kept non-empty, so they aren't mistaken for empty responses
+    return " … ".join(excerpts) or text[: EXCERPT_CONTEXT * 2]
+
+
+def load_recordings(path: str = RECORDINGS_PATH) -> Dict[str, Recording]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {
+                url: Recording(*recording) for url, recording in json.load(f).items()
+            }
+    except FileNotFoundError:
+        return {}
+
+
+def save_recordings(recordings: Dict[str, Recording], path: str = RECORDINGS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("{\n")
+        f.write(
+            ",\n".join(
+                f"  {json.dumps(url)}: {json.dumps(list(recordings[url]), ensure_ascii=False)}"
+                for url in sorted(recordings)
+            )
+        )
+        f.write("\n}\n")
+
+
+def get_mode() -> str:
+    mode = os.getenv("URL_RETRIEVAL", REPLAY)
+    if mode not in {REPLAY, RECORD, LIVE}:
+        raise ValueError(f"Unknown URL_RETRIEVAL mode: {mode}")
+    return mode
+
+
+def _fetch(url: str, origin: Optional[str], timeout: float) -> Optional[Recording]:
+    if origin:
+        parts = urlsplit(url)
+        url = (
+            origin.rstrip("/") + parts.path + (f"?{parts.query}" if parts.query else "")
+        )
+    try:
+        response = requests.get(url=url, timeout=timeout, headers=HEADERS)
+    except RequestException as error:
+        LOGGER.warning("No response was received from %s: %s", url, error)
+        return None
+    return Recording(response.status_code, get_excerpt(response.text))
+
+
+class ExplorerResponses:
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        path: str = RECORDINGS_PATH,
+        origin: Optional[str] = None,
+        workers: int = 8,
+        timeout: float = 10.0,
+    ):
+        self.mode = mode or get_mode()
+        self.path = path
+        self.origin = (
+            origin if origin is not None else os.getenv("URL_RETRIEVAL_ORIGIN")
+        )
+        self.workers = workers
+        self.timeout = timeout
+        # Recording starts afresh, dropping pages the tests no longer check, but keeps the previous recording of any
+        # page that can't be fetched this time
+        self.recordings = load_recordings(path) if self.mode == REPLAY else {}
+        self._previous = load_recordings(path) if self.mode == RECORD else {}
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        # Fetches pages concurrently up front, rather than one by one as the tests ask for them
+        if self.mode == REPLAY:
+            return
+        urls = sorted(set(urls) - set(self.recordings))
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for url, recording in zip(
+                urls,
+                executor.map(lambda url: _fetch(url, self.origin, self.timeout), urls),
+            ):
+                recording = recording or self._previous.get(url)
+                if recording is not None:
+                    self.recordings[url] = recording
+
+    def get(self, url: str) -> Optional[Recording]:
+        # None if the page couldn't be fetched, or was never recorded
+        recording = self.recordings.get(url)
+        if recording is None and self.mode != REPLAY:
+            self.prefetch([url])
+            recording = self.recordings.get(url)
+        return recording
+
+    def save(self) -> None:
+        if self.mode == RECORD and self.recordings:
+            save_recordings(self.recordings, self.path)
@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from blockchain_exploration import templates
+from blockchain_exploration.templates import (
+    FLAVOUR_MATCHERS,
+    LINK_TEMPLATES,
+    compile_link_template,
+    compile_link_templates,
+    get_explorer_flavour,
+)
+
+
+@contextmanager
+def restored_registries() -> Iterator[None]:
+    # Undoes `register_link_templates()` calls made inside it, including in the caches and indexes built from the
+    # registries, so networks registered by one test can't leak into the next
+    link_templates, flavour_matchers = dict(LINK_TEMPLATES), dict(FLAVOUR_MATCHERS)
+    try:
+        yield
+    finally:
+        LINK_TEMPLATES.clear()
+        LINK_TEMPLATES.update(link_templates)
+        FLAVOUR_MATCHERS.clear()
+        FLAVOUR_MATCHERS.update(flavour_matchers)
+        compile_link_template.cache_clear()
+        compile_link_templates.cache_clear()
+        get_explorer_flavour.cache_clear()
+        # Counted as a registration, so the parsing indexes built while it was registered are rebuilt
+        templates._registrations += 1
@@ -0,0 +1,85 @@
+import unittest
+from decimal import Decimal
+
+from blockchain_exploration.amounts import (
+    DISPLAY_TEXT,
+    compile_amount_format,
+    format_amount,
+    format_amounts,
+    get_currency,
+)
+from blockchain_exploration.chains import EVM_CHAINS
+from blockchain_exploration.currencies import NETWORK_CURRENCIES
+from blockchain_exploration.types import Network
+
+
+class TestAmounts(unittest.TestCase):
+    def test_format_amount(self):
+        for amount, network, options, expected in [
+            (1_234_567_800_000_000_000_000, Network.ETHEREUM, {}, "1,234.5678 ETH"),
+            (1, Network.ETHEREUM, {}, "0.000000000000000001 ETH"),
+            (10**18, Network.MATIC, {"precision": 4}, "1 MATIC"),
+            (1_500_000, Network.TEZOS, {"label": DISPLAY_TEXT}, "1.5 ꜩ"),
+            (123_456_789, Network.BITCOIN_CASH, {}, "1.23456789 ₿"),
+            (2_500_000_000, Network.SUI, {"label": None}, "2.5"),
+            # Rounded half away from zero
+            (1_234_567_890, Network.TON, {"precision": 2}, "1.23 TON"),
+            (1_235_000_000, Network.TON, {"precision": 2}, "1.24 TON"),
+            (-1_235_000_000, Network.TON, {"precision": 2}, "-1.24 TON"),
+            (-4_000_000, Network.TON, {"precision": 2}, "0 TON"),
+            (999_999_999, Network.TON, {"precision": 2}, "1 TON"),
+            (10**9, Network.TON, {"precision": 2, "trim_zeros": False}, "1.00 TON"),
+            (
+                "1234567000000",
+                Network.TON,
+                {"thousands_separator": ".", "decimal_separator": ","},
+                "1.234,567 TON",
+            ),
+            (1234 * 10**9, Network.TON, {"thousands_separator": None}, "1234 TON"),
+            (1234 * 10**9, Network.TON, {"precision": 0}, "1,234 TON"),
+        ]:
+            with self.subTest(amount=amount, network=network, options=options):
+                self.assertEqual(format_amount(amount, network, **options), expected)
+        self.assertEqual(
+            format_amount(10**9, Network.TON, "scor", label=DISPLAY_TEXT), "1 $SCOR"
+        )
+
+    def test_format_amounts(self):
+        amounts = [0, 5 * 10**17, -(10**21), "123", 10**40 + 1]
+        for options in ({}, {"precision": 0}, {"precision": 3, "trim_zeros": False}):
+            self.assertEqual(
+                format_amounts(amounts, Network.ETHEREUM, **options),
+                [
+                    format_amount(amount, Network.ETHEREUM, **options)
+                    for amount in amounts
+                ],
+            )
+        self.assertEqual(
+            format_amounts(amounts[:2], Network.ETHEREUM), ["0 ETH", "0.5 ETH"]
+        )
+
+    def test_currencies(self):
+        for network, currencies in NETWORK_CURRENCIES.items():
+            for code, currency in currencies.items():
+                self.assertIsInstance(currency["decimals"], int)
+                self.assertIs(get_currency(network, code), currency)
+        for chain in EVM_CHAINS:
+            self.assertEqual(get_currency(chain.network)["code"], chain.currency.code)
+        with self.assertRaises(NotImplementedError):
+            format_amount(1, "dogecoin")
+        with self.assertRaises(NotImplementedError):
+            format_amount(1, Network.ETHEREUM, "scor")
+        with self.assertRaises(ValueError):
+            compile_amount_format(Network.ETHEREUM, precision=-1)
+        # Only exact amounts are accepted
+        for amount in ("1.5", "1e18", " 1", "", "-"):
+            with self.subTest(amount=amount):
+                with self.assertRaises(ValueError):
+                    format_amount(amount, Network.ETHEREUM)
+        for amount in (1.9e18, True, None, Decimal(1)):
+            with self.subTest(amount=amount):
+                with self.assertRaises(TypeError):
+                    format_amount(amount, Network.ETHEREUM)
+                with self.assertRaises(TypeError):
+                    format_amounts([1, amount], Network.ETHEREUM)
+        self.assertEqual(format_amount("-15", Network.TON), "-0.000000015 TON")
@@ -0,0 +1,34 @@
+import unittest
+
+from benchmarks.benchmark_exploration import compare, iter_cases
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_cases_run(self):
+        names = set()
+        for name, function in iter_cases():
+            self.assertNotIn(name, names)
+            names.add(name)
+            try:
+                function()
+            except NotImplementedError:
+                pass
+
+    def test_compare(self):
+        baseline = {
+            "results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}}
+        }
+        current = {
+            "results": {
+                "a": {"ops_per_sec": 90.0},
+                "b": {"ops_per_sec": 70.0},
+                "c": {"ops_per_sec": 1.0},
+            }
+        }
+        regressions = compare(baseline, current, threshold=0.15)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("b: "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import threading
+import unittest
+
+from blockchain_exploration.caching import (
+    UrlCache,
+    disable_url_cache,
+    enable_url_cache,
+)
+from blockchain_exploration.config import ExplorerConfig, get_default_config
+from blockchain_exploration.context import ExplorerContext
+from blockchain_exploration.exploration import (
+    get_explorer_url_for_account,
+    get_explorer_url_for_nft_contract,
+    get_explorer_url_for_token,
+    get_explorer_url_for_transaction,
+)
+from blockchain_exploration.instrumentation import OK, Instrumentation
+from blockchain_exploration.types import EvmAddressCase, ExplorerFlavour, Network
+
+CONTRACT = "0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed"
+
+
+class TestUrlCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = UrlCache(maxsize=2)
+        self.config = ExplorerConfig.from_environ({})._replace(url_cache=self.cache)
+
+    def test_hits_and_evictions(self):
+        for _ in range(3):
+            self.assertEqual(
+                get_explorer_url_for_nft_contract(
+                    Network.ETHEREUM, CONTRACT, config=self.config
+                ),
+                f"https://etherscan.io/token/{CONTRACT}",
+            )
+        get_explorer_url_for_account(Network.TEZOS, "tz1", config=self.config)
+        get_explorer_url_for_account(Network.TEZOS, "tz2", config=self.config)
+        stats = self.cache.stats()
+        self.assertEqual(stats[:4], (2, 3, 1, 2))
+        self.assertAlmostEqual(stats.hit_rate, 0.4)
+        # The least recently used entry was evicted
+        get_explorer_url_for_account(Network.TEZOS, "tz2", config=self.config)
+        self.assertEqual(self.cache.stats().hits, 3)
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()[:4], (0, 0, 0, 0))
+
+    def test_config_changes(self):
+        get_explorer_url_for_nft_contract(
+            Network.ETHEREUM, CONTRACT, config=self.config
+        )
+        # The same cache with other explorers or options never returns the URLs built before
+        with ExplorerContext(
+            self.config, base_paths={Network.ETHEREUM: "https://opensea.io"}
+        ):
+            self.assertEqual(
+                get_explorer_url_for_nft_contract(Network.ETHEREUM, CONTRACT),
+                f"https://opensea.io/assets?search[query]={CONTRACT}",
+            )
+        checksum = self.config._replace(evm_address_case=EvmAddressCase.CHECKSUM)
+        self.assertEqual(
+            get_explorer_url_for_nft_contract(
+                Network.ETHEREUM, CONTRACT, config=checksum
+            ),
+            "https://etherscan.io/token/0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+        )
+        self.assertEqual(
+            get_explorer_url_for_token(
+                Network.ETHEREUM,
+                CONTRACT,
+                "1",
+                base_path="https://sepolia.etherscan.io",
+                config=self.config,
+            ),
+            f"https://sepolia.etherscan.io/token/{CONTRACT}/?a=1",
+        )
+        self.assertEqual(self.cache.stats().hits, 0)
+
+    def test_exceptions_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                get_explorer_url_for_account(Network.TON, "a/b", config=self.config)
+            with self.assertRaises(NotImplementedError):
+                get_explorer_url_for_transaction(
+                    Network.ETHEREUM,
+                    "0x1",
+                    base_path="https://opensea.io",
+                    config=self.config,
+                )
+        stats = self.cache.stats()
+        self.assertEqual(stats.size, 0)
+        # Failed builds are misses, but nothing was added, so nothing was evicted
+        self.assertEqual((stats.misses, stats.evictions), (4, 0))
+        # Keys are typed, so equal identifiers of different types don't share URLs
+        self.assertEqual(
+            get_explorer_url_for_token(Network.MATIC, "0xabc", 1, config=self.config),
+            "https://polygonscan.com/token/0xabc/?a=1",
+        )
+        self.assertEqual(
+            get_explorer_url_for_token(
+                Network.MATIC, "0xabc", True, config=self.config
+            ),
+            "https://polygonscan.com/token/0xabc/?a=True",
+        )
+
+    def test_threads(self):
+        cache = UrlCache(maxsize=64)
+        config = self.config._replace(url_cache=cache)
+        failures = []
+
+        def build(offset):
+            for index in range(2000):
+                token_id = str((index + offset) % 100)
+                url = get_explorer_url_for_token(
+                    Network.MATIC, "0xabc", token_id, config=config
+                )
+                if url != f"https://polygonscan.com/token/0xabc/?a={token_id}":
+                    failures.append(url)
+
+        threads = [
+            threading.Thread(target=build, args=(offset,)) for offset in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        stats = cache.stats()
+        self.assertEqual(stats.hits + stats.misses, 8000)
+        self.assertLessEqual(stats.size, 64)
+
+    def test_instrumentation(self):
+        # Cache hits are still counted as URLs built
+        instrumentation = Instrumentation()
+        config = self.config._replace(instrumentation=instrumentation)
+        for _ in range(3):
+            get_explorer_url_for_account(Network.TEZOS, "tz1", config=config)
+        self.assertEqual(
+            instrumentation.snapshot().counts,
+            {
+                (
+                    "get_explorer_url_for_account",
+                    Network.TEZOS,
+                    ExplorerFlavour.DEFAULT,
+                    OK,
+                ): 3
+            },
+        )
+        self.assertEqual(self.cache.stats().hits, 2)
+
+    def test_enable_url_cache(self):
+        previous = get_default_config()
+        cache = enable_url_cache(maxsize=16)
+        try:
+            get_explorer_url_for_account(Network.TEZOS, "tz1")
+            get_explorer_url_for_account(Network.TEZOS, "tz1")
+        finally:
+            disable_url_cache()
+        get_explorer_url_for_account(Network.TEZOS, "tz1")
+        self.assertEqual(cache.stats()[:2], (1, 1))
+        self.assertEqual(get_default_config().base_paths, previous.base_paths)
+        with self.assertRaises(ValueError):
+            UrlCache(maxsize=0)
@@ -0,0 +1,149 @@
+import json
+import os
+import tempfile
+import unittest
+
+from blockchain_exploration.chains import (
+    EvmChain,
+    EvmChainRegistry,
+    EvmCurrency,
+    get_evm_chain_by_id,
+    get_evm_chain_by_network,
+    get_network_by_chain_id,
+    load_evm_chains,
+)
+from blockchain_exploration.config import ExplorerConfig
+from blockchain_exploration.currencies import NETWORK_CURRENCIES
+from blockchain_exploration.exploration import (
+    get_base_path,
+    get_explorer_url_for_token,
+    get_explorer_url_for_token_wallet,
+    get_network_by_token_type,
+    get_token_type_by_network,
+    register_evm_chain,
+)
+from blockchain_exploration.types import Network, TokenType, is_evm_network
+
+ETH_CURRENCY = EvmCurrency(code="eth", symbol="ETH", display_text="ether")
+
+
+class TestEvmChains(unittest.TestCase):
+    def test_bundled_chains(self):
+        self.assertEqual(get_network_by_chain_id(1), Network.ETHEREUM)
+        self.assertEqual(get_network_by_chain_id(137), Network.MATIC)
+        self.assertEqual(get_evm_chain_by_network(Network.MATIC).chain_id, 137)
+        self.assertTrue(get_evm_chain_by_id(11155111).testnet)
+        self.assertEqual(
+            get_token_type_by_network(Network.ETHEREUM), TokenType.ERC721_ETH
+        )
+        self.assertEqual(
+            get_network_by_token_type(TokenType.ERC721_MATIC), Network.MATIC
+        )
+        with self.assertRaises(NotImplementedError):
+            get_evm_chain_by_id(-1)
+        with self.assertRaises(NotImplementedError):
+            get_evm_chain_by_network(Network.TEZOS)
+        for chain in load_evm_chains():
+            with self.subTest(network=chain.network):
+                self.assertTrue(is_evm_network(chain.network))
+                self.assertEqual(get_base_path(chain.network), chain.base_path)
+                self.assertEqual(
+                    get_token_type_by_network(chain.network), chain.token_type
+                )
+                self.assertIn(chain.currency.code, NETWORK_CURRENCIES[chain.network])
+        self.assertFalse(is_evm_network(Network.SUI))
+
+    def test_every_chain_uses_the_evm_templates(self):
+        self.assertEqual(
+            get_explorer_url_for_token("base", "0xabc", "5"),
+            "https://basescan.org/token/0xabc/?a=5",
+        )
+        config = ExplorerConfig.from_environ(
+            {"ARBITRUM_EXPLORER_BASEPATH": "https://opensea.io"}
+        )
+        self.assertEqual(
+            get_explorer_url_for_token_wallet("arbitrum", "0xabc", config=config),
+            "https://opensea.io/0xabc?search[sortBy]=LISTING_DATE&search[chains][0]=ARBITRUM",
+        )
+
+    def test_register_evm_chain(self):
+        chain = EvmChain(
+            chain_id=999999901,
+            network="test-evm-chain",
+            base_path="https://test-evm-chain.example.com",
+            token_type="erc721-test-evm-chain",
+            currency=ETH_CURRENCY,
+            environment_variables=("TEST_EVM_CHAIN_EXPLORER_BASEPATH",),
+            testnet=True,
+        )
+        register_evm_chain(chain)
+        self.assertTrue(is_evm_network(chain.network))
+        self.assertEqual(get_network_by_chain_id(chain.chain_id), chain.network)
+        self.assertEqual(get_network_by_token_type(chain.token_type), chain.network)
+        config = ExplorerConfig.from_environ({})
+        self.assertEqual(
+            get_explorer_url_for_token(chain.network, "0xabc", "5", config=config),
+            "https://test-evm-chain.example.com/token/0xabc/?a=5",
+        )
+
+    def test_registry(self):
+        registry = EvmChainRegistry(
+            [
+                EvmChain(
+                    1, "one", "https://one.example.com", "erc721-one", ETH_CURRENCY
+                ),
+                EvmChain(
+                    2, "two", "https://two.example.com", "erc721-two", ETH_CURRENCY
+                ),
+            ]
+        )
+        self.assertEqual(len(registry), 2)
+        self.assertIn("one", registry)
+        self.assertEqual(registry.get_by_token_type("erc721-two").chain_id, 2)
+        self.assertIsNone(registry.get_by_chain_id(3))
+        with self.assertRaises(ValueError):
+            registry.register(
+                EvmChain(
+                    2,
+                    "three",
+                    "https://three.example.com",
+                    "erc721-three",
+                    ETH_CURRENCY,
+                )
+            )
+        # Re-registering a network replaces its chain ID and token type
+        registry.register(
+            EvmChain(3, "two", "https://two.example.com", "erc721-2", ETH_CURRENCY)
+        )
+        self.assertIsNone(registry.get_by_chain_id(2))
+        self.assertIsNone(registry.get_by_token_type("erc721-two"))
+        self.assertEqual(registry.get_by_chain_id(3).token_type, "erc721-2")
+
+    def test_load_evm_chains(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "chains.json")
+            with open(path, "w") as output:
+                json.dump(
+                    [
+                        {
+                            "chain_id": "10",
+                            "network": "optimism",
+                            "base_path": "https://optimistic.etherscan.io/",
+                            "token_type": "erc721-optimism",
+                            "currency": ETH_CURRENCY._asdict(),
+                        }
+                    ],
+                    output,
+                )
+            self.assertEqual(
+                load_evm_chains(path),
+                [
+                    EvmChain(
+                        chain_id=10,
+                        network="optimism",
+                        base_path="https://optimistic.etherscan.io",
+                        token_type="erc721-optimism",
+                        currency=ETH_CURRENCY,
+                    )
+                ],
+            )
@@ -0,0 +1,115 @@
+import unittest
+
+from blockchain_exploration import classification
+from blockchain_exploration.classification import (
+    HEX,
+    IDENTIFIER_RULES,
+    Candidate,
+    IdentifierRule,
+    classify_identifier,
+    classify_identifiers,
+    get_networks_for_identifier,
+    register_identifier_rule,
+)
+from blockchain_exploration.exploration import get_explorer_url
+from blockchain_exploration.types import LinkKind, Network
+
+IDENTIFIERS = {
+    "simpleledger:qrgydxn0xnta6k4lkc4xmrltz4ghvlz7tq33dez6nv": (Network.BITCOIN_CASH,),
+    "bitcoincash:qpm2qsznhks23z7629mms6s4cwef74vcwvy22gdx6a": (Network.BITCOIN_CASH,),
+    "tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg": (Network.TEZOS,),
+    "KT1PEGqt5rMmHpyaMXc8RFTFkkAUDrzSFRWk": (Network.TEZOS,),
+    "ookXoN2hrQ8aPU9yGsE7N5Q65mLXtTCjtYR4nmWUYq73od7mSrx": (Network.TEZOS,),
+    "EQBvW8Z5huBkMJYdnfAEM5JqTNkuWX3diqYENkWsIL0XggGG": (Network.TON,),
+    "9KLQbPaCE9eZq4NRBN4aqC1QVXu9eJAk8yYYFVgX7dkZ": (Network.SUI,),
+    "62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63": (
+        Network.BITCOIN_CASH,
+        Network.TON,
+    ),
+}
+
+
+def unregister(rule):
+    IDENTIFIER_RULES.remove(rule)
+    classification._trie = classification._build_trie(IDENTIFIER_RULES)
+
+
+class TestClassification(unittest.TestCase):
+    def test_networks(self):
+        for identifier, networks in IDENTIFIERS.items():
+            with self.subTest(identifier=identifier):
+                self.assertEqual(get_networks_for_identifier(identifier), networks)
+                self.assertEqual(
+                    get_networks_for_identifier(identifier, strict=True), networks
+                )
+        evm_networks = get_networks_for_identifier(
+            "0xf8e6480aaed82328e837172d4fb450826ec547cf"
+        )
+        self.assertEqual(evm_networks[:2], (Network.ETHEREUM, Network.MATIC))
+        self.assertNotIn(Network.SUI, evm_networks)
+        # Sui addresses look just like EVM transaction hashes
+        self.assertIn(
+            Network.SUI,
+            get_networks_for_identifier(
+                "0x6f13920eba73100469511a0df990c811ee89fd15fb5b3c95ec40f4d991fc90d4"
+            ),
+        )
+        for identifier in (
+            "",
+            "hello",
+            "0x123",
+            "tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXE0",
+        ):
+            self.assertEqual(classify_identifier(identifier), ())
+
+    def test_kinds(self):
+        self.assertEqual(
+            classify_identifier(" tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg\n"),
+            (
+                Candidate(Network.TEZOS, LinkKind.ACCOUNT),
+                Candidate(Network.TEZOS, LinkKind.TOKEN_WALLET),
+            ),
+        )
+        self.assertEqual(
+            classify_identifier("ookXoN2hrQ8aPU9yGsE7N5Q65mLXtTCjtYR4nmWUYq73od7mSrx"),
+            (Candidate(Network.TEZOS, LinkKind.TRANSACTION),),
+        )
+        # Every candidate can be linked to
+        for identifier in IDENTIFIERS:
+            for network, kind in classify_identifier(identifier):
+                self.assertTrue(get_explorer_url(network, kind, identifier))
+
+    def test_strict(self):
+        for identifier in (
+            # Each with one character changed, breaking its checksum
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAeD",
+            "simpleledger:qrgydxn0xnta6k4lkc4xmrltz4ghvlz7tq33dez6nw",
+            "tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEh",
+            "EQBvW8Z5huBkMJYdnfAEM5JqTNkuWX3diqYENkWsIL0XggGH",
+        ):
+            with self.subTest(identifier=identifier):
+                self.assertTrue(classify_identifier(identifier))
+                self.assertEqual(classify_identifier(identifier, strict=True), ())
+        for identifier in (
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+            "0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed",
+        ):
+            self.assertTrue(classify_identifier(identifier, strict=True))
+
+    def test_bulk(self):
+        identifiers = ["tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg", "nope"] * 2
+        self.assertEqual(
+            classify_identifiers(identifiers),
+            [classify_identifier(identifier) for identifier in identifiers],
+        )
+
+    def test_register_identifier_rule(self):
+        identifier = "ton:" + "a" * 64
+        self.assertEqual(classify_identifier(identifier), ())
+        rule = IdentifierRule("ton:", (68,), HEX, Network.TON, (LinkKind.TRANSACTION,))
+        register_identifier_rule(rule)
+        self.addCleanup(unregister, rule)
+        self.assertEqual(
+            classify_identifier(identifier),
+            (Candidate(Network.TON, LinkKind.TRANSACTION),),
+        )
@@ -0,0 +1,137 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stderr
+
+from blockchain_exploration.cli import JSONL, main, run
+
+CSV_INPUT = """network,kind,identifier,token_id
+matic,token,0x3011810abfec25777a01d5fbef08b2ad12860460,3191
+tezos,account,tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg,
+bitcoin-cash,transaction,62b2b7bdadbf17685bbdb1827adcec17928baab26cf7d96e3cc27855f741fe63,
+dogecoin,account,D8vFz4p1L37jdg47HXKtSHA5uYLYxbGgPD,
+ton,bogus,EQabc,
+"""
+
+
+class TestCommandLine(unittest.TestCase):
+    def run_csv(self, **kwargs):
+        output, errors = io.StringIO(), io.StringIO()
+        failures = run(
+            input=io.StringIO(CSV_INPUT), output=output, errors=errors, **kwargs
+        )
+        return failures, output.getvalue().splitlines(), errors.getvalue().splitlines()
+
+    def test_csv(self):
+        failures, output, errors = self.run_csv()
+        self.assertEqual(failures, 2)
+        self.assertEqual(output[0], "network,kind,identifier,token_id,url")
+        self.assertEqual(
+            output[1],
+            "matic,token,0x3011810abfec25777a01d5fbef08b2ad12860460,3191,"
+            "https://polygonscan.com/token/0x3011810abfec25777a01d5fbef08b2ad12860460/?a=3191",
+        )
+        self.assertTrue(
+            output[2].endswith(
+                ",https://tzkt.io/tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg/operations/"
+            )
+        )
+        self.assertTrue(output[4].endswith(","))
+        self.assertEqual([json.loads(error)["row"] for error in errors], [4, 5])
+        self.assertEqual(json.loads(errors[0])["error"], "NotImplementedError")
+        self.assertEqual(json.loads(errors[1])["error"], "ValueError")
+
+    def test_malformed_csv_rows(self):
+        output, errors = io.StringIO(), io.StringIO()
+        failures = run(
+            input=io.StringIO(
+                "network,kind,identifier,token_id\n"
+                "matic,transaction\n"
+                "matic,transaction,0xd3d4,,extra\n"
+                "matic,transaction,0xd3d4\n"
+            ),
+            output=output,
+            errors=errors,
+        )
+        self.assertEqual(failures, 2)
+        self.assertEqual(
+            output.getvalue().splitlines()[1:],
+            [
+                "matic,transaction,,,",
+                "matic,transaction,0xd3d4,,",
+                "matic,transaction,0xd3d4,,https://polygonscan.com/tx/0xd3d4",
+            ],
+        )
+        errors = [json.loads(error) for error in errors.getvalue().splitlines()]
+        self.assertEqual(
+            [(error["row"], error["error"]) for error in errors],
+            [(1, "KeyError"), (2, "ValueError")],
+        )
+
+    def test_workers_keep_order(self):
+        self.assertEqual(
+            self.run_csv(workers=2, chunk_size=1), self.run_csv(chunk_size=1)
+        )
+
+    def test_jsonl(self):
+        output, errors = io.StringIO(), io.StringIO()
+        rows = [
+            {"network": "matic", "kind": "transaction", "identifier": "0xd3d4"},
+            {"network": "matic", "kind": "account"},
+            {"network": "matic", "kind": ["account"], "identifier": "0xd3d4"},
+        ]
+        lines = [json.dumps(row) for row in rows] + ["not json", "[1]"]
+        failures = run(
+            input=io.StringIO("".join(line + "\n" for line in lines)),
+            output=output,
+            errors=errors,
+            format=JSONL,
+        )
+        self.assertEqual(failures, 4)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(results), 5)
+        self.assertEqual(results[0]["url"], "https://polygonscan.com/tx/0xd3d4")
+        self.assertEqual(results[3:], [{"url": None}, {"url": None}])
+        errors = [json.loads(line) for line in errors.getvalue().splitlines()]
+        self.assertEqual(
+            [(error["row"], error["error"]) for error in errors],
+            [(2, "KeyError"), (3, "ValueError"), (4, "ValueError"), (5, "ValueError")],
+        )
+
+    def test_jsonl_token_ids(self):
+        output = io.StringIO()
+        rows = [
+            {"network": "matic", "kind": "token", "identifier": "0xabc", "token_id": 0},
+            {
+                "network": "matic",
+                "kind": "account",
+                "identifier": "0xabc",
+                "token_id": "",
+            },
+        ]
+        failures = run(
+            input=io.StringIO("".join(json.dumps(row) + "\n" for row in rows)),
+            output=output,
+            errors=io.StringIO(),
+            format=JSONL,
+        )
+        self.assertEqual(failures, 0)
+        self.assertEqual(
+            [json.loads(line)["url"] for line in output.getvalue().splitlines()],
+            [
+                "https://polygonscan.com/token/0xabc/?a=0",
+                "https://polygonscan.com/address/0xabc",
+            ],
+        )
+
+    def test_invalid_chunk_size(self):
+        for chunk_size in (0, -1):
+            with self.subTest(chunk_size=chunk_size):
+                with self.assertRaises(ValueError):
+                    self.run_csv(chunk_size=chunk_size)
+                with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                    main(["--chunk-size", str(chunk_size)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import threading
+import unittest
+
+from blockchain_exploration.config import (
+    ExplorerConfig,
+    get_default_config,
+    reload_default_config,
+    set_default_config,
+)
+from blockchain_exploration.exploration import (
+    get_base_path,
+    get_explorer_url_for_account,
+)
+from blockchain_exploration.types import Network
+
+
+class TestExplorerConfig(unittest.TestCase):
+    def test_from_environ(self):
+        config = ExplorerConfig.from_environ(
+            {
+                "EXPLORER_BASEPATH": "https://blockchair.com/bitcoin-cash",
+                "MATIC_EXPLORER_BASEPATH": "https://opensea.io/",
+            }
+        )
+        self.assertEqual(
+            config.get_base_path(Network.BITCOIN_CASH),
+            "https://blockchair.com/bitcoin-cash",
+        )
+        self.assertEqual(config.get_base_path(Network.MATIC), "https://opensea.io")
+        self.assertEqual(config.get_base_path(Network.TEZOS), "https://tzkt.io")
+        with self.assertRaises(TypeError):
+            config.base_paths[Network.TEZOS] = "https://better-call.dev"
+        with self.assertRaises(NotImplementedError):
+            config.get_base_path("unknown")
+
+    def test_slp_explorer_takes_precedence(self):
+        config = ExplorerConfig.from_environ(
+            {
+                "SLP_EXPLORER_BASEPATH": "https://simpleledger.info/",
+                "EXPLORER_BASEPATH": "https://blockchair.com/bitcoin-cash",
+            }
+        )
+        self.assertEqual(
+            config.get_base_path(Network.BITCOIN_CASH), "https://simpleledger.info"
+        )
+
+    def test_url_builders_accept_config(self):
+        config = ExplorerConfig.from_environ(
+            {"ETH_EXPLORER_BASEPATH": "https://sepolia.etherscan.io"}
+        )
+        self.assertEqual(
+            get_explorer_url_for_account(
+                network=Network.ETHEREUM, address="0xabc", config=config
+            ),
+            "https://sepolia.etherscan.io/address/0xabc",
+        )
+
+    def test_reload_default_config(self):
+        original = get_default_config()
+        try:
+            reload_default_config(
+                {"TON_EXPLORER_BASEPATH": "https://testnet.tonscan.org"}
+            )
+            self.assertEqual(get_base_path(Network.TON), "https://testnet.tonscan.org")
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(get_default_config()))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len({id(config) for config in results}), 1)
+        finally:
+            set_default_config(original)
+        self.assertEqual(
+            get_base_path(Network.TON), original.get_base_path(Network.TON)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
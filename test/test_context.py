@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import unittest
+
+from blockchain_exploration.config import ExplorerConfig, get_current_config
+from blockchain_exploration.context import ExplorerContext
+from blockchain_exploration.exploration import (
+    get_base_path,
+    get_explorer_url_for_account,
+    get_explorer_url_for_transaction,
+    get_explorer_urls_for_transactions,
+)
+from blockchain_exploration.instrumentation import (
+    disable_instrumentation,
+    enable_instrumentation,
+)
+from blockchain_exploration.parsing import parse_explorer_url
+from blockchain_exploration.types import EvmAddressCase, Network
+
+SEPOLIA = "https://sepolia.etherscan.io"
+
+
+class TestExplorerContext(unittest.TestCase):
+    def test_context_manager(self):
+        default = get_current_config()
+        with ExplorerContext(base_paths={Network.ETHEREUM: SEPOLIA + "/"}) as config:
+            self.assertIs(get_current_config(), config)
+            self.assertEqual(get_base_path(Network.ETHEREUM), SEPOLIA)
+            self.assertEqual(
+                get_explorer_url_for_transaction(Network.ETHEREUM, "0x1"),
+                f"{SEPOLIA}/tx/0x1",
+            )
+            self.assertEqual(
+                get_explorer_urls_for_transactions(Network.ETHEREUM, ["0x2"]),
+                [f"{SEPOLIA}/tx/0x2"],
+            )
+            # Other networks keep their explorers
+            self.assertEqual(get_base_path(Network.TEZOS), "https://tzkt.io")
+            with ExplorerContext(base_paths={Network.ETHEREUM: "https://opensea.io"}):
+                self.assertEqual(
+                    get_explorer_url_for_account(Network.ETHEREUM, "0xabc"),
+                    "https://opensea.io/0xabc",
+                )
+            self.assertEqual(get_base_path(Network.ETHEREUM), SEPOLIA)
+            # An explicit config or base path still wins
+            self.assertEqual(
+                get_base_path(Network.ETHEREUM, config=default), "https://etherscan.io"
+            )
+            self.assertEqual(parse_explorer_url(f"{SEPOLIA}/tx/0x1").base_path, SEPOLIA)
+        self.assertIs(get_current_config(), default)
+
+    def test_options(self):
+        with ExplorerContext(evm_address_case=EvmAddressCase.CHECKSUM):
+            self.assertEqual(
+                get_explorer_url_for_account(
+                    Network.ETHEREUM, "0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed"
+                ),
+                "https://etherscan.io/address/0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+            )
+        config = ExplorerConfig.from_base_paths({Network.TON: "https://tonviewer.com"})
+        with ExplorerContext(config):
+            with self.assertRaises(NotImplementedError):
+                get_base_path(Network.TEZOS)
+        # Bad base paths are rejected straight away
+        with self.assertRaises(ValueError):
+            ExplorerContext(base_paths={Network.TEZOS: "tzkt.io"})
+
+    def test_decorator(self):
+        @ExplorerContext(base_paths={Network.MATIC: "https://amoy.polygonscan.com"})
+        def build(transaction_hash):
+            return get_explorer_url_for_transaction(Network.MATIC, transaction_hash)
+
+        self.assertEqual(build("0x1"), "https://amoy.polygonscan.com/tx/0x1")
+        self.assertEqual(
+            get_explorer_url_for_transaction(Network.MATIC, "0x1"),
+            "https://polygonscan.com/tx/0x1",
+        )
+
+    def test_follows_default_config(self):
+        # Made before the default config changes, eg as a decorator at import time
+        context = ExplorerContext(
+            base_paths={Network.MATIC: "https://amoy.polygonscan.com"}
+        )
+        instrumentation = enable_instrumentation()
+        try:
+            with context as config:
+                self.assertIs(config.instrumentation, instrumentation)
+                self.assertEqual(
+                    get_base_path(Network.MATIC), "https://amoy.polygonscan.com"
+                )
+        finally:
+            disable_instrumentation()
+        with context as config:
+            self.assertIsNone(config.instrumentation)
+
+    def test_asyncio_tasks(self):
+        testnet = ExplorerContext(base_paths={Network.ETHEREUM: SEPOLIA})
+
+        @testnet
+        async def build_testnet(started, resume):
+            started.set()
+            await resume.wait()
+            return get_explorer_url_for_transaction(Network.ETHEREUM, "0x1")
+
+        async def build_mainnet(started, resume):
+            await started.wait()
+            url = get_explorer_url_for_transaction(Network.ETHEREUM, "0x1")
+            resume.set()
+            return url
+
+        async def main():
+            started, resume = asyncio.Event(), asyncio.Event()
+            return await asyncio.gather(
+                build_testnet(started, resume), build_mainnet(started, resume)
+            )
+
+        self.assertEqual(
+            asyncio.run(main()),
+            [f"{SEPOLIA}/tx/0x1", "https://etherscan.io/tx/0x1"],
+        )
+
+    def test_threads(self):
+        # A single context can be entered by several threads at once
+        context = ExplorerContext(base_paths={Network.ETHEREUM: SEPOLIA})
+        barrier = threading.Barrier(4)
+        results = []
+
+        def build(use_context):
+            if use_context:
+                with context:
+                    barrier.wait()
+                    results.append(get_base_path(Network.ETHEREUM))
+                    barrier.wait()
+            else:
+                barrier.wait()
+                results.append(get_base_path(Network.ETHEREUM))
+                barrier.wait()
+
+        threads = [
+            threading.Thread(target=build, args=(index % 2 == 0,)) for index in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), ["https://etherscan.io"] * 2 + [SEPOLIA] * 2)
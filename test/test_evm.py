@@ -0,0 +1,101 @@
+import unittest
+
+from blockchain_exploration.config import ExplorerConfig
+from blockchain_exploration.evm import (
+    canonicalize_evm_address,
+    canonicalize_evm_addresses,
+    keccak_256,
+    to_checksum_address,
+)
+from blockchain_exploration.exploration import (
+    get_explorer_url_for_account,
+    get_explorer_url_for_nft_contract,
+    get_explorer_url_for_transaction,
+)
+from blockchain_exploration.types import EvmAddressCase, Network
+
+
+class TestEvmAddresses(unittest.TestCase):
+    # https://eips.ethereum.org/EIPS/eip-55#test-cases
+    checksummed = [
+        "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+        "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+        "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+        "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+    ]
+
+    def test_keccak_256(self):
+        self.assertEqual(
+            keccak_256(b"").hex(),
+            "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470",
+        )
+        self.assertEqual(
+            keccak_256(b"The quick brown fox jumps over the lazy dog").hex(),
+            "4d741b6f1eb29cb2a9b9911c82f56fa8d73b04959d3d9d222895df6c0b28aa15",
+        )
+
+    def test_to_checksum_address(self):
+        for address in self.checksummed:
+            self.assertEqual(to_checksum_address(address.lower()), address)
+            self.assertEqual(
+                to_checksum_address(address.upper().replace("0X", "0x")), address
+            )
+        for address in (
+            "0x123",
+            "tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg",
+            "0x" + "g" * 40,
+        ):
+            with self.assertRaises(ValueError):
+                to_checksum_address(address)
+
+    def test_canonicalize_evm_addresses(self):
+        addresses = [address.lower() for address in self.checksummed] * 3
+        self.assertEqual(canonicalize_evm_addresses(addresses), self.checksummed * 3)
+        self.assertEqual(
+            canonicalize_evm_addresses(self.checksummed, EvmAddressCase.LOWER),
+            addresses[:4],
+        )
+        with self.assertRaises(ValueError):
+            canonicalize_evm_address(self.checksummed[0], "title")
+
+    def test_url_builders(self):
+        contract = "0xc4df6018f90f91bad7e24f89279305715b3a276f"
+        config = ExplorerConfig.from_environ(
+            {"EVM_ADDRESS_CASE": EvmAddressCase.CHECKSUM}
+        )
+        self.assertEqual(
+            get_explorer_url_for_nft_contract(
+                network=Network.ETHEREUM, contract_address=contract, config=config
+            ),
+            "https://etherscan.io/token/0xC4df6018F90f91baD7e24f89279305715B3A276F",
+        )
+        config = ExplorerConfig.from_environ({"EVM_ADDRESS_CASE": EvmAddressCase.LOWER})
+        self.assertEqual(
+            get_explorer_url_for_account(
+                network=Network.MATIC,
+                address="0x3AFac8309C2a93406c326dbb9Ab2578F3ed165d9",
+                config=config,
+            ),
+            "https://polygonscan.com/address/0x3afac8309c2a93406c326dbb9ab2578f3ed165d9",
+        )
+        # Only addresses are canonicalized
+        transaction_hash = (
+            "0xD3d4de1612017d7e8c69c70879ab4ba3b2f4e2c638f05b5d13b2c417e46f5be2"
+        )
+        self.assertTrue(
+            get_explorer_url_for_transaction(
+                network=Network.MATIC, transaction_hash=transaction_hash, config=config
+            ).endswith(transaction_hash)
+        )
+        self.assertEqual(
+            get_explorer_url_for_account(
+                network=Network.TEZOS,
+                address="tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg",
+                config=config,
+            ),
+            "https://tzkt.io/tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg/operations/",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from blockchain_exploration.config import ExplorerConfig
+from blockchain_exploration.exploration import (
+    get_base_path,
+    get_explorer_url_for_account,
+    get_explorer_url_for_transaction,
+)
+from blockchain_exploration.explorer_health import (
+    ExplorerSelector,
+    get_candidate_base_paths,
+)
+from blockchain_exploration.link_health import LinkHealth
+from blockchain_exploration.types import LinkKind, Network
+
+
+class StubExplorerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status, delay = self.server.status, self.server.delay
+        time.sleep(delay)
+        body = b"explorer"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestExplorerSelector(unittest.TestCase):
+    def start_server(self, status=200, delay=0.0) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubExplorerHandler)
+        server.status = status
+        server.delay = delay
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        ).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_stub_servers(self):
+        primary = self.start_server()
+        fallback = self.start_server()
+        primary_path = f"http://127.0.0.1:{primary.server_address[1]}"
+        fallback_path = f"http://127.0.0.1:{fallback.server_address[1]}"
+        clock = FakeClock()
+        selector = ExplorerSelector(
+            {Network.TEZOS: [primary_path, fallback_path]},
+            failure_threshold=2,
+            cooldown=60,
+            clock=clock,
+        )
+        self.addCleanup(selector.stop)
+        config = ExplorerConfig.from_base_paths(
+            {Network.TEZOS: "https://tzkt.io"}, explorer_selector=selector
+        )
+        self.assertEqual(get_base_path(Network.TEZOS, config=config), primary_path)
+        selector.probe_all()
+        self.assertIsNotNone(selector.snapshot()[primary_path].latency)
+        self.assertEqual(get_base_path(Network.TEZOS, config=config), primary_path)
+        # One failure demotes the primary, but it isn't avoided until the circuit opens
+        primary.status = 503
+        selector.probe_all()
+        self.assertEqual(
+            selector.ranked_base_paths(Network.TEZOS), (fallback_path, primary_path)
+        )
+        self.assertTrue(selector.snapshot()[primary_path].healthy)
+        selector.probe_all()
+        self.assertFalse(selector.snapshot()[primary_path].healthy)
+        self.assertEqual(selector.snapshot()[primary_path].error, "HTTP 503")
+        self.assertEqual(
+            get_explorer_url_for_account(Network.TEZOS, "tz1abc", config=config),
+            f"{fallback_path}/tz1abc/operations/",
+        )
+        # The open circuit isn't probed again until the cooldown has passed
+        primary.status = 200
+        clock.now = 30
+        selector.probe_all()
+        self.assertFalse(selector.snapshot()[primary_path].healthy)
+        clock.now = 61
+        selector.probe_all()
+        self.assertTrue(selector.snapshot()[primary_path].healthy)
+        self.assertEqual(get_base_path(Network.TEZOS, config=config), primary_path)
+        # Networks the selector doesn't manage use the config
+        self.assertIsNone(selector.get_base_path(Network.SUI))
+
+    def test_latency(self):
+        slow = self.start_server(delay=0.3)
+        fast = self.start_server()
+        slow_path = f"http://127.0.0.1:{slow.server_address[1]}"
+        fast_path = f"http://127.0.0.1:{fast.server_address[1]}"
+        selector = ExplorerSelector(
+            {Network.TON: [slow_path, fast_path]}, latency_resolution=0.1
+        )
+        self.addCleanup(selector.stop)
+        self.assertEqual(selector.get_base_path(Network.TON), slow_path)
+        selector.probe_all()
+        self.assertEqual(selector.get_base_path(Network.TON), fast_path)
+
+    def test_background_probing(self):
+        server = self.start_server()
+        base_path = f"http://127.0.0.1:{server.server_address[1]}"
+        with ExplorerSelector(
+            {Network.SUI: [base_path]}, probe_interval=0.01
+        ) as selector:
+            for _ in range(500):
+                if selector.snapshot()[base_path].last_checked is not None:
+                    break
+                time.sleep(0.01)
+        self.assertIsNotNone(selector.snapshot()[base_path].latency)
+        # And can be started again once stopped
+        selector.start()
+        selector.stop()
+        self.assertIsNotNone(selector.probe_all()[base_path].latency)
+        selector.stop()
+
+    def test_link_kind_support(self):
+        # OpenSea is preferred, but has no transaction pages
+        latencies = {"https://opensea.io": 0.1, "https://etherscan.io": 1.0}
+        selector = ExplorerSelector(
+            {Network.ETHEREUM: ["https://etherscan.io", "https://opensea.io"]},
+            probe=lambda base_paths: [
+                LinkHealth(url=base_path, ok=True, elapsed=latencies[base_path])
+                for base_path in base_paths
+            ],
+        )
+        selector.probe_all()
+        config = ExplorerConfig.from_base_paths(
+            {Network.ETHEREUM: "https://etherscan.io"}, explorer_selector=selector
+        )
+        self.assertEqual(
+            get_explorer_url_for_account(Network.ETHEREUM, "0xabc", config=config),
+            "https://opensea.io/0xabc",
+        )
+        self.assertEqual(
+            get_explorer_url_for_transaction(Network.ETHEREUM, "0x123", config=config),
+            "https://etherscan.io/tx/0x123",
+        )
+        # Even while etherscan is down, as it's the only one that can link to transactions
+        selector = ExplorerSelector(
+            {Network.ETHEREUM: ["https://etherscan.io", "https://opensea.io"]},
+            failure_threshold=1,
+            probe=lambda base_paths: [
+                LinkHealth(url=base_path, ok=base_path == "https://opensea.io")
+                for base_path in base_paths
+            ],
+        )
+        selector.probe_all()
+        self.assertEqual(
+            selector.get_base_path(Network.ETHEREUM, LinkKind.TRANSACTION),
+            "https://etherscan.io",
+        )
+        self.assertEqual(
+            selector.get_base_path(Network.ETHEREUM, LinkKind.ACCOUNT),
+            "https://opensea.io",
+        )
+
+    def test_get_candidate_base_paths(self):
+        candidates = get_candidate_base_paths(ExplorerConfig.from_environ({}))
+        self.assertEqual(
+            candidates[Network.TEZOS],
+            ("https://tzkt.io", "https://better-call.dev/mainnet"),
+        )
+        self.assertEqual(candidates[Network.SUI], ("https://suiscan.xyz/mainnet",))
@@ -0,0 +1,211 @@
+import threading
+import unittest
+
+from blockchain_exploration.config import ExplorerConfig, get_default_config
+from blockchain_exploration.exploration import (
+    get_explorer_url_for_account,
+    get_explorer_url_for_token,
+    get_explorer_url_for_token_wallet,
+    get_explorer_url_for_transaction,
+    get_explorer_urls_for_transactions,
+    get_link_template,
+)
+from blockchain_exploration.instrumentation import (
+    EMPTY,
+    INVALID,
+    LATENCY_BUCKETS_NS,
+    NOT_IMPLEMENTED,
+    OK,
+    PLACEHOLDER,
+    Instrumentation,
+    disable_instrumentation,
+    enable_instrumentation,
+)
+from blockchain_exploration.templates import CompiledTemplate
+from blockchain_exploration.types import ExplorerFlavour, LinkKind, Network
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+        self.config = ExplorerConfig.from_environ({})._replace(
+            instrumentation=self.instrumentation
+        )
+
+    def test_counts(self):
+        for _ in range(3):
+            get_explorer_url_for_transaction(Network.TEZOS, "oo1", config=self.config)
+        get_explorer_urls_for_transactions(
+            Network.TEZOS, ["oo2", "oo3"], config=self.config
+        )
+        self.assertEqual(
+            get_explorer_url_for_token_wallet(Network.SUI, "0xabc", config=self.config),
+            "https://suiscan.xyz/mainnet/not-implemented/",
+        )
+        self.assertIsNone(
+            get_link_template(
+                Network.ETHEREUM, LinkKind.ACCOUNT, config=self.config
+            ).build("")
+        )
+        with self.assertRaises(NotImplementedError):
+            get_explorer_url_for_transaction(
+                Network.ETHEREUM,
+                "0x123",
+                base_path="https://opensea.io",
+                config=self.config,
+            )
+        with self.assertRaises(ValueError):
+            get_explorer_url_for_account(Network.TON, "a/b", config=self.config)
+        # Outcomes decided before or without a template are counted too
+        self.assertIsNone(
+            get_explorer_url_for_account(Network.ETHEREUM, "", config=self.config)
+        )
+        with self.assertRaises(NotImplementedError):
+            get_explorer_url_for_transaction("dogecoin", "0x1", config=self.config)
+        with self.assertRaises(ValueError):
+            get_explorer_url_for_account(
+                Network.ETHEREUM, "0x1", base_path="etherscan.io", config=self.config
+            )
+        snapshot = self.instrumentation.snapshot()
+        self.assertEqual(
+            snapshot.counts,
+            {
+                (
+                    "get_explorer_url_for_transaction",
+                    Network.TEZOS,
+                    ExplorerFlavour.DEFAULT,
+                    OK,
+                ): 5,
+                (
+                    "get_explorer_url_for_token_wallet",
+                    Network.SUI,
+                    ExplorerFlavour.DEFAULT,
+                    PLACEHOLDER,
+                ): 1,
+                (
+                    "get_explorer_url_for_account",
+                    Network.ETHEREUM,
+                    ExplorerFlavour.DEFAULT,
+                    EMPTY,
+                ): 2,
+                (
+                    "get_explorer_url_for_transaction",
+                    Network.ETHEREUM,
+                    ExplorerFlavour.OPENSEA,
+                    NOT_IMPLEMENTED,
+                ): 1,
+                (
+                    "get_explorer_url_for_account",
+                    Network.TON,
+                    ExplorerFlavour.DEFAULT,
+                    INVALID,
+                ): 1,
+                (
+                    "get_explorer_url_for_transaction",
+                    "dogecoin",
+                    ExplorerFlavour.DEFAULT,
+                    NOT_IMPLEMENTED,
+                ): 1,
+                (
+                    "get_explorer_url_for_account",
+                    Network.ETHEREUM,
+                    ExplorerFlavour.DEFAULT,
+                    INVALID,
+                ): 1,
+            },
+        )
+        histogram = snapshot.latencies[
+            ("get_explorer_url_for_transaction", Network.TEZOS, ExplorerFlavour.DEFAULT)
+        ]
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(len(histogram.buckets), len(LATENCY_BUCKETS_NS) + 1)
+        self.assertGreater(histogram.sum_ns, 0)
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.snapshot().counts, {})
+
+    def test_disabled(self):
+        # Without instrumentation, the compiled templates are used directly
+        self.assertIs(
+            type(
+                get_link_template(
+                    Network.TEZOS,
+                    LinkKind.ACCOUNT,
+                    config=ExplorerConfig.from_environ({}),
+                )
+            ),
+            CompiledTemplate,
+        )
+
+    def test_threads(self):
+        def build():
+            for _ in range(1000):
+                get_explorer_url_for_token(
+                    Network.MATIC, "0xabc", "1", config=self.config
+                )
+
+        threads = [threading.Thread(target=build) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(
+            self.instrumentation.snapshot().counts,
+            {
+                (
+                    "get_explorer_url_for_token",
+                    Network.MATIC,
+                    ExplorerFlavour.DEFAULT,
+                    OK,
+                ): 4000
+            },
+        )
+
+    def test_hooks(self):
+        events = []
+        self.instrumentation.add_hook(events.append)
+        get_explorer_url_for_account(Network.TEZOS, "tz1", config=self.config)
+        self.instrumentation.remove_hook(events.append)
+        get_explorer_url_for_account(Network.TEZOS, "tz1", config=self.config)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(
+            events[0][:4],
+            (
+                "get_explorer_url_for_account",
+                Network.TEZOS,
+                ExplorerFlavour.DEFAULT,
+                OK,
+            ),
+        )
+        self.assertEqual(events[0].url, "https://tzkt.io/tz1/operations/")
+
+    def test_export_prometheus(self):
+        get_explorer_url_for_account(Network.TEZOS, "tz1", config=self.config)
+        text = self.instrumentation.export_prometheus()
+        labels = (
+            'function="get_explorer_url_for_account",network="tezos",flavour="default"'
+        )
+        self.assertIn("# TYPE explorer_url_builds_total counter\n", text)
+        self.assertIn(f'explorer_url_builds_total{{{labels},outcome="ok"}} 1\n', text)
+        self.assertIn(
+            f'explorer_url_build_seconds_bucket{{{labels},le="+Inf"}} 1\n', text
+        )
+        self.assertIn(f"explorer_url_build_seconds_count{{{labels}}} 1\n", text)
+        # The sum isn't rounded
+        histogram = self.instrumentation.snapshot().latencies[
+            ("get_explorer_url_for_account", Network.TEZOS, ExplorerFlavour.DEFAULT)
+        ]
+        self.assertIn(
+            f"explorer_url_build_seconds_sum{{{labels}}} {histogram.sum_ns / 1e9!r}\n",
+            text,
+        )
+
+    def test_enable_instrumentation(self):
+        previous = get_default_config()
+        instrumentation = enable_instrumentation()
+        try:
+            get_explorer_url_for_account(Network.TEZOS, "tz1")
+        finally:
+            disable_instrumentation()
+        get_explorer_url_for_account(Network.TEZOS, "tz1")
+        self.assertEqual(sum(instrumentation.snapshot().counts.values()), 1)
+        self.assertEqual(get_default_config().base_paths, previous.base_paths)
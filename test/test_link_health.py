@@ -0,0 +1,161 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from blockchain_exploration.link_health import (
+    HostRateLimiter,
+    LinkChecker,
+    iter_explorer_links,
+)
+from blockchain_exploration.types import LinkKind, Network
+
+
+class StubExplorerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    pages = {
+        "/address/0xabc": (200, "<h1>Transactions</h1> Txn Hash 0x123"),
+        "/token/0xabc": (
+            200,
+            "<p>You need to run this app without JavaScript enabled</p>",
+        ),
+        "/empty": (200, ""),
+        "/irrelevant": (200, "Nothing to see here"),
+        "/unknown-charset": (200, "Txn Hash 0x123"),
+    }
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.client_ports.add(self.client_address[1])
+            server.requests += 1
+            attempts = server.attempts[self.path] = (
+                server.attempts.get(self.path, 0) + 1
+            )
+        if self.path == "/flaky" and attempts == 1:
+            return self.respond(503, "Try again")
+        if self.path == "/flaky":
+            return self.respond(200, "hash")
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/address/0xabc")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status, text = self.pages.get(self.path, (404, "Not found"))
+        self.respond(status, text)
+
+    def respond(self, status: int, text: str):
+        body = text.encode()
+        charset = "foo" if self.path == "/unknown-charset" else "utf-8"
+        self.send_response(status)
+        self.send_header("Content-Type", f"text/html; charset={charset}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLinkChecker(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubExplorerHandler)
+        self.server.lock = threading.Lock()
+        self.server.client_ports = set()
+        self.server.attempts = {}
+        self.server.requests = 0
+        threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        ).start()
+        self.base_path = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.checker = LinkChecker(
+            workers=4,
+            connections_per_host=2,
+            requests_per_second_per_host=None,
+            backoff=0,
+        )
+
+    def tearDown(self):
+        self.checker.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_check(self):
+        result = self.checker.check(f"{self.base_path}/address/0xabc", "transaction")
+        self.assertTrue(result.ok)
+        self.assertTrue(result.expected_text_found)
+        result = self.checker.check(f"{self.base_path}/token/0xabc", "hash")
+        self.assertTrue(result.ok)
+        self.assertTrue(result.loading_javascript)
+        # Pages in charsets Python doesn't know are read as UTF-8
+        result = self.checker.check(f"{self.base_path}/unknown-charset", "hash")
+        self.assertTrue(result.expected_text_found)
+        for path, error in (
+            ("/empty", "Empty response"),
+            ("/irrelevant", "Expected text not found: hash"),
+            ("/missing", "HTTP 404"),
+        ):
+            result = self.checker.check(f"{self.base_path}{path}", "hash")
+            self.assertFalse(result.ok)
+            self.assertEqual(result.error, error)
+
+    def test_retries_and_redirects(self):
+        result = self.checker.check(f"{self.base_path}/flaky", "hash")
+        self.assertTrue(result.ok)
+        self.assertEqual(result.attempts, 2)
+        result = self.checker.check(f"{self.base_path}/moved", "transaction")
+        self.assertTrue(result.ok)
+        self.assertEqual(result.attempts, 1)
+
+    def test_connection_error(self):
+        self.server.shutdown()
+        self.server.server_close()
+        result = self.checker.check(f"{self.base_path}/address/0xabc")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.attempts, 3)
+
+    def test_check_all_pools_connections(self):
+        urls = [f"{self.base_path}/address/0xabc"] * 40
+        results = list(self.checker.check_all((url, "hash") for url in urls))
+        self.assertEqual(len(results), 40)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(self.server.requests, 40)
+        # Connections are reused rather than opened for each request
+        self.assertLess(len(self.server.client_ports), 40)
+
+    def test_iter_explorer_links(self):
+        links = list(
+            iter_explorer_links(
+                [
+                    (Network.ETHEREUM, LinkKind.ACCOUNT, "0xabc", None),
+                    (Network.ETHEREUM, LinkKind.ACCOUNT, "", None),
+                    (Network.BITCOIN_CASH, LinkKind.TOKEN, "62b2", None),
+                    ("unknown", LinkKind.TRANSACTION, "0x123", None),
+                ]
+            )
+        )
+        self.assertEqual(
+            links,
+            [
+                ("https://etherscan.io/address/0xabc", "transaction"),
+                ("https://simpleledger.info/token/62b2", "hash"),
+            ],
+        )
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    def test_wait(self):
+        now = [0.0]
+        sleeps = []
+        rate_limiter = HostRateLimiter(
+            requests_per_second=2, clock=lambda: now[0], sleep=sleeps.append
+        )
+        for _ in range(3):
+            rate_limiter.wait()
+        self.assertEqual(sleeps, [0.5, 1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+import unittest
+
+from benchmarks.benchmark_exploration import SAMPLE_IDENTIFIERS
+from blockchain_exploration.config import ALTERNATE_BASE_PATHS, ExplorerConfig
+from blockchain_exploration.exploration import get_explorer_url
+from blockchain_exploration.parsing import (
+    ParsedExplorerUrl,
+    parse_explorer_url,
+    parse_explorer_urls,
+)
+from blockchain_exploration.templates import LinkTemplate, register_link_templates
+from blockchain_exploration.types import ExplorerFlavour, LinkKind, Network
+
+from .registries import restored_registries
+
+
+class TestParseExplorerUrl(unittest.TestCase):
+    def test_round_trip(self):
+        for network, (
+            account,
+            contract,
+            token_id,
+            transaction_hash,
+        ) in SAMPLE_IDENTIFIERS.items():
+            for base_path in [None, *ALTERNATE_BASE_PATHS.get(network, ())]:
+                for kind, identifier, token in [
+                    (LinkKind.ACCOUNT, account, None),
+                    (LinkKind.TOKEN_WALLET, account, None),
+                    (LinkKind.NFT_CONTRACT, contract, None),
+                    (LinkKind.TOKEN, contract, token_id),
+                    (LinkKind.TRANSACTION, transaction_hash, None),
+                ]:
+                    try:
+                        url = get_explorer_url(
+                            network, kind, identifier, token, base_path=base_path
+                        )
+                    except NotImplementedError:
+                        continue
+                    if "/not-implemented/" in url:
+                        self.assertIsNone(parse_explorer_url(url))
+                        continue
+                    with self.subTest(url=url):
+                        parsed = parse_explorer_url(url)
+                        self.assertIsNotNone(parsed)
+                        self.assertEqual(
+                            get_explorer_url(
+                                parsed.network,
+                                parsed.kind,
+                                parsed.identifier,
+                                parsed.token_id,
+                                base_path=parsed.base_path,
+                            ),
+                            url,
+                        )
+
+    def test_parse(self):
+        self.assertEqual(
+            parse_explorer_url(
+                "https://polygonscan.com/token/0x3011810abfec25777a01d5fbef08b2ad12860460/?a=3191"
+            ),
+            ParsedExplorerUrl(
+                network=Network.MATIC,
+                kind=LinkKind.TOKEN,
+                identifier="0x3011810abfec25777a01d5fbef08b2ad12860460",
+                token_id="3191",
+                base_path="https://polygonscan.com",
+            ),
+        )
+        # Hosts are case insensitive, and http links are recognised too
+        self.assertEqual(
+            parse_explorer_url("http://EtherScan.io/address/0xabc#tokentxnsErc721"),
+            ParsedExplorerUrl(
+                network=Network.ETHEREUM,
+                kind=LinkKind.TOKEN_WALLET,
+                identifier="0xabc",
+                token_id=None,
+                base_path="https://etherscan.io",
+            ),
+        )
+        self.assertEqual(
+            parse_explorer_url(
+                "https://tzkt.io/ookXoN2hrQ8aPU9yGsE7N5Q65mLXtTCjtYR4nmWUYq73od7mSrx"
+            ).kind,
+            LinkKind.TRANSACTION,
+        )
+        self.assertEqual(
+            parse_explorer_url("https://suiscan.xyz/mainnet/object/0x5d3a").token_id,
+            "0x5d3a",
+        )
+
+    def test_normalised_paths(self):
+        for url, expected in [
+            ("https://etherscan.io/address/0xabc/", (LinkKind.ACCOUNT, "0xabc", None)),
+            (
+                "https://etherscan.io/tx/0xabc?utm_source=x",
+                (LinkKind.TRANSACTION, "0xabc", None),
+            ),
+            (
+                "https://polygonscan.com/token/0xabc?a=5",
+                (LinkKind.TOKEN, "0xabc", "5"),
+            ),
+            (
+                "https://etherscan.io/token/0xabc/?a=1&b=2",
+                (LinkKind.TOKEN, "0xabc", "1"),
+            ),
+            (
+                "https://polygonscan.com/token/0xabc?utm_source=x&a=5",
+                (LinkKind.TOKEN, "0xabc", "5"),
+            ),
+            (
+                "https://tzkt.io/tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg/operations",
+                (LinkKind.ACCOUNT, "tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg", None),
+            ),
+        ]:
+            with self.subTest(url=url):
+                parsed = parse_explorer_url(url)
+                self.assertEqual(
+                    (parsed.kind, parsed.identifier, parsed.token_id), expected
+                )
+
+    def test_networks_registered_later(self):
+        network = "example-chain"
+        config = ExplorerConfig.from_base_paths(
+            {network: "https://explorer.example.org"}
+        )
+        url = "https://explorer.example.org/wallet/abc"
+        self.assertIsNone(parse_explorer_url(url, config=config))
+        with restored_registries():
+            register_link_templates(
+                network,
+                {
+                    (LinkKind.ACCOUNT, ExplorerFlavour.DEFAULT): LinkTemplate(
+                        "{base_path}/wallet/{identifier}"
+                    )
+                },
+            )
+            parsed = parse_explorer_url(url, config=config)
+            self.assertEqual(
+                (parsed.network, parsed.kind, parsed.identifier),
+                (network, LinkKind.ACCOUNT, "abc"),
+            )
+        self.assertIsNone(parse_explorer_url(url, config=config))
+
+    def test_unrecognised(self):
+        for url in [
+            "",
+            "etherscan.io/address/0xabc",
+            "https://example.com/address/0xabc",
+            "https://etherscan.io/",
+            "https://etherscan.io/address/",
+            "https://etherscan.io/blocks",
+            "https://etherscan.io/address/0xabc/extra",
+            "https://etherscan.io/address/0xabc#unknown",
+            "https://suiscan.xyz/testnet/account/0xabc",
+        ]:
+            with self.subTest(url=url):
+                self.assertIsNone(parse_explorer_url(url))
+
+    def test_configured_base_paths(self):
+        url = "https://explorer.example.com/tx/0xabc"
+        self.assertIsNone(parse_explorer_url(url))
+        config = ExplorerConfig.from_base_paths(
+            {Network.ETHEREUM: "https://explorer.example.com/"}
+        )
+        parsed = parse_explorer_url(url, config=config)
+        self.assertEqual(
+            (parsed.network, parsed.kind, parsed.identifier, parsed.base_path),
+            (
+                Network.ETHEREUM,
+                LinkKind.TRANSACTION,
+                "0xabc",
+                "https://explorer.example.com",
+            ),
+        )
+        # Default explorers are still recognised
+        self.assertEqual(
+            parse_explorer_url("https://etherscan.io/tx/0xabc", config=config).network,
+            Network.ETHEREUM,
+        )
+
+    def test_parse_explorer_urls(self):
+        parsed = parse_explorer_urls(
+            [
+                "https://tonscan.org/jetton/EQDYUzNXOkaKpLBqLjEo0RGyzMbkbRXaa6e6mRqtgxtqhVs1",
+                "https://example.com",
+                "https://simpleledger.info/#tx/62b2b7bd",
+            ]
+        )
+        self.assertEqual(
+            [result and (result.network, result.kind) for result in parsed],
+            [
+                (Network.TON, LinkKind.NFT_CONTRACT),
+                None,
+                (Network.BITCOIN_CASH, LinkKind.TRANSACTION),
+            ],
+        )
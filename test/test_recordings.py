@@ -0,0 +1,89 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .recordings import (
+    LIVE,
+    RECORD,
+    REPLAY,
+    ExplorerResponses,
+    Recording,
+    get_excerpt,
+    load_recordings,
+)
+
+PAGE = "<html>" + "x" * 200 + "<h1>Transactions</h1>" + "y" * 200 + "Txn Hash</html>"
+
+
+class StubExplorerHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        status, text = (200, PAGE) if self.path == "/address/0xabc" else (404, "")
+        body = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRecordings(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "fixtures", "responses.json")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubExplorerHandler)
+        self.server.paths = []
+        threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        ).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.origin = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def test_get_excerpt(self):
+        excerpt = get_excerpt(PAGE)
+        self.assertLess(len(excerpt), 200)
+        self.assertIn("<h1>Transactions</h1>", excerpt)
+        self.assertIn("Txn Hash</html>", excerpt)
+        self.assertEqual(get_excerpt("Nothing to see"), "Nothing to see")
+        self.assertEqual(get_excerpt(""), "")
+
+    def test_record_and_replay(self):
+        urls = ["https://etherscan.io/address/0xabc", "https://etherscan.io/missing"]
+        recorder = ExplorerResponses(RECORD, self.path, origin=self.origin)
+        recorder.prefetch(urls)
+        recorder.save()
+        self.assertEqual(sorted(self.server.paths), ["/address/0xabc", "/missing"])
+        # Recorded under the explorer's URL, not the origin's
+        self.assertEqual(
+            load_recordings(self.path),
+            {
+                urls[0]: Recording(200, get_excerpt(PAGE)),
+                urls[1]: Recording(404, ""),
+            },
+        )
+        player = ExplorerResponses(REPLAY, self.path, origin=self.origin)
+        player.prefetch(urls)
+        self.assertEqual(player.get(urls[0]).status, 200)
+        self.assertIsNone(player.get("https://etherscan.io/address/0xdef"))
+        self.assertEqual(len(self.server.paths), 2)
+
+    def test_failed_fetches_keep_recordings(self):
+        url = "https://etherscan.io/address/0xabc"
+        recorder = ExplorerResponses(RECORD, self.path, origin=self.origin)
+        recorder.prefetch([url])
+        recorder.save()
+        # Nothing is listening here any more
+        self.server.shutdown()
+        self.server.server_close()
+        recorder = ExplorerResponses(RECORD, self.path, origin=self.origin, timeout=1)
+        self.assertEqual(recorder.get(url).status, 200)
+        live = ExplorerResponses(LIVE, self.path, origin=self.origin, timeout=1)
+        self.assertIsNone(live.get(url))
@@ -0,0 +1,152 @@
+import html
+import io
+import unittest
+
+from blockchain_exploration.caching import UrlCache
+from blockchain_exploration.config import ExplorerConfig
+from blockchain_exploration.currencies import NETWORK_CURRENCIES
+from blockchain_exploration.exploration import (
+    get_explorer_url_for_token,
+    get_explorer_url_for_token_wallet,
+)
+from blockchain_exploration.instrumentation import Instrumentation
+from blockchain_exploration.rendering import (
+    MARKDOWN,
+    render_explorer_link,
+    render_explorer_links,
+)
+from blockchain_exploration.types import (
+    EvmAddressCase,
+    LinkKind,
+    Network,
+    get_label_for_network,
+)
+
+
+class TestRendering(unittest.TestCase):
+    def test_html(self):
+        self.assertEqual(
+            render_explorer_links(
+                Network.TEZOS, LinkKind.TRANSACTION, ["oo1", "oo2"], label="Tezos & co"
+            ),
+            '<a href="https://tzkt.io/oo1">Tezos &amp; co</a>\n'
+            '<a href="https://tzkt.io/oo2">Tezos &amp; co</a>',
+        )
+        # Escaping matches escaping each URL built by the `get_explorer_url_for_*()` functions
+        config = ExplorerConfig.from_base_paths({Network.MATIC: "https://opensea.io"})
+        url = get_explorer_url_for_token_wallet(Network.MATIC, "0xabc", config=config)
+        self.assertEqual(
+            render_explorer_link(
+                Network.MATIC,
+                LinkKind.TOKEN_WALLET,
+                "0xabc",
+                attributes={"target": "_blank"},
+                config=config,
+            ),
+            f'<a href="{html.escape(url)}" target="_blank">0xabc</a>',
+        )
+        self.assertEqual(
+            render_explorer_link(
+                Network.ETHEREUM,
+                LinkKind.TOKEN,
+                "0xabc",
+                "12",
+                label=get_label_for_network(Network.ETHEREUM),
+            ),
+            f'<a href="{html.escape(get_explorer_url_for_token(Network.ETHEREUM, "0xabc", "12"))}">ethereum</a>',
+        )
+
+    def test_markdown(self):
+        self.assertEqual(
+            render_explorer_links(
+                Network.TON,
+                LinkKind.ACCOUNT,
+                ["EQCxE6mUtQJKFnGfaROTKOt1lZbDiiX1kCixRv7Nw2Id_sDs"],
+                format=MARKDOWN,
+            ),
+            "[EQCxE6mUtQJKFnGfaROTKOt1lZbDiiX1kCixRv7Nw2Id\\_sDs]"
+            "(https://tonscan.org/account/EQCxE6mUtQJKFnGfaROTKOt1lZbDiiX1kCixRv7Nw2Id_sDs)",
+        )
+        display_text = NETWORK_CURRENCIES[Network.TON]["scor"]["display_text"]
+        self.assertEqual(
+            render_explorer_links(
+                Network.SUI,
+                LinkKind.TOKEN,
+                [("0xabc", "0x1"), ("0xdef", "0x2")],
+                format=MARKDOWN,
+                label=display_text,
+                separator=", ",
+            ),
+            "[$SCOR](https://suiscan.xyz/mainnet/object/0x1), "
+            "[$SCOR](https://suiscan.xyz/mainnet/object/0x2)",
+        )
+
+    def test_streaming(self):
+        output = io.StringIO()
+        hashes = [f"0x{index:064x}" for index in range(10000)]
+        self.assertIsNone(
+            render_explorer_links(
+                Network.ETHEREUM, LinkKind.TRANSACTION, hashes, output=output
+            )
+        )
+        lines = output.getvalue().split("\n")
+        self.assertEqual(len(lines), 10000)
+        self.assertEqual(
+            lines[-1],
+            f'<a href="https://etherscan.io/tx/{hashes[-1]}">{hashes[-1]}</a>',
+        )
+
+    def test_identifiers(self):
+        # Accounts without an address have no link, and identifiers are validated and canonicalized like URLs are
+        self.assertEqual(
+            render_explorer_links(
+                Network.ETHEREUM, LinkKind.ACCOUNT, ["", " 0xabc "], label="account"
+            ),
+            'account\n<a href="https://etherscan.io/address/0xabc">account</a>',
+        )
+        with self.assertRaises(ValueError):
+            render_explorer_link(Network.ETHEREUM, LinkKind.ACCOUNT, "0xabc/def")
+        config = ExplorerConfig.from_base_paths(
+            {Network.ETHEREUM: "https://etherscan.io"},
+            evm_address_case=EvmAddressCase.CHECKSUM,
+        )
+        self.assertEqual(
+            render_explorer_link(
+                Network.ETHEREUM,
+                LinkKind.NFT_CONTRACT,
+                "0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed",
+                config=config,
+            ),
+            '<a href="https://etherscan.io/token/0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed">'
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed</a>",
+        )
+        with self.assertRaises(NotImplementedError):
+            render_explorer_link(
+                Network.ETHEREUM,
+                LinkKind.TRANSACTION,
+                "0x123",
+                base_path="https://opensea.io",
+            )
+        with self.assertRaises(ValueError):
+            render_explorer_link(Network.TEZOS, LinkKind.ACCOUNT, "tz1", format="rst")
+
+    def test_instrumentation_and_cache(self):
+        # Rendered links are counted and cached like the URLs built for them
+        instrumentation, cache = Instrumentation(), UrlCache()
+        config = ExplorerConfig.from_environ({})._replace(
+            instrumentation=instrumentation, url_cache=cache
+        )
+        links = render_explorer_links(
+            Network.TEZOS, LinkKind.TRANSACTION, ["oo1", "oo1"], config=config
+        )
+        self.assertEqual(
+            links,
+            render_explorer_links(Network.TEZOS, LinkKind.TRANSACTION, ["oo1", "oo1"]),
+        )
+        self.assertEqual(sum(instrumentation.snapshot().counts.values()), 2)
+        self.assertEqual((cache.stats().hits, cache.stats().misses), (1, 1))
+        with self.assertRaises(ValueError):
+            render_explorer_links(
+                Network.TEZOS, LinkKind.TRANSACTION, ["oo/1"], config=config
+            )
+        self.assertEqual(sum(instrumentation.snapshot().counts.values()), 3)
@@ -0,0 +1,218 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+import unittest
+from unittest import mock
+
+from blockchain_exploration.serve import LinkServer
+
+CONTRACT = "0x3011810abfec25777a01d5fbef08b2ad12860460"
+
+
+class TestLinkServer(unittest.TestCase):
+    def start_server(self, **kwargs) -> LinkServer:
+        server = LinkServer(port=0, **kwargs)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(server.start())
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        def stop():
+            asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+        self.addCleanup(stop)
+        return server
+
+    def connect(self, server: LinkServer) -> http.client.HTTPConnection:
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+        self.addCleanup(connection.close)
+        return connection
+
+    def request(self, connection, method, path, body=None):
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+        return response, response.read()
+
+    def test_redirect(self):
+        connection = self.connect(self.start_server())
+        response, _ = self.request(
+            connection, "GET", f"/go/matic/token/{CONTRACT}/3191"
+        )
+        self.assertEqual(response.status, 302)
+        self.assertEqual(
+            response.getheader("Location"),
+            f"https://polygonscan.com/token/{CONTRACT}/?a=3191",
+        )
+        response, _ = self.request(
+            connection, "GET", f"/go/matic/token/{CONTRACT}?token_id=1"
+        )
+        self.assertTrue(response.getheader("Location").endswith("/?a=1"))
+        for path, status in [
+            ("/go/tezos/account/tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg", 302),
+            ("/go/dogecoin/account/D8vFz4p1L37jdg47HXKtSHA5uYLYxbGgPD", 404),
+            ("/go/matic/account/0xabc%3Fa%3D1", 400),
+            ("/go/matic/bogus/0xabc", 400),
+            ("/go/matic", 404),
+            ("/elsewhere", 404),
+        ]:
+            with self.subTest(path=path):
+                response, body = self.request(connection, "GET", path)
+                self.assertEqual(response.status, status)
+                if status != 302:
+                    self.assertIn("error", json.loads(body))
+        response, _ = self.request(connection, "POST", "/go/matic/account/0xabc")
+        self.assertEqual(response.status, 405)
+        # Identifiers outside Latin-1, or outside ASCII, are percent-encoded in the Location header
+        for path, location in [
+            (
+                "/go/ethereum/account/%E2%82%AC",
+                "https://etherscan.io/address/%E2%82%AC",
+            ),
+            (
+                f"/go/matic/token/{CONTRACT}/%C3%A9",
+                f"https://polygonscan.com/token/{CONTRACT}/?a=%C3%A9",
+            ),
+        ]:
+            with self.subTest(path=path):
+                response, _ = self.request(connection, "GET", path)
+                self.assertEqual(response.status, 302)
+                self.assertEqual(response.getheader("Location"), location)
+
+    def test_internal_error(self):
+        server = self.start_server()
+        connection = self.connect(server)
+        with mock.patch(
+            "blockchain_exploration.serve.redirect", side_effect=RuntimeError
+        ), self.assertLogs(level="ERROR"):
+            response, body = self.request(connection, "GET", "/go/matic/account/0xabc")
+        self.assertEqual(response.status, 500)
+        self.assertIn("error", json.loads(body))
+
+    def test_batch(self):
+        connection = self.connect(self.start_server(max_batch=5))
+        calls = [
+            {
+                "network": "matic",
+                "kind": "token",
+                "identifier": CONTRACT,
+                "token_id": 3191,
+            },
+            {"function": "get_token_type_by_network", "network": "matic"},
+            {"function": "get_network_by_token_type", "token_type": "erc721-matic"},
+            {"network": "dogecoin", "kind": "account", "identifier": "D8v"},
+            {"network": "matic"},
+        ]
+        response, body = self.request(connection, "POST", "/links", json.dumps(calls))
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Content-Type"), "application/json")
+        results = json.loads(body)["results"]
+        self.assertEqual(
+            results[:3],
+            [
+                {"result": f"https://polygonscan.com/token/{CONTRACT}/?a=3191"},
+                {"result": "erc721-matic"},
+                {"result": "matic"},
+            ],
+        )
+        self.assertEqual(results[3]["error"], "NotImplementedError")
+        self.assertEqual(results[4]["error"], "KeyError")
+        invalid_calls = [
+            {"network": "ethereum", "kind": "transaction", "identifier": None},
+            {"network": "ethereum", "kind": "account", "identifier": ["../evil?x=1#"]},
+            {"network": "ethereum", "kind": "transaction"},
+            {
+                "network": "matic",
+                "kind": "token",
+                "identifier": CONTRACT,
+                "token_id": [1],
+            },
+            {
+                "network": "matic",
+                "kind": "token",
+                "identifier": CONTRACT,
+                "token_id": True,
+            },
+            {
+                "network": "ethereum",
+                "kind": "account",
+                "identifier": "0xabc",
+                "base_path": "https://evil.example",
+            },
+        ]
+        response, body = self.request(
+            self.connect(self.start_server()),
+            "POST",
+            "/links",
+            json.dumps(invalid_calls),
+        )
+        for call, result in zip(invalid_calls, json.loads(body)["results"]):
+            with self.subTest(call=call):
+                self.assertEqual(result["error"], "ValueError")
+        for body, status in [
+            ("[1, 2]", 200),
+            ("{}", 400),
+            ("[", 400),
+            ("[" * 100_000, 400),
+            (json.dumps(calls * 2), 413),
+        ]:
+            with self.subTest(body=body):
+                response, _ = self.request(connection, "POST", "/links", body)
+                self.assertEqual(response.status, status)
+        response, _ = self.request(connection, "GET", "/links")
+        self.assertEqual(response.status, 405)
+
+    def test_keep_alive(self):
+        server = self.start_server()
+        connection = self.connect(server)
+        ports = set()
+        for _ in range(3):
+            response, _ = self.request(connection, "GET", "/go/matic/account/0xabc")
+            self.assertEqual(response.getheader("Connection"), "keep-alive")
+            ports.add(connection.sock.getsockname()[1])
+        # Every request went over the same connection
+        self.assertEqual(len(ports), 1)
+        connection.request(
+            "GET", "/go/matic/account/0xabc", headers={"Connection": "close"}
+        )
+        response = connection.getresponse()
+        response.read()
+        self.assertEqual(response.getheader("Connection"), "close")
+
+    def test_slow_clients(self):
+        server = self.start_server(concurrency=1, request_timeout=0.2)
+        # A client trickling in its body doesn't hold the only slot
+        slow = socket.create_connection(("127.0.0.1", server.port))
+        self.addCleanup(slow.close)
+        body = b'[{"function": "get_token_type_by_network", "network": "matic"}]'
+        slow.sendall(
+            b"POST /links HTTP/1.1\r\nHost: localhost\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode()
+            + body[:10]
+        )
+        response, _ = self.request(
+            self.connect(server), "GET", "/go/matic/account/0xabc"
+        )
+        self.assertEqual(response.status, 302)
+        # And is disconnected once its time is up
+        slow.settimeout(5)
+        self.assertEqual(slow.recv(4096), b"")
+
+    def test_malformed_requests(self):
+        server = self.start_server()
+        for request, status in [
+            (b"NONSENSE\r\n\r\n", b"400"),
+            (b"GET / HTTP/2.0\r\n\r\n", b"505"),
+            (b"POST /links HTTP/1.1\r\nContent-Length: abc\r\n\r\n", b"400"),
+            (b"POST /links HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", b"501"),
+        ]:
+            with self.subTest(request=request):
+                with socket.create_connection(("127.0.0.1", server.port)) as client:
+                    client.sendall(request)
+                    response = client.recv(4096)
+                    self.assertTrue(response.startswith(b"HTTP/1.1 " + status))
+                    self.assertIn(b"Connection: close", response)
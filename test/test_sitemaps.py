@@ -0,0 +1,113 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from blockchain_exploration.sitemaps import INDEX_FILENAME, write_sitemaps
+from blockchain_exploration.types import Network
+
+CONTRACT = "0x3011810abfec25777a01d5fbef08b2ad12860460"
+RECORDS = [
+    *((Network.MATIC, CONTRACT, str(token_id)) for token_id in range(5)),
+    (Network.TEZOS, "KT1PEGqt5rMmHpyaMXc8RFTFkkAUDrzSFRWk", "7"),
+    (Network.TEZOS, "KT1PEGqt5rMmHpyaMXc8RFTFkkAUDrzSFRWk", "8"),
+    ("dogecoin", "D8vFz4p1L37jdg47HXKtSHA5uYLYxbGgPD", "1"),
+    (Network.ETHEREUM, "0x<'&\">", "1"),
+    # Just the contract
+    (Network.ETHEREUM, "0xdef", None),
+]
+
+
+class TestSitemaps(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def read(self, filename, directory=None):
+        with gzip.open(os.path.join(directory or self.directory, filename), "rt") as f:
+            return f.read()
+
+    def test_sitemaps(self):
+        errors = io.StringIO()
+        summary = write_sitemaps(
+            RECORDS,
+            self.directory,
+            "https://example.com/sitemaps/",
+            max_urls=3,
+            errors=errors,
+        )
+        # A contract URL and 5 token URLs for Polygon, just the contract for Tezos, which has no token pages, and 3 for
+        # Ethereum
+        self.assertEqual(summary.url_count, 10)
+        self.assertEqual(summary.failures, 1)
+        self.assertEqual(
+            summary.sitemaps,
+            tuple(f"sitemap-{number:05d}.xml.gz" for number in range(1, 5)),
+        )
+        first = self.read(summary.sitemaps[0])
+        self.assertTrue(first.startswith('<?xml version="1.0" encoding="UTF-8"?>'))
+        self.assertTrue(first.endswith("</urlset>\n"))
+        self.assertEqual(first.count("<url>"), 3)
+        self.assertIn(
+            f"<url><loc>https://polygonscan.com/token/{CONTRACT}</loc></url>", first
+        )
+        self.assertIn(
+            "<loc>https://etherscan.io/token/0x&lt;&apos;&amp;&quot;&gt;/?a=1</loc>",
+            self.read(summary.sitemaps[-2]),
+        )
+        self.assertEqual(
+            self.read(summary.sitemaps[-1]).count("<url>"),
+            1,
+        )
+        self.assertIn(
+            "https://etherscan.io/token/0xdef<", self.read(summary.sitemaps[-1])
+        )
+        everything = "".join(self.read(sitemap) for sitemap in summary.sitemaps)
+        self.assertEqual(everything.count("https://tzkt.io/"), 1)
+        self.assertNotIn("None", everything)
+        error = json.loads(errors.getvalue())
+        self.assertEqual(error["record"], 8)
+        self.assertTrue(error["error"].startswith("NotImplementedError: "))
+        with open(os.path.join(self.directory, INDEX_FILENAME)) as f:
+            index = f.read()
+        self.assertEqual(index.count("<sitemap>"), 4)
+        self.assertIn(
+            "<sitemap><loc>https://example.com/sitemaps/sitemap-00004.xml.gz</loc></sitemap>",
+            index,
+        )
+
+    def test_deterministic(self):
+        records = [
+            (Network.MATIC, f"0x{contract:040x}", str(token_id))
+            for contract in range(20)
+            for token_id in range(10)
+        ]
+        outputs = []
+        for workers in (1, 2):
+            directory = os.path.join(self.directory, str(workers))
+            summary = write_sitemaps(
+                iter(records),
+                directory,
+                "https://example.com",
+                workers=workers,
+                chunk_size=7,
+                max_urls=50,
+            )
+            self.assertEqual(summary.url_count, 220)
+            outputs.append(
+                [
+                    open(os.path.join(directory, filename), "rb").read()
+                    for filename in (*summary.sitemaps, INDEX_FILENAME)
+                ]
+            )
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_no_contracts(self):
+        summary = write_sitemaps(
+            RECORDS[:5], self.directory, "https://example.com", include_contracts=False
+        )
+        self.assertEqual(summary.url_count, 5)
+        self.assertNotIn(f"{CONTRACT}</loc>", self.read(summary.sitemaps[0]))
@@ -0,0 +1,163 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from blockchain_exploration.currencies import NETWORK_CURRENCIES
+from blockchain_exploration.tokens import (
+    TOKENS,
+    Token,
+    TokenRegistry,
+    get_explorer_url_for_currency,
+    get_token,
+    iter_network_currencies,
+)
+from blockchain_exploration.types import Network
+
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+USDC_POLYGON = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
+TOKEN_LIST = {
+    "name": "Test",
+    "tokens": [
+        {"chainId": 1, "address": USDC, "symbol": "USDC", "decimals": 6},
+        {"chainId": 137, "address": USDC_POLYGON, "symbol": "USDC", "decimals": 6},
+        # An impostor, with a symbol that's already taken
+        {"chainId": 1, "address": "0x" + "1" * 40, "symbol": "USDC", "decimals": 18},
+        {
+            "chainId": 999_999_999,
+            "address": "0x" + "2" * 40,
+            "symbol": "X",
+            "decimals": 0,
+        },
+        {
+            "network": Network.TEZOS,
+            "address": "KT1XnTn74bUtxHfDtBmm2bGZAQfhPbvKWR8o",
+            "symbol": "USDt",
+            "code": "usdt",
+            "decimals": 6,
+        },
+    ],
+}
+
+
+class TestTokens(unittest.TestCase):
+    def test_network_currencies(self):
+        self.assertEqual(
+            len(TOKENS),
+            sum(len(currencies) for currencies in NETWORK_CURRENCIES.values()),
+        )
+        token = get_token(Network.TON, "scor")
+        self.assertEqual(token.symbol, "SCOR")
+        self.assertEqual(token.decimals, 9)
+        self.assertFalse(token.native_token)
+        self.assertTrue(get_token(Network.ETHEREUM, "eth").native_token)
+
+    def test_token_list(self):
+        registry = TokenRegistry(iter_network_currencies(), token_lists=[TOKEN_LIST])
+        # Read on the first lookup
+        self.assertEqual(len(registry._pending), 1)
+        usdc = registry.get_by_code(Network.ETHEREUM, "usdc")
+        self.assertEqual(registry._pending, [])
+        self.assertEqual(usdc.contract, USDC)
+        self.assertEqual(usdc.decimals, 6)
+        self.assertIs(registry.get_by_contract(Network.ETHEREUM, USDC.lower()), usdc)
+        self.assertEqual(
+            registry.get_by_code(Network.MATIC, "usdc").contract, USDC_POLYGON
+        )
+        self.assertEqual(
+            registry.get_by_code(Network.TEZOS, "usdt").contract,
+            "KT1XnTn74bUtxHfDtBmm2bGZAQfhPbvKWR8o",
+        )
+        # Tezos addresses are case sensitive
+        self.assertIsNone(
+            registry.get_by_contract(
+                Network.TEZOS, "kt1xntn74butxhfdtbmm2bgzaqfhpbvkwr8o"
+            )
+        )
+        # Chains that aren't registered are skipped
+        self.assertEqual(registry.get_by_symbol("x"), ())
+        # The impostor doesn't take the code, but can still be found by its contract
+        impostor = registry.get_by_contract(Network.ETHEREUM, "0x" + "1" * 40)
+        self.assertEqual(impostor.decimals, 18)
+        self.assertEqual(
+            registry.get_by_symbol("usdc"),
+            (usdc, registry.get_by_code(Network.MATIC, "usdc"), impostor),
+        )
+        self.assertIs(
+            registry.get_by_symbol("ETH")[0],
+            registry.get_by_code(Network.ETHEREUM, "eth"),
+        )
+
+    def test_token_list_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tokens.json")
+            with open(path, "w", encoding="utf-8") as output:
+                json.dump(TOKEN_LIST, output)
+            registry = TokenRegistry()
+            registry.add_token_list(path)
+            # The impostor has no code of its own
+            self.assertEqual(len(registry), 3)
+        # Registering a token again changes nothing
+        registry.register(registry.get_by_code(Network.ETHEREUM, "usdc"))
+        self.assertEqual(len(registry.get_by_symbol("USDC")), 3)
+
+    def test_invalid_token_lists(self):
+        registry = TokenRegistry(
+            iter_network_currencies(),
+            token_lists=[
+                "/nonexistent/tokens.json",
+                [],
+                {
+                    "tokens": [
+                        {"chainId": 1, "address": "0xabc", "decimals": 6},
+                        {
+                            "chainId": 1,
+                            "address": "0xdef",
+                            "symbol": "A",
+                            "decimals": "x",
+                        },
+                        "0x123",
+                        {
+                            "chainId": 1,
+                            "address": USDC,
+                            "symbol": "USDC",
+                            "decimals": 6,
+                        },
+                    ]
+                },
+            ],
+        )
+        with self.assertLogs(level="WARNING") as logs:
+            eth = registry.get_by_code(Network.ETHEREUM, "eth")
+        self.assertTrue(eth.native_token)
+        self.assertEqual(len(logs.records), 5)
+        self.assertEqual(registry._pending, [])
+        # The list's valid tokens are still registered
+        self.assertEqual(registry.get_by_code(Network.ETHEREUM, "usdc").contract, USDC)
+        self.assertIsNone(registry.get_by_contract(Network.ETHEREUM, "0xdef"))
+
+    def test_token(self):
+        token = Token(Network.ETHEREUM, "usdc", "USDC", 6, USDC)
+        self.assertEqual(token.display_text, "USDC")
+        self.assertEqual(token, Token(Network.ETHEREUM, "usdc", "USDC", 6, USDC))
+        self.assertEqual(
+            len({token, Token(Network.ETHEREUM, "usdc", "USDC", 6, USDC)}), 1
+        )
+        self.assertFalse(hasattr(token, "__dict__"))
+
+    def test_get_explorer_url_for_currency(self):
+        registry = TokenRegistry(iter_network_currencies(), token_lists=[TOKEN_LIST])
+        with mock.patch("blockchain_exploration.tokens.TOKENS", registry):
+            self.assertEqual(
+                get_explorer_url_for_currency(Network.ETHEREUM, "usdc"),
+                f"https://etherscan.io/token/{USDC}",
+            )
+            self.assertEqual(
+                get_explorer_url_for_currency(Network.MATIC, "usdc"),
+                f"https://polygonscan.com/token/{USDC_POLYGON}",
+            )
+            with self.assertRaises(NotImplementedError):
+                get_explorer_url_for_currency(Network.ETHEREUM, "eth")
+            with self.assertRaises(NotImplementedError):
+                get_explorer_url_for_currency(Network.ETHEREUM, "unknown")
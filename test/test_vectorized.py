@@ -0,0 +1,120 @@
+import unittest
+
+from blockchain_exploration.config import ExplorerConfig
+from blockchain_exploration.exploration import (
+    get_explorer_url_for_account,
+    get_explorer_url_for_token,
+)
+from blockchain_exploration.types import EvmAddressCase, LinkKind, Network
+from blockchain_exploration.vectorized import (
+    MISSING_IDENTIFIER,
+    MISSING_NETWORK,
+    build_account_urls,
+    build_explorer_urls,
+    build_token_urls,
+    np,
+    pa,
+)
+
+ACCOUNTS = {
+    Network.ETHEREUM: "0xf8e6480aaed82328e837172d4fb450826ec547cf",
+    Network.BITCOIN_CASH: "simpleledger:qrgydxn0xnta6k4lkc4xmrltz4ghvlz7tq33dez6nv",
+    Network.TEZOS: "tz1WisZWgB8u7MUf9eM8Zxs6HWPChs4qoXEg",
+    Network.TON: " EQBvW8Z5huBkMJYdnfAEM5JqTNkuWX3diqYENkWsIL0XggGG ",
+}
+
+
+@unittest.skipUnless(np is not None, "NumPy isn't installed")
+class TestVectorized(unittest.TestCase):
+    def test_matches_row_by_row(self):
+        config = ExplorerConfig.from_environ({})
+        networks = [*ACCOUNTS] * 3
+        addresses = [*ACCOUNTS.values()] * 3
+        result = build_account_urls(np.array(networks), addresses, config=config)
+        self.assertEqual(
+            result.urls.tolist(),
+            [
+                get_explorer_url_for_account(network, address, config=config)
+                for network, address in zip(networks, addresses)
+            ],
+        )
+        self.assertFalse(result.mask.any())
+        result = build_token_urls(
+            Network.MATIC, np.array(["0xabc", "0xdef"]), np.array([1, 2]), config=config
+        )
+        self.assertEqual(
+            result.urls.tolist(),
+            [
+                get_explorer_url_for_token(Network.MATIC, "0xabc", "1", config=config),
+                get_explorer_url_for_token(Network.MATIC, "0xdef", "2", config=config),
+            ],
+        )
+
+    def test_mask(self):
+        result = build_explorer_urls(
+            LinkKind.TRANSACTION,
+            np.array(
+                [Network.TEZOS, "dogecoin", None, Network.ETHEREUM, Network.ETHEREUM],
+                dtype=object,
+            ),
+            np.array(["oo1", "0x1", "0x2", "0x3/4", None], dtype=object),
+            base_paths=["", "", "", "", "https://opensea.io"],
+        )
+        self.assertEqual(
+            result.urls.tolist(), ["https://tzkt.io/oo1", None, None, None, None]
+        )
+        self.assertEqual(result.mask.tolist(), [False, True, True, True, True])
+        self.assertIsNone(result.errors[0])
+        self.assertEqual(result.errors[2], MISSING_NETWORK)
+        self.assertIn("invalid identifier", result.errors[3])
+        # OpenSea has no transaction pages
+        self.assertIsNotNone(result.errors[4])
+        # Accounts without an address have no URL, but no error either
+        result = build_account_urls(
+            Network.ETHEREUM, np.array(["", float("nan")], dtype=object)
+        )
+        self.assertEqual(result.mask.tolist(), [True, True])
+        self.assertEqual(result.errors.tolist(), [None, None])
+        result = build_token_urls(Network.ETHEREUM, ["0xabc"], [None])
+        self.assertEqual(result.errors.tolist(), [MISSING_IDENTIFIER])
+        # NumPy strings are checked like any other
+        result = build_account_urls(
+            Network.ETHEREUM, [np.str_("0xabc"), np.str_("0xabc/../../evil?x=1#")]
+        )
+        self.assertEqual(result.mask.tolist(), [False, True])
+        self.assertIn("invalid identifier", result.errors[1])
+
+    def test_checksum(self):
+        config = ExplorerConfig.from_environ({})._replace(
+            evm_address_case=EvmAddressCase.CHECKSUM
+        )
+        result = build_account_urls(
+            [Network.ETHEREUM, "base"],
+            ["0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed"] * 2,
+            config=config,
+        )
+        self.assertEqual(
+            result.urls.tolist(),
+            [
+                "https://etherscan.io/address/0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+                "https://basescan.org/address/0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+            ],
+        )
+
+    @unittest.skipUnless(pa is not None, "PyArrow isn't installed")
+    def test_arrow(self):
+        result = build_token_urls(
+            pa.array([Network.ETHEREUM, Network.TEZOS, None]),
+            pa.chunked_array([["0xabc"], ["KT1", "KT2"]]),
+            pa.array(["1", None, "3"]),
+        )
+        # Tezos token pages don't need the token ID
+        self.assertEqual(result.mask.tolist(), [False, False, True])
+        self.assertEqual(
+            result.to_arrow().to_pylist(),
+            [
+                "https://etherscan.io/token/0xabc/?a=1",
+                "https://tzkt.io/KT1/operations/",
+                None,
+            ],
+        )